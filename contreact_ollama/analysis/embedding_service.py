@@ -1,17 +1,53 @@
 """Embedding service for generating semantic embeddings from text."""
 
 # Standard library imports
-from typing import Optional
+import importlib.util
+from collections import OrderedDict
+from typing import List, Literal, Optional
 
 # Third-party imports
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 
+def _default_backend(device: str) -> Literal['onnx', 'torch']:
+    """
+    Prefer the ONNX Runtime backend when it can run on the given device.
+    
+    The CPU-only onnxruntime package would silently move a CUDA model onto
+    the CPU, so ONNX is chosen for a GPU only when onnxruntime-gpu provides
+    the CUDA execution provider.
+    """
+    if not (importlib.util.find_spec("onnxruntime") and importlib.util.find_spec("optimum")):
+        return "torch"
+    
+    if device == "cpu":
+        return "onnx"
+    
+    if device.startswith("cuda"):
+        import onnxruntime
+        if "CUDAExecutionProvider" in onnxruntime.get_available_providers():
+            return "onnx"
+    
+    return "torch"
+
+
+def _default_device() -> str:
+    """Run the model on the GPU when CUDA is available, otherwise on the CPU."""
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
 class EmbeddingService:
     """Generate semantic embeddings for text using sentence-transformers."""
     
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        backend: Optional[Literal['onnx', 'torch']] = None,
+        device: Optional[str] = None,
+        cache_size: int = 1024
+    ):
         """
         Initialize with specified sentence transformer model.
         
@@ -19,29 +55,100 @@ class EmbeddingService:
             model_name: Name of sentence-transformers model to use.
                        Default is 'all-MiniLM-L6-v2' which produces 384-dimensional embeddings.
                        This model is fast and suitable for semantic similarity tasks.
+            backend: Inference backend ('onnx' or 'torch'). If None, uses ONNX Runtime
+                    when installed (pip install -e ".[onnx]") and the device is the CPU,
+                    or a GPU with onnxruntime-gpu installed; PyTorch otherwise.
+            device: Device to run the model on (e.g. 'cuda', 'cpu'). If None, uses
+                   CUDA when available and the CPU otherwise.
+            cache_size: Maximum number of embeddings kept in the text-keyed cache.
+                       0 disables caching.
         
         Note:
-            On first use, the model will be downloaded from HuggingFace.
-            Subsequent uses will load from cache.
+            The model is loaded on first use, so constructing the service is cheap.
+            On first load, the model will be downloaded from HuggingFace.
+            Subsequent loads will use the local cache.
         """
         self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        self.device = device or _default_device()
+        self.backend = backend or _default_backend(self.device)
+        self._model: Optional[SentenceTransformer] = None
         
+        # LRU cache of embeddings keyed by the input text itself; a digest key
+        # could collide and silently return another text's embedding
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+    
+    @property
+    def model(self) -> SentenceTransformer:
+        """Sentence transformer model, loaded on first access."""
+        if self._model is None:
+            self._model = SentenceTransformer(
+                self.model_name, backend=self.backend, device=self.device
+            )
+        return self._model
+    
     def get_embedding(self, text: str) -> np.ndarray:
         """
         Convert text to embedding vector.
         
+        Identical texts are served from an in-memory cache instead of re-running
+        the model. Returned arrays are read-only because they may be shared.
+        
         Args:
             text: Input text to embed (e.g., agent's reflection)
-            
+        
         Returns:
-            Numpy array of embedding values (384 dimensions for all-MiniLM-L6-v2)
-            
+            Unit-norm float32 numpy array of embedding values (384 dimensions for all-MiniLM-L6-v2)
+        
         Example:
             >>> service = EmbeddingService()
             >>> embedding = service.get_embedding("I explored topic X")
             >>> embedding.shape
             (384,)
         """
-        embedding = self.model.encode(text, convert_to_numpy=True)
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+        
+        embedding = self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+        # Pin storage precision so downstream similarity math never upcasts to float64
+        embedding = embedding.astype(np.float32, copy=False)
+        embedding.setflags(write=False)
+        
+        if self.cache_size > 0:
+            self._cache[text] = embedding
+            if len(self._cache) > self.cache_size:
+                # Evict least recently used entry
+                self._cache.popitem(last=False)
+        
         return embedding
+    
+    def get_embeddings(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Convert several texts to embedding vectors in batched forward passes.
+        
+        Prefer this over repeated get_embedding() calls when embedding more
+        than one text (e.g., re-embedding a stored reflection history).
+        
+        Args:
+            texts: Input texts to embed
+            batch_size: Number of texts encoded per forward pass
+            
+        Returns:
+            Unit-norm float32 numpy array of shape (len(texts), 384) for all-MiniLM-L6-v2
+            
+        Example:
+            >>> service = EmbeddingService()
+            >>> embeddings = service.get_embeddings(["Topic A", "Topic B"])
+            >>> embeddings.shape
+            (2, 384)
+        """
+        if not texts:
+            dimension = self.model.get_sentence_embedding_dimension() or 0
+            return np.empty((0, dimension), dtype=np.float32)
+        
+        embeddings = self.model.encode(
+            texts, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return embeddings.astype(np.float32, copy=False)
@@ -1,83 +1,294 @@
 """Similarity monitoring for tracking reflection diversity."""
 
 # Standard library imports
-from typing import List, Optional
+from typing import Any, List, Optional
 
 # Third-party imports
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+try:
+    from numba import njit
+except ImportError:  # Optional dependency: pip install -e ".[jit]"
+    njit = None
+
+try:
+    import hnswlib
+except ImportError:  # Optional dependency: pip install -e ".[ann]"
+    hnswlib = None
 
 # Local application imports
 from contreact_ollama.analysis.embedding_service import EmbeddingService
 
 
+# Row capacity of the historical embedding buffer on first allocation.
+# The buffer doubles whenever it fills up.
+_INITIAL_CAPACITY = 64
+
+# Rows scored per block when scanning history; 256 x 384 float32 (~384 KB)
+# stays cache-resident on typical CPUs.
+_SCAN_BLOCK_ROWS = 256
+
+# History size from which an HNSW nearest-neighbour index (hnswlib) replaces
+# the exact scan. Below this, the BLAS scan takes well under a millisecond.
+_ANN_MIN_HISTORY = 4096
+
+# HNSW build and query parameters; ef=64 keeps top-1 recall near 1.0 for
+# 384-dim sentence embeddings
+_ANN_M = 16
+_ANN_EF_CONSTRUCTION = 200
+_ANN_EF = 64
+
+# Advisory thresholds on maximum cosine similarity, as float32 so comparisons
+# against float32 similarity scores stay in float32
+_HIGH_SIMILARITY = np.float32(0.8)
+_MODERATE_SIMILARITY = np.float32(0.7)
+
+_ADVISORY_HIGH = (
+    "Advisory: Your current line of reflection shows high similarity "
+    "to a previous cycle. Consider exploring a distinctly different topic, "
+    "problem space, or mode of inquiry to diversify your exploration."
+)
+_ADVISORY_MODERATE = (
+    "Advisory: Your current line of reflection shows moderate similarity "
+    "to a previous cycle. You might consider branching into a related but "
+    "distinct area to expand the breadth of your exploration."
+)
+
+# (threshold, advisory) pairs checked from highest to lowest threshold
+_ADVISORY_THRESHOLDS = [
+    (_HIGH_SIMILARITY, _ADVISORY_HIGH),
+    (_MODERATE_SIMILARITY, _ADVISORY_MODERATE),
+]
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """Rows of matrix scaled to unit length (all-zero rows are left as they are)."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    unit: np.ndarray = matrix / norms
+    return unit
+
+
+def _max_similarity_numpy(historical_matrix: np.ndarray, new_unit: np.ndarray) -> float:
+    """
+    Maximum dot product between new_unit and the rows of historical_matrix.
+    
+    Rows are scored block by block and the scan stops as soon as a block
+    crosses the high-similarity threshold, since the advisory outcome can no
+    longer change. The returned value is then a lower bound above that threshold.
+    """
+    best = -np.inf
+    for start in range(0, historical_matrix.shape[0], _SCAN_BLOCK_ROWS):
+        block_max = float((historical_matrix[start:start + _SCAN_BLOCK_ROWS] @ new_unit).max())
+        if block_max > best:
+            best = block_max
+            if best > _HIGH_SIMILARITY:
+                break
+    return best
+
+
+if njit is not None:
+    # Fast-math without 'ninf'/'nnan': the scan starts from -inf and compares against it
+    @njit(cache=True, fastmath={'contract', 'reassoc', 'arcp'})
+    def _max_similarity_jit(
+        historical_matrix: np.ndarray, new_unit: np.ndarray, high_threshold: float
+    ) -> float:
+        """Row-by-row variant of _max_similarity_numpy compiled with Numba."""
+        best = -np.inf
+        for i in range(historical_matrix.shape[0]):
+            dot = np.float32(0.0)
+            for j in range(historical_matrix.shape[1]):
+                dot += historical_matrix[i, j] * new_unit[j]
+            if dot > best:
+                best = float(dot)
+                if best > high_threshold:
+                    break
+        return best
+else:
+    _max_similarity_jit = None
+
+
+def _max_similarity(historical_matrix: np.ndarray, new_unit: np.ndarray) -> float:
+    """Maximum cosine similarity, using the Numba kernel when numba is installed."""
+    if _max_similarity_jit is not None:
+        return float(_max_similarity_jit(historical_matrix, new_unit, _HIGH_SIMILARITY))
+    return _max_similarity_numpy(historical_matrix, new_unit)
+
+
+def _advisory_for(max_similarity: float) -> Optional[str]:
+    """Advisory for the highest threshold exceeded by max_similarity, if any."""
+    for threshold, advisory in _ADVISORY_THRESHOLDS:
+        if max_similarity > threshold:
+            return advisory
+    
+    # Similarity is acceptable, no feedback needed
+    return None
+
+
 class SimilarityMonitor:
-    """Track reflection similarity and generate advisory feedback."""
+    """
+    Track reflection similarity and generate advisory feedback.
     
-    def __init__(self, embedding_service: EmbeddingService):
+    Embeddings are scaled to unit length on entry (EmbeddingService already
+    returns unit-norm vectors), so cosine similarity reduces to a plain dot product.
+    
+    With hnswlib installed, histories of _ANN_MIN_HISTORY or more embeddings are
+    also kept in an approximate nearest-neighbour index, so checking a new
+    reflection costs O(log N) instead of a full scan.
+    """
+    
+    def __init__(self, embedding_service: EmbeddingService, min_history: int = 1):
         """
         Initialize with embedding service instance.
         
         Args:
             embedding_service: Service for generating text embeddings
+            min_history: Minimum number of historical embeddings required before
+                        similarity is checked. Smaller histories skip the check
+                        and return no advisory. Default 1 checks from the second cycle.
         """
         self.embedding_service = embedding_service
+        self.min_history = min_history
+        
+        # Historical embeddings as one contiguous (capacity, dim) matrix;
+        # only the first _n rows are populated
+        self._hist: Optional[np.ndarray] = None
+        self._n = 0
+        
+        # Nearest-neighbour index over the history, built once it is large enough
+        self._index = None
+    
+    @property
+    def history(self) -> np.ndarray:
+        """Historical embeddings as an (N, dim) view, without copying."""
+        if self._hist is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._hist[:self._n]
+    
+    def add(self, embedding: np.ndarray) -> None:
+        """
+        Append an embedding to the monitored history.
         
+        Args:
+            embedding: Embedding vector of a reflection (384-dim)
+        """
+        unit = _unit_rows(np.asarray(embedding, dtype=np.float32))
+        
+        if self._hist is None:
+            self._hist = np.empty((_INITIAL_CAPACITY, unit.shape[0]), dtype=np.float32)
+        elif self._n == self._hist.shape[0]:
+            # Buffer full - double capacity and copy existing rows once
+            grown = np.empty((self._hist.shape[0] * 2, self._hist.shape[1]), dtype=np.float32)
+            grown[:self._n] = self._hist
+            self._hist = grown
+        
+        self._hist[self._n] = unit
+        self._n += 1
+        
+        if self._index is not None:
+            if self._index.get_max_elements() < self._hist.shape[0]:
+                self._index.resize_index(self._hist.shape[0])
+            self._index.add_items(unit[np.newaxis, :], [self._n - 1])
+        elif hnswlib is not None and self._n >= _ANN_MIN_HISTORY:
+            self._index = self._build_index(self._hist)
+    
+    def _build_index(self, hist: np.ndarray) -> Any:
+        """Build an inner-product HNSW index over the history buffer hist."""
+        index = hnswlib.Index(space='ip', dim=hist.shape[1])
+        index.init_index(
+            max_elements=hist.shape[0], ef_construction=_ANN_EF_CONSTRUCTION, M=_ANN_M
+        )
+        index.add_items(self.history, np.arange(self._n))
+        index.set_ef(_ANN_EF)
+        return index
+    
     def check_similarity(
-        self, 
-        new_reflection_embedding: np.ndarray, 
-        historical_embeddings: List[np.ndarray]
+        self,
+        new_reflection_embedding: np.ndarray,
+        historical_embeddings: Optional[List[np.ndarray]] = None
     ) -> Optional[str]:
         """
         Check similarity of new reflection against historical reflections.
         
         Args:
             new_reflection_embedding: Embedding vector of latest reflection (384-dim)
-            historical_embeddings: List of embedding vectors from previous reflections
-            
+            historical_embeddings: Optional list of embedding vectors from previous
+                reflections. If None, the history accumulated via add() is used.
+                Both are scaled to unit length, so scores are cosine similarities.
+        
         Returns:
             Advisory feedback string if similarity exceeds threshold, None otherwise
-            
+        
         Similarity Thresholds:
             - > 0.8 (high): Returns strong advisory to explore new topics
             - > 0.7 (moderate): Returns mild advisory to consider diversification
             - <= 0.7: No feedback, returns None
-            
+        
         Example:
             >>> monitor = SimilarityMonitor(embedding_service)
-            >>> feedback = monitor.check_similarity(new_emb, historical_embs)
+            >>> monitor.add(previous_emb)
+            >>> feedback = monitor.check_similarity(new_emb)
             >>> if feedback:
             ...     print(feedback)
             'Advisory: Your current line of reflection shows high similarity...'
         """
-        if not historical_embeddings:
+        if historical_embeddings is None:
+            historical_matrix = self.history
+        elif len(historical_embeddings) == 0:
+            historical_matrix = self.history[:0]
+        else:
+            # Explicit history - convert to a unit-row matrix once for this call
+            historical_matrix = _unit_rows(np.asarray(historical_embeddings, dtype=np.float32))
+        
+        if historical_matrix.shape[0] == 0:
             # No history to compare against
             return None
         
-        # Calculate cosine similarity against all historical embeddings
-        # Reshape for sklearn compatibility
-        new_emb_2d = new_reflection_embedding.reshape(1, -1)
-        historical_embs_2d = np.array(historical_embeddings)
+        if historical_matrix.shape[0] < self.min_history:
+            # Too little history (warm-up) - skip the scan entirely
+            return None
         
-        # Compute similarities
-        similarities = cosine_similarity(new_emb_2d, historical_embs_2d)[0]
+        # Scaling yields a fresh contiguous float32 vector, so with the float32
+        # history the matrix-vector product goes straight to BLAS sgemv
+        new_unit = _unit_rows(np.asarray(new_reflection_embedding, dtype=np.float32))
         
-        # Find maximum similarity
-        max_similarity = np.max(similarities)
+        if historical_embeddings is None and self._index is not None:
+            # Nearest neighbour from the index; 'ip' distance is 1 - dot product
+            _, distances = self._index.knn_query(new_unit[np.newaxis, :], k=1)
+            max_similarity = np.float32(1.0) - distances[0, 0]
+        else:
+            # Maximum cosine similarity of unit vectors, with early exit on a high match
+            max_similarity = _max_similarity(historical_matrix, new_unit)
         
         # Apply thresholds and return appropriate feedback
-        if max_similarity > 0.8:
-            return (
-                "Advisory: Your current line of reflection shows high similarity "
-                "to a previous cycle. Consider exploring a distinctly different topic, "
-                "problem space, or mode of inquiry to diversify your exploration."
-            )
-        elif max_similarity > 0.7:
-            return (
-                "Advisory: Your current line of reflection shows moderate similarity "
-                "to a previous cycle. You might consider branching into a related but "
-                "distinct area to expand the breadth of your exploration."
-            )
-        else:
-            # Similarity is acceptable, no feedback needed
-            return None
+        return _advisory_for(max_similarity)
+    
+    def check_similarities_batch(self, new_embeddings: np.ndarray) -> List[Optional[str]]:
+        """
+        Check several new reflections against the accumulated history at once.
+        
+        All candidates are scored with one matrix-matrix product instead of one
+        check_similarity() call each.
+        
+        Args:
+            new_embeddings: Embedding vectors of shape (K, 384)
+        
+        Returns:
+            List of K advisory strings (or None), in the same order as new_embeddings,
+            using the same thresholds as check_similarity()
+        
+        Example:
+            >>> monitor.add(previous_emb)
+            >>> monitor.check_similarities_batch(np.stack([emb_a, emb_b]))
+            [None, 'Advisory: Your current line of reflection shows high similarity...']
+        """
+        new_matrix = _unit_rows(np.asarray(new_embeddings, dtype=np.float32))
+        historical_matrix = self.history
+        
+        if historical_matrix.shape[0] == 0 or historical_matrix.shape[0] < self.min_history:
+            return [None] * new_matrix.shape[0]
+        
+        # (K, N) similarities; max over history per candidate
+        max_similarities = (new_matrix @ historical_matrix.T).max(axis=1)
+        
+        return [_advisory_for(max_similarity) for max_similarity in max_similarities]
@@ -7,7 +7,7 @@ communication during experiments.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 from contreact_ollama.communication.telegram_service import TelegramOperatorChannel
 
@@ -51,25 +51,33 @@ class TelegramChannel:
         """
         logger.info("Initializing TelegramChannel")
         
+        service: Optional[TelegramOperatorChannel] = None
         try:
-            self._telegram_service = TelegramOperatorChannel(
+            service = TelegramOperatorChannel(
                 authorized_users=authorized_users,
                 timeout_minutes=timeout_minutes
             )
+            
+            # Perform connection health check
+            connected = service.check_connection()
         except ValueError as e:
             # TELEGRAM_BOT_TOKEN not set
             logger.error(f"Failed to initialize Telegram service: {e}")
+            self._close_service(service)
             raise ConnectionError(f"Telegram initialization failed: {e}") from e
         except Exception as e:
             # Other initialization errors
             logger.error(f"Failed to initialize Telegram service: {e}")
+            self._close_service(service)
             raise ConnectionError(f"Telegram initialization failed: {e}") from e
         
-        # Perform connection health check
-        if not self._telegram_service.check_connection():
+        if not connected:
             logger.error("Telegram bot connection check failed")
+            self._close_service(service)
             raise ConnectionError("Telegram bot connection check failed")
         
+        self._telegram_service = service
+        
         logger.info("TelegramChannel initialized successfully")
     
     def send_and_wait(self, message: str, run_id: str, cycle_number: int) -> str:
@@ -122,3 +130,22 @@ class TelegramChannel:
             # Network errors, Telegram API errors, etc. - raise as ConnectionError
             logger.error(f"Telegram communication error: {e}")
             raise ConnectionError(f"Telegram communication failed: {e}") from e
+    
+    def close(self) -> None:
+        """
+        Release the underlying Telegram service.
+        
+        Stops update polling and the service's background event loop.
+        """
+        self._telegram_service.close()
+    
+    @staticmethod
+    def _close_service(service: Optional[TelegramOperatorChannel]) -> None:
+        """Close a partly initialized Telegram service, logging any failure."""
+        if service is None:
+            return
+        
+        try:
+            service.close()
+        except Exception as e:
+            logger.warning(f"Error closing Telegram service: {e}")
@@ -9,15 +9,37 @@ during long-running experiments.
 import asyncio
 import logging
 import os
-import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional
+import threading
+from typing import Any, List, Optional
 
-from telegram import Bot, Update
-from telegram.error import NetworkError, TelegramError
+from telegram import Update
+from telegram.error import BadRequest, NetworkError, TelegramError
+from telegram.ext import Application, ContextTypes, MessageHandler, filters
+from telegram.request import HTTPXRequest
 
 logger = logging.getLogger(__name__)
 
+# Long-poll duration in seconds for each getUpdates request
+POLL_TIMEOUT_SECONDS = 30
+
+# Persistent HTTPS connections kept open for API calls (sends, getMe)
+CONNECTION_POOL_SIZE = 8
+CONNECT_TIMEOUT_SECONDS = 5
+
+# Attempts per user for a send that fails with a network error or timeout,
+# waiting SEND_RETRY_BACKOFF_SECONDS before the first retry and doubling after
+SEND_ATTEMPTS = 3
+SEND_RETRY_BACKOFF_SECONDS = 0.5
+
+# Network errors reported by the polling updater, which retries them itself,
+# tolerated during one wait before it fails; other polling errors fail at once
+POLLING_ERROR_LIMIT = 5
+
+# Context header prepended to every outgoing message
+MESSAGE_HEADER_TEMPLATE = (
+    "🤖 Agent Message (Run: {run_id}, Cycle: {cycle_number})\n" + "━" * 32 + "\n"
+)
+
 
 class TelegramOperatorChannel:
     """
@@ -26,6 +48,11 @@ class TelegramOperatorChannel:
     This class provides methods to send messages to authorized Telegram users
     and wait for their responses with configurable timeouts. It includes
     connection health checking and user authorization validation.
+
+    A python-telegram-bot Application runs on a dedicated background event
+    loop. Incoming messages are delivered by a handler the moment they arrive,
+    so waiting for a response involves no polling or sleeping on the caller's
+    thread.
     """
 
     def __init__(self, authorized_users: List[int], timeout_minutes: int = 5) -> None:
@@ -39,7 +66,6 @@ class TelegramOperatorChannel:
 
         Raises:
             ValueError: If TELEGRAM_BOT_TOKEN environment variable is not set
-            ConnectionError: If bot initialization fails
 
         Example:
             >>> channel = TelegramOperatorChannel([123456789], timeout_minutes=5)
@@ -52,25 +78,151 @@ class TelegramOperatorChannel:
 
         self.authorized_users = authorized_users
         self.timeout_minutes = timeout_minutes
-        self._pending_response: Optional[str] = None
-        self._last_update_id: Optional[int] = None
-        
-        # Store token instead of Bot instance
         self._token = token
-        
+
+        # Future resolved by the message handler with the next authorized reply
+        self._response_future: Optional[asyncio.Future] = None
+
+        # Network errors reported by the updater since the wait was armed
+        self._polling_errors = 0
+
+        # Background event loop and application, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._application: Optional[Application] = None
+
         logger.info("TelegramOperatorChannel initialized successfully")
-    
+
     def _run_async(self, async_func):
         """
-        Run an async function in a new event loop using asyncio.run().
-        
+        Run an async function on the background event loop and wait for its result.
+
         Args:
             async_func: Async function to run (not a coroutine, but a callable that returns one)
-            
+
         Returns:
             Result of the async function
         """
-        return asyncio.run(async_func())
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="telegram-operator-channel",
+                daemon=True,
+            )
+            self._loop_thread.start()
+
+        return asyncio.run_coroutine_threadsafe(async_func(), self._loop).result()
+
+    def _ensure_started(self) -> Application:
+        """
+        Build and start the Telegram application if it is not running yet.
+
+        Starting the application validates the bot token and begins long-polling
+        for updates. Updates sent before the channel started are dropped.
+
+        Returns:
+            The running Application
+        """
+        if self._application is not None:
+            return self._application
+
+        async def _start():
+            # Pooled keep-alive clients: one for API calls, one dedicated to
+            # long-polling, so neither pays a TLS handshake per request
+            application = (
+                Application.builder()
+                .token(self._token)
+                .request(
+                    HTTPXRequest(
+                        connection_pool_size=CONNECTION_POOL_SIZE,
+                        connect_timeout=CONNECT_TIMEOUT_SECONDS,
+                    )
+                )
+                .get_updates_request(
+                    HTTPXRequest(
+                        connect_timeout=CONNECT_TIMEOUT_SECONDS,
+                        read_timeout=POLL_TIMEOUT_SECONDS + 5,
+                    )
+                )
+                .build()
+            )
+            application.add_handler(
+                MessageHandler(filters.TEXT & ~filters.COMMAND, self._handle_message)
+            )
+            await application.initialize()
+            await application.start()
+            await application.updater.start_polling(
+                timeout=POLL_TIMEOUT_SECONDS,
+                drop_pending_updates=True,
+                error_callback=self._handle_polling_error,
+            )
+            return application
+
+        self._application = self._run_async(_start)
+        logger.debug("Telegram application started")
+        return self._application
+
+    async def _handle_message(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """
+        Deliver an incoming text message to the pending wait, if any.
+
+        Runs on the background event loop. Messages from unauthorized users,
+        and messages arriving while no response is awaited, are ignored.
+        """
+        message = update.message
+        if message is None or message.from_user is None or not message.text:
+            return
+
+        user_id = message.from_user.id
+        if not self._validate_user(user_id):
+            logger.warning(f"Rejected message from unauthorized user {user_id}")
+            return
+
+        future = self._response_future
+        if future is not None and not future.done():
+            logger.info(f"Received authorized response from user {user_id}")
+            future.set_result(message.text)
+
+    def _handle_polling_error(self, error: TelegramError) -> None:
+        """
+        Fail the pending wait when long-polling hits a Telegram or network error.
+
+        Network errors and timeouts are retried by the updater, so they fail
+        the wait only after POLLING_ERROR_LIMIT of them. API errors such as
+        an invalid token, a blocked bot or a conflicting poller fail it at once.
+        """
+        if isinstance(error, NetworkError) and not isinstance(error, BadRequest):
+            self._polling_errors += 1
+            if self._polling_errors < POLLING_ERROR_LIMIT:
+                logger.warning(
+                    f"Telegram polling error ({self._polling_errors}/{POLLING_ERROR_LIMIT}), "
+                    f"retrying: {error}"
+                )
+                return
+
+        logger.error(f"Telegram polling error: {error}")
+        future = self._response_future
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def _arm_response(self, reset: bool = False) -> None:
+        """
+        Start listening for the next authorized response.
+
+        Args:
+            reset: Discard any reply captured earlier and listen afresh. When
+                False, an existing (possibly already answered) wait is kept.
+        """
+
+        async def _arm():
+            if reset or self._response_future is None:
+                self._response_future = asyncio.get_running_loop().create_future()
+                self._polling_errors = 0
+
+        self._run_async(_arm)
 
     def check_connection(self) -> bool:
         """
@@ -85,11 +237,11 @@ class TelegramOperatorChannel:
             ...     print("Connection OK")
         """
         try:
+            application = self._ensure_started()
+
             async def _check():
-                async with Bot(self._token) as bot:
-                    bot_info = await bot.get_me()
-                    return bot_info
-            
+                return await application.bot.get_me()
+
             bot_info = self._run_async(_check)
             logger.info(f"Connection check successful. Bot: {bot_info.first_name}")
             return True
@@ -106,6 +258,9 @@ class TelegramOperatorChannel:
             run_id: Experiment run identifier
             cycle_number: Current cycle number in the experiment
 
+        Sends failing with a network error are retried up to SEND_ATTEMPTS
+        times per user with exponential backoff.
+
         Raises:
             ConnectionError: If message sending fails due to network issues
             RuntimeError: If Telegram API error occurs
@@ -118,77 +273,80 @@ class TelegramOperatorChannel:
             ...     cycle_number=5
             ... )
         """
+        if not self.authorized_users:
+            raise RuntimeError("No authorized users configured")
+
         formatted_message = self._format_message(message, run_id, cycle_number)
 
         logger.info(f"Sending Telegram message for run {run_id}, cycle {cycle_number}")
 
+        application = self._ensure_started()
+
+        # Listen before sending so that a fast reply cannot be missed
+        self._arm_response(reset=True)
+
+        # Retry transient network failures with exponential backoff; API errors
+        # (blocked bot, bad chat ID) are final. BadRequest subclasses
+        # NetworkError in python-telegram-bot, so it is re-raised first.
+        async def _send(user_id: int) -> Any:
+            for attempt in range(SEND_ATTEMPTS):
+                try:
+                    return await application.bot.send_message(
+                        chat_id=user_id, text=formatted_message
+                    )
+                except BadRequest:
+                    raise
+                except NetworkError as e:
+                    if attempt == SEND_ATTEMPTS - 1:
+                        raise
+                    logger.warning(
+                        f"Network error sending to user {user_id} "
+                        f"(attempt {attempt + 1}/{SEND_ATTEMPTS}), retrying: {e}"
+                    )
+                    await asyncio.sleep(SEND_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+
+        # Send to all users concurrently so latency is one round-trip, not one per user
+        async def _send_all():
+            return await asyncio.gather(
+                *(_send(user_id) for user_id in self.authorized_users),
+                return_exceptions=True,
+            )
+
+        results = self._run_async(_send_all)
+
         successful_sends = 0
         errors = []
 
-        for user_id in self.authorized_users:
-            try:
-                async def _send():
-                    async with Bot(self._token) as bot:
-                        await bot.send_message(chat_id=user_id, text=formatted_message)
-                
-                self._run_async(_send)
-                successful_sends += 1
-                logger.debug(f"Message sent successfully to user {user_id}")
-            except NetworkError as e:
-                error_msg = f"Network error sending to user {user_id}: {e}"
+        for user_id, result in zip(self.authorized_users, results):
+            if isinstance(result, NetworkError) and not isinstance(result, BadRequest):
+                error_msg = f"Network error sending to user {user_id}: {result}"
                 logger.error(error_msg)
                 errors.append(error_msg)
-            except TelegramError as e:
-                error_msg = f"Telegram API error sending to user {user_id}: {e}"
+            elif isinstance(result, TelegramError):
+                error_msg = f"Telegram API error sending to user {user_id}: {result}"
                 logger.error(error_msg)
                 errors.append(error_msg)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                successful_sends += 1
+                logger.debug(f"Message sent successfully to user {user_id}")
 
         if successful_sends == 0:
             # No messages sent successfully
-            if errors:
-                raise ConnectionError(
-                    f"Failed to send message to any authorized user. Errors: {'; '.join(errors)}"
-                )
-            else:
-                raise RuntimeError("No authorized users configured")
+            raise ConnectionError(
+                f"Failed to send message to any authorized user. Errors: {'; '.join(errors)}"
+            )
 
         logger.info(f"Message sent successfully to {successful_sends} user(s)")
-        
-        # Mark all existing messages as read before waiting for new response
-        # This ensures we only receive messages sent AFTER our message
-        self._mark_existing_as_read()
 
-    def _mark_existing_as_read(self) -> None:
-        """
-        Mark all existing Telegram updates as read.
-        
-        This advances the update offset to skip any messages that were
-        already in the chat before we started waiting for a response.
-        """
-        try:
-            async def _clear_updates():
-                async with Bot(self._token) as bot:
-                    updates = await bot.get_updates(
-                        offset=self._last_update_id + 1 if self._last_update_id else None,
-                        timeout=0,  # Don't wait, just get existing
-                    )
-                    return updates
-            
-            updates = self._run_async(_clear_updates)
-            
-            # Mark all these updates as read
-            if updates:
-                self._last_update_id = updates[-1].update_id
-                logger.debug(f"Marked {len(updates)} existing updates as read")
-                
-        except Exception as e:
-            # Non-fatal - log but don't raise
-            logger.warning(f"Failed to mark existing updates as read: {e}")
-    
     def wait_for_response(self, timeout_minutes: Optional[int] = None) -> str:
         """
         Wait for operator response via Telegram with timeout.
 
+        Returns as soon as the message handler receives a reply from an
+        authorized user; messages from other users are ignored.
+
         Args:
             timeout_minutes: Minutes to wait before timeout. -1 means wait forever.
                            If None, uses instance default.
@@ -198,7 +356,6 @@ class TelegramOperatorChannel:
 
         Raises:
             TimeoutError: If timeout expires before response received.
-            ValueError: If response is from unauthorized user.
             ConnectionError: If Telegram connection fails.
 
         Example:
@@ -213,60 +370,66 @@ class TelegramOperatorChannel:
             f"Waiting for Telegram response (timeout: {timeout_minutes} minutes)"
         )
 
-        start_time = time.time()
         timeout_seconds = timeout_minutes * 60 if timeout_minutes > 0 else None
 
-        while True:
+        self._ensure_started()
+        self._arm_response()
+
+        async def _await_response():
             try:
-                # Get updates from Telegram
-                async def _get_updates():
-                    async with Bot(self._token) as bot:
-                        return await bot.get_updates(
-                            offset=self._last_update_id + 1 if self._last_update_id else None,
-                            timeout=30,
-                        )
-                
-                updates = self._run_async(_get_updates)
-
-                for update in updates:
-                    self._last_update_id = update.update_id
-
-                    if update.message and update.message.text:
-                        user_id = update.message.from_user.id
-
-                        if self._validate_user(user_id):
-                            response = update.message.text
-                            logger.info(
-                                f"Received authorized response from user {user_id}"
-                            )
-                            return response
-                        else:
-                            logger.warning(
-                                f"Rejected message from unauthorized user {user_id}"
-                            )
-
-            except NetworkError as e:
-                logger.error(f"Network error while waiting for response: {e}")
-                raise ConnectionError(
-                    f"Telegram connection lost while waiting for response: {e}"
-                )
-            except TelegramError as e:
-                logger.error(f"Telegram API error while waiting for response: {e}")
-                raise ConnectionError(f"Telegram API error: {e}")
-
-            # Check timeout
-            if timeout_seconds is not None:
-                elapsed = time.time() - start_time
-                if elapsed > timeout_seconds:
-                    logger.warning(
-                        f"Timeout waiting for Telegram response after {timeout_minutes} minutes"
-                    )
-                    raise TimeoutError(
-                        f"No response received within {timeout_minutes} minutes"
-                    )
+                return await asyncio.wait_for(self._response_future, timeout=timeout_seconds)
+            finally:
+                self._response_future = None
 
-            # Small sleep to avoid tight polling loop
-            time.sleep(1)
+        try:
+            return self._run_async(_await_response)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Timeout waiting for Telegram response after {timeout_minutes} minutes"
+            )
+            raise TimeoutError(
+                f"No response received within {timeout_minutes} minutes"
+            )
+        except NetworkError as e:
+            logger.error(f"Network error while waiting for response: {e}")
+            raise ConnectionError(
+                f"Telegram connection lost while waiting for response: {e}"
+            )
+        except TelegramError as e:
+            logger.error(f"Telegram API error while waiting for response: {e}")
+            raise ConnectionError(f"Telegram API error: {e}")
+
+    def close(self) -> None:
+        """
+        Stop the Telegram application and its background event loop.
+
+        Safe to call more than once.
+        """
+        if self._loop is None:
+            return
+
+        if self._application is not None:
+            application = self._application
+
+            async def _shutdown():
+                if application.updater.running:
+                    await application.updater.stop()
+                if application.running:
+                    await application.stop()
+                await application.shutdown()
+
+            try:
+                self._run_async(_shutdown)
+            except Exception as e:
+                logger.warning(f"Error shutting down Telegram application: {e}")
+            self._application = None
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
 
     def _validate_user(self, user_id: int) -> bool:
         """
@@ -310,8 +473,5 @@ class TelegramOperatorChannel:
             ...     5
             ... )
         """
-        return (
-            f"🤖 Agent Message (Run: {run_id}, Cycle: {cycle_number})\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            f"{message}"
-        )
+        header = MESSAGE_HEADER_TEMPLATE.format(run_id=run_id, cycle_number=cycle_number)
+        return header + message
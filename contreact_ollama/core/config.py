@@ -27,6 +27,10 @@ class ExperimentConfig:
         telegram_bot_token: Bot token from environment variable (sourced from TELEGRAM_BOT_TOKEN)
         telegram_authorized_users: List of authorized Telegram user IDs
         telegram_timeout_minutes: Response timeout in minutes (-1 = wait forever, 0-120 = timeout)
+        log_rotate_cycles: Rotate and gzip the JSONL log every N cycles (default: None, single file)
+        verbose: Print per-cycle progress lines to the console (default: True)
+        operator_response_cache: Answer a repeated, identical operator message within a run
+                                 with the operator's earlier reply, marked as cached (default: False)
     """
     
     run_id: str
@@ -38,6 +42,9 @@ class ExperimentConfig:
     telegram_bot_token: Optional[str] = None
     telegram_authorized_users: List[int] = field(default_factory=list)
     telegram_timeout_minutes: int = 5
+    log_rotate_cycles: Optional[int] = None
+    verbose: bool = True
+    operator_response_cache: bool = False
     
     def validate_telegram_config(self) -> None:
         """Validate Telegram configuration fields.
@@ -51,9 +58,12 @@ class ExperimentConfig:
             - Timeout is within valid range (-1 or 0-120 minutes)
         """
         if self.telegram_enabled:
+            # Resolve bot token from the environment once per config
+            if self.telegram_bot_token is None:
+                self.telegram_bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
+            
             # Check if bot token environment variable is set
-            bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-            if not bot_token:
+            if not self.telegram_bot_token:
                 raise InvalidConfigurationError(
                     "Telegram enabled but TELEGRAM_BOT_TOKEN environment variable not set. "
                     "See README.md 'Telegram Integration Setup' section for configuration instructions."
@@ -1,5 +1,9 @@
 # Standard library imports
-from typing import List, Dict, Any, Tuple, Optional
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Tuple, Optional, Union
 
 # Third-party imports
 import numpy as np
@@ -10,12 +14,111 @@ from contreact_ollama.core.config import ExperimentConfig
 from contreact_ollama.llm.ollama_interface import OllamaInterface
 from contreact_ollama.llm.prompt_assembler import build_prompt
 from contreact_ollama.llm.response_parser import parse_ollama_response
-from contreact_ollama.logging.jsonl_logger import JsonlLogger, EventType
+from contreact_ollama.logging.jsonl_logger import (
+    JsonlLogger, EventType, new_prompt_hash, update_prompt_hash
+)
 from contreact_ollama.state.agent_state import AgentState
 from contreact_ollama.tools.tool_dispatcher import ToolDispatcher
 from contreact_ollama.analysis.similarity_monitor import SimilarityMonitor
 
 
+logger = logging.getLogger(__name__)
+
+# Tools that share a resource run on the same serial lane, in the order the model
+# issued them; different lanes run concurrently. Memory tools share one TinyDB
+# handle, which is not thread-safe. Unlisted tools use the memory lane.
+_TOOL_LANES = {
+    "send_message_to_operator": "operator",
+}
+_DEFAULT_TOOL_LANE = "memory"
+
+# Lanes whose worker is a daemon thread. The operator lane can block in a
+# terminal input(); a non-daemon worker there would keep the interpreter from
+# exiting after Ctrl-C. Memory writes stay on a non-daemon worker so they
+# are never cut off mid-write.
+_DAEMON_LANES = frozenset(("operator",))
+
+# Tools counted as memory operations in cycle metrics
+_MEMORY_TOOLS = frozenset(("write", "read", "list", "delete", "pattern_search"))
+
+
+def _count_memory_op(tool_args: Dict[str, Any], cycle_metrics: Dict[str, int]) -> None:
+    """Count a memory tool call."""
+    cycle_metrics["memory_ops_total"] += 1
+
+
+def _count_memory_write(tool_args: Dict[str, Any], cycle_metrics: Dict[str, int]) -> None:
+    """Count a memory write and the characters it stores."""
+    cycle_metrics["memory_ops_total"] += 1
+    if "value" in tool_args:
+        cycle_metrics["memory_write_chars"] += len(str(tool_args["value"]))
+
+
+def _count_operator_message(tool_args: Dict[str, Any], cycle_metrics: Dict[str, int]) -> None:
+    """Count a message sent to the operator."""
+    cycle_metrics["messages_to_operator"] += 1
+
+
+# Cycle metric updater per tool name; tools without an entry are not counted
+_METRIC_UPDATERS: Dict[str, Callable[[Dict[str, Any], Dict[str, int]], None]] = {
+    **{name: _count_memory_op for name in _MEMORY_TOOLS},
+    "write": _count_memory_write,
+    "send_message_to_operator": _count_operator_message,
+}
+
+# Tool result messages differ only in content and tool_call_id; copying this
+# prebuilt dict is cheaper than building a fresh three-key literal per call
+_TOOL_MESSAGE_TEMPLATE = {"role": "tool", "content": "", "tool_call_id": None}
+
+
+class _DaemonLaneExecutor:
+    """Single-worker executor whose worker is a daemon thread.
+    
+    Mirrors the submit()/shutdown() subset of ThreadPoolExecutor used for lanes.
+    """
+    
+    def __init__(self, thread_name: str) -> None:
+        self._work_queue: "queue.SimpleQueue[Optional[Tuple[Future, Callable, tuple]]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._worker, name=thread_name, daemon=True)
+        self._thread.start()
+    
+    def _worker(self) -> None:
+        """Run submitted calls in order until shutdown() queues the stop marker."""
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+    
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        """Queue fn(*args) and return a Future for its result."""
+        future: Future = Future()
+        self._work_queue.put((future, fn, args))
+        return future
+    
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop the worker after the running call, optionally cancelling queued calls."""
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        self._work_queue.put(None)
+        if wait:
+            self._thread.join()
+
+
 class CycleOrchestrator:
     """Manages execution of agent's operational cycles.
     
@@ -33,7 +136,8 @@ class CycleOrchestrator:
         ollama_interface: OllamaInterface,
         tool_dispatcher: ToolDispatcher,
         logger: Optional[JsonlLogger] = None,
-        similarity_monitor: Optional[SimilarityMonitor] = None
+        similarity_monitor: Optional[SimilarityMonitor] = None,
+        reflection_judge: Optional[Callable[[int, str], Any]] = None
     ) -> None:
         """Initialize orchestrator with configuration and services.
         
@@ -43,15 +147,46 @@ class CycleOrchestrator:
             tool_dispatcher: Tool dispatcher for executing agent tools
             logger: Event logger (optional for now, required in production)
             similarity_monitor: Similarity monitor for diversity feedback (optional)
+            reflection_judge: Optional callable (cycle_number, final_reflection) -> result,
+                e.g. an evaluator LLM call. It runs in the background while the next
+                cycle proceeds; results are collected into judge_results at the end
+                of the run. A judge that raises is logged and its exception is
+                recorded as that cycle's result.
         """
         self.config = config
         self.ollama_interface = ollama_interface
         self.tool_dispatcher = tool_dispatcher
         self.logger = logger
         self.similarity_monitor = similarity_monitor
+        self.reflection_judge = reflection_judge
+        
+        # Judge results (or the exception a judge raised) by cycle number,
+        # filled in when run_experiment() finishes
+        self.judge_results: Dict[int, Any] = {}
         
-        # Storage for reflection embeddings
-        self.reflection_embeddings: List[np.ndarray] = []
+        # Tool definitions are fixed for the run - build them once
+        self._tool_definitions = tool_dispatcher.get_tool_definitions()
+        
+        # One single-worker executor per tool lane (see _TOOL_LANES), created on demand.
+        # Tool calls start while the LLM is still streaming, and calls on
+        # different lanes (e.g. an operator wait and memory reads) overlap.
+        # Reflection judge calls run on their own "judge" lane. close() shuts them down.
+        self._tool_executors: Dict[str, Union[ThreadPoolExecutor, _DaemonLaneExecutor]] = {}
+        
+        # Reflections of all cycles so far, shared by every cycle's AgentState
+        # and appended in place (no per-cycle copies)
+        self.reflection_history: List[str] = []
+    
+    @property
+    def reflection_embeddings(self) -> np.ndarray:
+        """Embeddings of all reflections so far as an (N, dim) float32 matrix.
+        
+        This is a view of the similarity monitor's contiguous history buffer;
+        rows are unit-norm. Empty when diversity monitoring is disabled.
+        """
+        if self.similarity_monitor is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self.similarity_monitor.history
     
     def run_experiment(self) -> None:
         """Main public method executing full experimental run from Cycle 1 to cycle_count.
@@ -61,79 +196,121 @@ class CycleOrchestrator:
         Maintains reflection_history continuity across cycles while resetting message_history.
         Includes diversity monitoring via similarity checking.
         """
-        print(f"\nStarting experiment: {self.config.run_id}")
-        print(f"Model: {self.config.model_name}")
-        print(f"Total cycles: {self.config.cycle_count}\n")
-        
-        # Initialize reflection history to persist across cycles
-        reflection_history = []
-        diversity_feedback = None  # Feedback for next cycle
+        print(
+            f"\nStarting experiment: {self.config.run_id}\n"
+            f"Model: {self.config.model_name}\n"
+            f"Total cycles: {self.config.cycle_count}\n"
+        )
         
-        for cycle_num in range(1, self.config.cycle_count + 1):
-            # Log cycle start
-            if self.logger:
-                self.logger.log_event(
-                    run_id=self.config.run_id,
-                    cycle_number=cycle_num,
-                    event_type=EventType.CYCLE_START,
-                    payload={}
-                )
-            
-            print(f"Cycle {cycle_num} starting...")
-            
-            # Load state for this cycle - always fresh message_history
-            agent_state = self._load_state(cycle_num)
-            # Restore reflection history from previous cycles
-            agent_state.reflection_history = reflection_history.copy()
-            
-            # Execute cycle (diversity_feedback will be used in _assemble_prompt)
-            agent_state = self._execute_cycle(agent_state, diversity_feedback)
-            
-            print(f"Cycle {cycle_num} finished.")
+        try:
+            diversity_feedback = None  # Feedback for next cycle
             
-            # Extract final reflection for logging and persist it
-            final_reflection = agent_state.reflection_history[-1] if agent_state.reflection_history else ""
-            reflection_history = agent_state.reflection_history.copy()
+            # Judge calls started for completed cycles, collected after the last cycle
+            pending_judges: List[Tuple[int, Future]] = []
             
-            # Generate embedding and check similarity for NEXT cycle
-            diversity_feedback = None
-            if self.similarity_monitor and final_reflection:
-                embedding = self.similarity_monitor.embedding_service.get_embedding(final_reflection)
+            for cycle_num in range(1, self.config.cycle_count + 1):
+                # Log cycle start
+                if self.logger:
+                    self.logger.log_event(
+                        run_id=self.config.run_id,
+                        cycle_number=cycle_num,
+                        event_type=EventType.CYCLE_START,
+                        payload={}
+                    )
                 
-                # Check similarity against historical embeddings
-                diversity_feedback = self.similarity_monitor.check_similarity(
-                    new_reflection_embedding=embedding,
-                    historical_embeddings=self.reflection_embeddings
-                )
+                if self.config.verbose:
+                    print(f"Cycle {cycle_num} starting...")
                 
-                # Store this embedding for future comparisons
-                self.reflection_embeddings.append(embedding)
+                # Load state for this cycle - fresh message_history, shared reflection_history
+                agent_state = self._load_state(cycle_num)
                 
-                # Optional: log if feedback generated
-                if diversity_feedback:
-                    print(f"  [Diversity advisory triggered: similarity detected]")
-            
-            # Log cycle end with reflection and metrics
-            if self.logger:
-                payload = {
-                    "final_reflection": final_reflection
-                }
+                # Execute cycle (diversity_feedback will be used in _assemble_prompt)
+                agent_state = self._execute_cycle(agent_state, diversity_feedback)
                 
-                # Include metrics if available
-                if hasattr(agent_state, 'cycle_metrics'):
-                    payload["metrics"] = agent_state.cycle_metrics
+                # End-of-cycle status lines, written to stdout together
+                cycle_status = f"Cycle {cycle_num} finished."
                 
-                self.logger.log_event(
-                    run_id=self.config.run_id,
-                    cycle_number=cycle_num,
-                    event_type=EventType.CYCLE_END,
-                    payload=payload
-                )
+                # Extract final reflection for logging (already persisted in the shared history)
+                final_reflection = agent_state.reflection_history[-1] if agent_state.reflection_history else ""
+                
+                # Judge this reflection in the background, overlapping the next cycle
+                if self.reflection_judge and final_reflection:
+                    pending_judges.append((cycle_num, self._lane_executor("judge").submit(
+                        self._run_judge, self.reflection_judge, cycle_num, final_reflection
+                    )))
+                
+                # Generate embedding and check similarity for NEXT cycle
+                diversity_feedback = None
+                if self.similarity_monitor and final_reflection:
+                    embedding = self.similarity_monitor.embedding_service.get_embedding(final_reflection)
+                    
+                    # Check similarity against the monitor's accumulated history
+                    diversity_feedback = self.similarity_monitor.check_similarity(
+                        new_reflection_embedding=embedding
+                    )
+                    
+                    # Store this embedding for future comparisons
+                    self.similarity_monitor.add(embedding)
+                    
+                    # Optional: log if feedback generated
+                    if diversity_feedback:
+                        cycle_status += "\n  [Diversity advisory triggered: similarity detected]"
+                
+                if self.config.verbose:
+                    print(cycle_status)
+                
+                # Log cycle end with reflection and metrics
+                if self.logger:
+                    payload: Dict[str, Any] = {
+                        "final_reflection": final_reflection
+                    }
+                    
+                    # Include metrics if available
+                    if agent_state.cycle_metrics:
+                        payload["metrics"] = agent_state.cycle_metrics
+                    
+                    self.logger.log_event(
+                        run_id=self.config.run_id,
+                        cycle_number=cycle_num,
+                        event_type=EventType.CYCLE_END,
+                        payload=payload
+                    )
+            
+            for cycle_num, future in pending_judges:
+                self.judge_results[cycle_num] = future.result()
+        finally:
+            self.close()
         
-        print(f"\n✓ Experiment {self.config.run_id} completed successfully")
-        print(f"✓ Executed {self.config.cycle_count} cycles")
+        summary = (
+            f"\n✓ Experiment {self.config.run_id} completed successfully\n"
+            f"✓ Executed {self.config.cycle_count} cycles"
+        )
         if self.logger:
-            print(f"✓ Log file: logs/{self.config.run_id}.jsonl")
+            summary += f"\n✓ Log file: logs/{self.config.run_id}.jsonl"
+        print(summary)
+    
+    def _run_judge(
+        self, judge: Callable[[int, str], Any], cycle_number: int, final_reflection: str
+    ) -> Any:
+        """Call the reflection judge, returning the exception it raised instead of raising.
+        
+        The judge is advisory, so its failure is logged and recorded in
+        judge_results rather than failing the run.
+        """
+        try:
+            return judge(cycle_number, final_reflection)
+        except Exception as e:
+            logger.warning("Reflection judge failed for cycle %d: %s", cycle_number, e)
+            return e
+    
+    def close(self) -> None:
+        """Shut down the lane executors, cancelling tool and judge calls not yet started.
+        
+        Called when run_experiment() finishes or fails; safe to call more than once.
+        """
+        for executor in self._tool_executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._tool_executors.clear()
     
     def _execute_cycle(self, agent_state: AgentState, diversity_feedback: Optional[str] = None) -> AgentState:
         """Execute a single cycle of the ContReAct state machine.
@@ -160,13 +337,26 @@ class CycleOrchestrator:
             "memory_write_chars": 0
         }
         
+        # The prompt only grows within a cycle, so each LLM_INVOCATION logs just the
+        # messages added since the previous turn plus a rolling transcript hash
+        logged_prompt_len = 0
+        prompt_hash = new_prompt_hash()
+        
         # ReAct loop - continues until agent provides final reflection
         while True:
             # ASSEMBLE_PROMPT
             messages = self._assemble_prompt(agent_state, diversity_feedback)
             
-            # INVOKE_LLM
-            response = self._invoke_llm(messages)
+            # INVOKE_LLM - tool calls start executing as soon as the stream delivers them
+            early_dispatches: List[Tuple[Dict, Future]] = []
+            
+            def start_tool(tool_call: Dict) -> None:
+                early_dispatches.append((tool_call, self._submit_tool(tool_call, agent_state)))
+            
+            response = self._invoke_llm(messages, on_tool_call=start_tool)
+            
+            # Events of this ReAct turn, written together once the turn completes
+            pending_records = []
             
             # Log LLM invocation
             if self.logger:
@@ -180,16 +370,22 @@ class CycleOrchestrator:
                 if "tool_calls" in message:
                     serializable_message["tool_calls"] = message["tool_calls"]
                 
-                self.logger.log_event(
+                prompt_suffix = messages[logged_prompt_len:]
+                prompt_hash_so_far = update_prompt_hash(prompt_hash, prompt_suffix)
+                
+                pending_records.append(self.logger.create_record(
                     run_id=self.config.run_id,
                     cycle_number=agent_state.cycle_number,
                     event_type=EventType.LLM_INVOCATION,
                     payload={
-                        "prompt_messages": messages,
+                        "prompt_offset": logged_prompt_len,
+                        "prompt_suffix": prompt_suffix,
+                        "prompt_hash_so_far": prompt_hash_so_far,
                         "response_message": serializable_message,
                         "model_options": self.config.model_options
                     }
-                )
+                ))
+                logged_prompt_len = len(messages)
             
             # Append assistant's response to message history
             agent_state.message_history.append(response["message"])
@@ -202,54 +398,40 @@ class CycleOrchestrator:
             response_type, data = self._parse_response(response)
             
             if response_type == "TOOL_CALL":
-                # Process each tool call
-                for tool_call in data:
-                    # Track metrics based on tool type
-                    tool_name = tool_call["function"]["name"]
-                    tool_args = tool_call["function"]["arguments"]
-                    
-                    # Count memory operations
-                    if tool_name in ["write", "read", "list", "delete", "pattern_search"]:
-                        cycle_metrics["memory_ops_total"] += 1
-                        
-                        # Track memory write characters
-                        if tool_name == "write" and "value" in tool_args:
-                            cycle_metrics["memory_write_chars"] += len(str(tool_args["value"]))
-                    
-                    # Count operator messages
-                    if tool_name == "send_message_to_operator":
-                        cycle_metrics["messages_to_operator"] += 1
-                    
-                    # DISPATCH_TOOL
-                    tool_result = self._dispatch_tool(tool_call, agent_state)
-                    
-                    # Log tool call
-                    if self.logger:
-                        self.logger.log_event(
-                            run_id=self.config.run_id,
-                            cycle_number=agent_state.cycle_number,
-                            event_type=EventType.TOOL_CALL,
-                            payload={
-                                "tool_name": tool_name,
-                                "parameters": tool_args,
-                                "output": tool_result
-                            }
-                        )
-                    
-                    # Append tool result to message history
-                    agent_state.message_history.append({
-                        "role": "tool",
-                        "content": tool_result,
-                        "tool_call_id": tool_call.get("id")
-                    })
+                # DISPATCH_TOOL - submit every tool call not already started while streaming
+                futures = []
+                for index, tool_call in enumerate(data):
+                    if index < len(early_dispatches) and early_dispatches[index][0] is tool_call:
+                        futures.append(early_dispatches[index][1])
+                    else:
+                        futures.append(self._submit_tool(tool_call, agent_state))
+                
+                # Process each tool call, collecting results in the original order
+                for tool_call, future in zip(data, futures):
+                    self._record_tool_call(
+                        tool_call, future, agent_state, cycle_metrics, pending_records
+                    )
+                
+                if self.logger:
+                    self.logger.log_events(pending_records)
                 
                 # Continue loop - will call LLM again with tool results
                 continue
                 
             elif response_type == "FINAL_REFLECTION":
                 # Agent has provided final reflection - exit loop
+                # Tools started while streaming still ran (and may have written memory)
+                # even though the response degraded to text, so record them like any call
+                for tool_call, future in early_dispatches:
+                    self._record_tool_call(
+                        tool_call, future, agent_state, cycle_metrics, pending_records
+                    )
+                
                 # Store reflection (will be used in Story 1.9)
                 agent_state.reflection_history.append(data)
+                
+                if self.logger:
+                    self.logger.log_events(pending_records)
                 break
         
         # Store metrics in agent state for logging
@@ -257,6 +439,53 @@ class CycleOrchestrator:
         
         return agent_state
     
+    def _record_tool_call(
+        self,
+        tool_call: Dict,
+        future: Future,
+        agent_state: AgentState,
+        cycle_metrics: Dict[str, int],
+        pending_records: List
+    ) -> None:
+        """Wait for a dispatched tool call, then count, log and append its result.
+        
+        Args:
+            tool_call: Tool call dict from Ollama response
+            future: Pending result from _submit_tool()
+            agent_state: Current agent state; the tool message is appended to its history
+            cycle_metrics: Metrics of the current cycle, updated in place
+            pending_records: Log records of the current ReAct turn, appended to
+        """
+        # Track metrics based on tool type
+        tool_name = tool_call["function"]["name"]
+        tool_args = tool_call["function"]["arguments"]
+        
+        # Memory operations, memory write characters, operator messages
+        update_metrics = _METRIC_UPDATERS.get(tool_name)
+        if update_metrics is not None:
+            update_metrics(tool_args, cycle_metrics)
+        
+        tool_result = future.result()
+        
+        # Log tool call
+        if self.logger:
+            pending_records.append(self.logger.create_record(
+                run_id=self.config.run_id,
+                cycle_number=agent_state.cycle_number,
+                event_type=EventType.TOOL_CALL,
+                payload={
+                    "tool_name": tool_name,
+                    "parameters": tool_args,
+                    "output": tool_result
+                }
+            ))
+        
+        # Append tool result to message history
+        tool_message = _TOOL_MESSAGE_TEMPLATE.copy()
+        tool_message["content"] = tool_result
+        tool_message["tool_call_id"] = tool_call.get("id")
+        agent_state.message_history.append(tool_message)
+    
     def _assemble_prompt(self, agent_state: AgentState, diversity_feedback: Optional[str] = None) -> List[Dict]:
         """ASSEMBLE_PROMPT: Construct full context for LLM.
         
@@ -267,24 +496,27 @@ class CycleOrchestrator:
         Returns:
             List of message dicts for ollama.chat
         """
-        # Get tool definitions
-        tool_definitions = self.tool_dispatcher.get_tool_definitions()
-        
         # Build prompt
         messages = build_prompt(
             agent_state=agent_state,
             system_prompt=SYSTEM_PROMPT,
-            tool_definitions=tool_definitions,
+            tool_definitions=self._tool_definitions,
             diversity_feedback=diversity_feedback
         )
         
         return messages
     
-    def _invoke_llm(self, messages: List[Dict]) -> Dict:
+    def _invoke_llm(
+        self,
+        messages: List[Dict],
+        on_tool_call: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
         """INVOKE_LLM: Send prompt to Ollama server.
         
         Args:
             messages: Formatted message list
+            on_tool_call: Optional callback receiving each tool call as soon as
+                          it has been streamed, before the full response is complete
             
         Returns:
             Response dict from Ollama
@@ -292,8 +524,9 @@ class CycleOrchestrator:
         response = self.ollama_interface.execute_chat_completion(
             model_name=self.config.model_name,
             messages=messages,
-            tools=self.tool_dispatcher.get_tool_definitions(),
-            options=self.config.model_options
+            tools=self._tool_definitions,
+            options=self.config.model_options,
+            on_tool_call=on_tool_call
         )
         
         return response
@@ -332,6 +565,30 @@ class CycleOrchestrator:
         
         return result
     
+    def _submit_tool(self, tool_call: Dict, agent_state: AgentState) -> Future:
+        """Start a tool call on its lane's executor and return the pending result.
+        
+        Args:
+            tool_call: Tool call dict from Ollama response
+            agent_state: Current agent state for context (run_id, cycle_number)
+            
+        Returns:
+            Future resolving to the tool's string result
+        """
+        lane = _TOOL_LANES.get(tool_call["function"]["name"], _DEFAULT_TOOL_LANE)
+        return self._lane_executor(lane).submit(self._dispatch_tool, tool_call, agent_state)
+    
+    def _lane_executor(self, lane: str) -> Union[ThreadPoolExecutor, _DaemonLaneExecutor]:
+        """Return the single-worker executor for a lane, creating it on first use."""
+        executor = self._tool_executors.get(lane)
+        if executor is None:
+            if lane in _DAEMON_LANES:
+                executor = _DaemonLaneExecutor(thread_name=f"lane-{lane}")
+            else:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"lane-{lane}")
+            self._tool_executors[lane] = executor
+        return executor
+    
     def _load_state(self, cycle_number: int) -> AgentState:
         """LOAD_STATE: Load or initialize AgentState.
         
@@ -340,11 +597,12 @@ class CycleOrchestrator:
             
         Returns:
             AgentState: Initialized state for this cycle with fresh message_history
+                and the orchestrator's shared reflection_history
         """
         return AgentState(
             run_id=self.config.run_id,
             cycle_number=cycle_number,
             model_name=self.config.model_name,
             message_history=[],  # Always starts empty - populated during cycle execution
-            reflection_history=[]  # Initialized empty - run_experiment() restores from previous cycles
+            reflection_history=self.reflection_history  # Same list every cycle - appended in place
         )
@@ -1,16 +1,22 @@
 # Standard library imports
-from pathlib import Path
 from typing import Dict, Any
 
 # Third-party imports
 import yaml
 
+try:
+    # libyaml-backed C loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Local application imports
 from contreact_ollama.core.config import ExperimentConfig
 from contreact_ollama.core.cycle_orchestrator import CycleOrchestrator
 from contreact_ollama.llm.ollama_interface import OllamaInterface
 from contreact_ollama.logging.jsonl_logger import JsonlLogger
 from contreact_ollama.tools.memory_tools import MemoryTools
+from contreact_ollama.tools.operator_communication import close_telegram_channel
 from contreact_ollama.tools.tool_dispatcher import ToolDispatcher
 from contreact_ollama.analysis.embedding_service import EmbeddingService
 from contreact_ollama.analysis.similarity_monitor import SimilarityMonitor
@@ -53,18 +59,16 @@ class ExperimentRunner:
             >>> print(config.run_id)
             'llama3-experiment-001'
         """
-        # Validate file existence
-        config_file = Path(self.config_path)
-        if not config_file.exists():
+        # Parse YAML file
+        try:
+            # Bytes go straight to the parser, which detects the encoding itself
+            with open(self.config_path, 'rb') as f:
+                config_dict = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Error: Configuration file not found: {self.config_path}\n"
                 f"Please check the file path and try again."
             )
-        
-        # Parse YAML file
-        try:
-            with open(config_file, 'r') as f:
-                config_dict = yaml.safe_load(f)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(
                 f"Error: Invalid YAML syntax in configuration file: {e}\n"
@@ -117,13 +121,45 @@ class ExperimentRunner:
                 f"Please check the sample configuration for expected value types."
             )
         
-        # Create and return ExperimentConfig
-        return ExperimentConfig(**config_dict)
+        # Validate optional field types
+        log_rotate_cycles = config_dict.get('log_rotate_cycles')
+        if log_rotate_cycles is not None:
+            if not isinstance(log_rotate_cycles, int) or isinstance(log_rotate_cycles, bool):
+                raise TypeError(
+                    f"Error: Invalid value for field 'log_rotate_cycles': must be an integer or null\n"
+                    f"Please check the sample configuration for expected value types."
+                )
+            
+            if log_rotate_cycles <= 0:
+                raise ValueError(
+                    f"Error: Invalid value for field 'log_rotate_cycles': must be greater than 0\n"
+                    f"Please check the sample configuration for expected value types."
+                )
+        
+        if not isinstance(config_dict.get('verbose', True), bool):
+            raise TypeError(
+                f"Error: Invalid value for field 'verbose': must be true or false\n"
+                f"Please check the sample configuration for expected value types."
+            )
+        
+        if not isinstance(config_dict.get('operator_response_cache', False), bool):
+            raise TypeError(
+                f"Error: Invalid value for field 'operator_response_cache': must be true or false\n"
+                f"Please check the sample configuration for expected value types."
+            )
+        
+        # Create ExperimentConfig and keep it for initialize_services() and run()
+        self.config = ExperimentConfig(**config_dict)
+        return self.config
     
     def initialize_services(self) -> Dict[str, Any]:
         """
         Initialize all required services (Ollama, Logger, Tools, etc.).
         
+        Services are created once; later calls return the same instances. If
+        initialization fails part-way, the log file and memory database opened
+        so far are closed before the error propagates.
+        
         Returns:
             Dictionary containing initialized service instances
             
@@ -138,41 +174,58 @@ class ExperimentRunner:
             >>> print(services['ollama'])
             <OllamaInterface object>
         """
+        # Services already initialized - reuse them rather than opening a second set
+        if hasattr(self, 'services'):
+            return self.services
+        
         # Load config if not already loaded
-        config = self.load_config()
+        if not hasattr(self, 'config'):
+            self.load_config()
+        config = self.config
         
-        services = {}
+        services: Dict[str, Any] = {}
         
         # Initialize Ollama interface
         host = config.ollama_client_config.get('host', 'http://localhost:11434')
-        ollama_interface = OllamaInterface(host=host)
+        ollama_interface = OllamaInterface(
+            host=host, keep_alive=config.ollama_client_config.get('keep_alive')
+        )
         
         # Verify model availability
         ollama_interface.verify_model_availability(config.model_name)
         
         services['ollama'] = ollama_interface
         
-        # Initialize logger
-        log_file_path = f"logs/{config.run_id}.jsonl"
-        logger = JsonlLogger(log_file_path)
-        services['logger'] = logger
-        
-        # Initialize memory tools
-        db_path = "data/memory.db"
-        memory_tools = MemoryTools(db_path=db_path, run_id=config.run_id)
-        services['memory_tools'] = memory_tools
-        
-        # Initialize tool dispatcher
-        tool_dispatcher = ToolDispatcher(memory_tools=memory_tools, config=config)
-        services['tool_dispatcher'] = tool_dispatcher
-        
-        # Initialize embedding service and similarity monitor
-        embedding_service = EmbeddingService()
-        services['embedding_service'] = embedding_service
-        
-        similarity_monitor = SimilarityMonitor(embedding_service=embedding_service)
-        services['similarity_monitor'] = similarity_monitor
+        try:
+            # Initialize logger
+            log_file_path = f"logs/{config.run_id}.jsonl"
+            logger = JsonlLogger(log_file_path, rotate_every_cycles=config.log_rotate_cycles)
+            services['logger'] = logger
+            
+            # Initialize memory tools
+            db_path = "data/memory.db"
+            memory_tools = MemoryTools(db_path=db_path, run_id=config.run_id)
+            services['memory_tools'] = memory_tools
+            
+            # Initialize tool dispatcher
+            tool_dispatcher = ToolDispatcher(memory_tools=memory_tools, config=config)
+            services['tool_dispatcher'] = tool_dispatcher
+            
+            # Initialize embedding service and similarity monitor
+            embedding_service = EmbeddingService()
+            services['embedding_service'] = embedding_service
+            
+            similarity_monitor = SimilarityMonitor(embedding_service=embedding_service)
+            services['similarity_monitor'] = similarity_monitor
+        except Exception:
+            # Close the log file and memory DB opened so far; run() never sees them
+            for name in ('logger', 'memory_tools'):
+                if name in services:
+                    services[name].close()
+            raise
         
+        # Keep services so run() reuses them instead of initializing a second set
+        self.services: Dict[str, Any] = services
         return services
     
     def run(self) -> None:
@@ -188,9 +241,8 @@ class ExperimentRunner:
         if not hasattr(self, 'config'):
             self.config = self.load_config()
         
-        # Initialize services if not already done
-        if not hasattr(self, 'services'):
-            self.services = self.initialize_services()
+        # Initialize services (no-op if already done)
+        self.initialize_services()
         
         try:
             # Create orchestrator with services
@@ -208,3 +260,6 @@ class ExperimentRunner:
             # Clean up resources
             self.services['logger'].close()
             self.services['memory_tools'].close()
+            close_telegram_channel()
+            # The handles are closed; a later run() must initialize a fresh set
+            del self.services
@@ -5,11 +5,20 @@ Provides interface for interacting with local Ollama server for LLM operations.
 """
 
 # Standard library imports
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
+import asyncio
+import logging
+import re
 
 # Third-party imports
 import ollama
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# str.translate() table deleting ASCII control characters except tab, newline and
+# carriage return, used to clean up malformed tool call arguments
+_CONTROL_CHARS = dict.fromkeys(i for i in range(32) if chr(i) not in '\n\r\t')
 
 
 class ModelNotFoundError(Exception):
@@ -17,6 +26,14 @@ class ModelNotFoundError(Exception):
     pass
 
 
+class _ToolCallbackError(Exception):
+    """Carries an exception raised by an on_tool_call callback out of the stream."""
+    
+    def __init__(self, error: BaseException) -> None:
+        super().__init__(str(error))
+        self.error = error
+
+
 class OllamaInterface:
     """
     Interface for communicating with local Ollama LLM server.
@@ -26,8 +43,14 @@ class OllamaInterface:
     - Executing chat completions with tool support
     - Managing Ollama client connections
     
+    Chat completions are available both blocking (execute_chat_completion) and
+    as a coroutine (aexecute_chat_completion), so independent requests - e.g.
+    separate runs or evaluations - can be overlapped with asyncio.gather() or
+    aexecute_chat_completion_batch().
+    
     Attributes:
         client: Initialized ollama.Client instance
+        aclient: ollama.AsyncClient for the same host, created on first use
         
     Example:
         >>> interface = OllamaInterface(host="http://192.168.0.123:11434")
@@ -35,18 +58,41 @@ class OllamaInterface:
         True
     """
     
-    def __init__(self, host: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        host: str = "http://localhost:11434",
+        keep_alive: Optional[Union[float, str]] = None
+    ):
         """
         Initialize Ollama client with specified host.
         
         Args:
             host: URL of Ollama server (default: http://localhost:11434)
+            keep_alive: How long the server keeps the model loaded after each chat
+                       request (e.g. "30m", or -1 for indefinitely). None uses the
+                       server default of 5 minutes, after which the next request
+                       waits for the model to reload.
             
         Example:
             >>> interface = OllamaInterface()
             >>> interface = OllamaInterface(host="http://192.168.0.123:11434")
         """
+        self.host = host
+        self.keep_alive = keep_alive
         self.client = ollama.Client(host=host)
+        self._aclient: Optional[ollama.AsyncClient] = None
+        
+        # Tool definitions last passed in, and the same definitions validated
+        # into ollama.Tool objects (see _client_tools)
+        self._tools_source: Optional[List[Dict]] = None
+        self._client_tools: List[ollama.Tool] = []
+    
+    @property
+    def aclient(self) -> ollama.AsyncClient:
+        """Async Ollama client, created on first access."""
+        if self._aclient is None:
+            self._aclient = ollama.AsyncClient(host=self.host)
+        return self._aclient
         
     def verify_model_availability(self, model_name: str) -> bool:
         """
@@ -73,7 +119,7 @@ class OllamaInterface:
         try:
             # Get list of available models
             response = self.client.list()
-            available_models = [model.model for model in response.models]
+            available_models = frozenset(model.model for model in response.models)
             
             # Check if requested model is available
             if model_name in available_models:
@@ -95,7 +141,8 @@ class OllamaInterface:
         model_name: str,
         messages: List[Dict],
         tools: List[Dict],
-        options: Dict
+        options: Dict,
+        on_tool_call: Optional[Callable[[Dict], None]] = None
     ) -> Dict:
         """
         Execute LLM chat completion.
@@ -105,12 +152,16 @@ class OllamaInterface:
             messages: Message history in Ollama chat format
             tools: Tool definitions in JSON schema format
             options: Generation parameters (temperature, seed, etc.)
+            on_tool_call: Optional callback invoked with each tool call as soon as it
+                         is complete. When given, the response is streamed so the caller
+                         can start acting on tool calls while the rest is still decoding.
             
         Returns:
             Dict with 'message' key containing role, content, and optional tool_calls
             
         Raises:
-            ollama.ResponseError: On connection or model errors
+            ollama.ResponseError: On connection or model errors. Exceptions raised by
+                on_tool_call propagate unchanged.
             
         Example:
             >>> interface = OllamaInterface()
@@ -122,111 +173,289 @@ class OllamaInterface:
             ... )
         """
         try:
-            response = self.client.chat(
+            if on_tool_call is None:
+                response = self.client.chat(
+                    model=model_name,
+                    messages=messages,
+                    tools=self._prepare_tools(tools),
+                    options=options,
+                    keep_alive=self.keep_alive
+                )
+                return self._response_to_dict(response)
+            
+            role, content, tool_calls = self._stream_chat(
+                model_name, messages, tools, options, on_tool_call
+            )
+            return self._message_to_dict(role, content, tool_calls)
+            
+        except _ToolCallbackError as e:
+            # The caller's own error, not an Ollama one - re-raise it unchanged
+            raise e.error from None
+        except ollama.ResponseError as e:
+            return self._degrade_tool_call_error(e)
+        except Exception as e:
+            raise ollama.ResponseError(f"Error during chat completion: {e}") from e
+    
+    async def aexecute_chat_completion(
+        self,
+        model_name: str,
+        messages: List[Dict],
+        tools: List[Dict],
+        options: Dict
+    ) -> Dict:
+        """
+        Execute LLM chat completion without blocking the event loop.
+        
+        Same arguments, return value and error handling as
+        execute_chat_completion() (without streaming).
+        
+        Example:
+            >>> interface = OllamaInterface()
+            >>> responses = await asyncio.gather(*(
+            ...     interface.aexecute_chat_completion("llama3:latest", msgs, [], {})
+            ...     for msgs in conversations
+            ... ))
+        """
+        try:
+            response = await self.aclient.chat(
                 model=model_name,
                 messages=messages,
-                tools=tools,
-                options=options
+                tools=self._prepare_tools(tools),
+                options=options,
+                keep_alive=self.keep_alive
             )
+            return self._response_to_dict(response)
+        except ollama.ResponseError as e:
+            return self._degrade_tool_call_error(e)
+        except Exception as e:
+            raise ollama.ResponseError(f"Error during chat completion: {e}") from e
+    
+    async def aexecute_chat_completion_batch(self, requests: List[Dict]) -> List[Dict]:
+        """
+        Execute several independent chat completions concurrently.
+        
+        All requests are sent at once over the async client, so the Ollama
+        server can process them in parallel (up to its OLLAMA_NUM_PARALLEL)
+        instead of one after another.
+        
+        Args:
+            requests: Keyword arguments for aexecute_chat_completion(), one dict
+                     per completion (model_name, messages, tools, options)
             
-            # Convert ChatResponse object to dict format
-            # The response object has a 'message' attribute with role, content, tool_calls
-            message_dict = {
-                "role": response.message.role,
-                "content": response.message.content or ""
-            }
+        Returns:
+            Response dicts in the same order as requests
             
-            # Include tool_calls if present
-            if hasattr(response.message, 'tool_calls') and response.message.tool_calls:
-                tool_calls = []
-                for tc in response.message.tool_calls:
-                    # Sanitize arguments - ensure they're valid JSON
-                    # Ollama may return arguments as dict, string, or malformed text
-                    arguments = tc.function.arguments
-                    
-                    # If arguments is a string, validate/sanitize it
-                    if isinstance(arguments, str):
-                        # Check if it starts with JSON structure indicators
-                        stripped = arguments.strip()
-                        if not (stripped.startswith('{') or stripped.startswith('[')):
-                            # Not JSON at all - model returned raw text
-                            print(f"Warning: Tool call '{tc.function.name}' returned non-JSON text instead of arguments")
-                            print(f"Raw text: {arguments[:200]}...")  # Show first 200 chars
-                            arguments = {}
-                        else:
-                            try:
-                                # Try to parse as JSON to validate
-                                parsed_args = json.loads(arguments)
-                                arguments = parsed_args
-                            except json.JSONDecodeError as e:
-                                # If parsing fails, try to sanitize the string
-                                # This handles cases where special characters aren't properly escaped
-                                print(f"Warning: JSON parsing failed for tool call '{tc.function.name}': {e}")
-                                print(f"Raw arguments: {arguments[:200]}...")  # Show first 200 chars
-                                
-                                # Try to fix common issues
-                                try:
-                                    # Attempt to clean up the JSON by removing control characters
-                                    cleaned = ''.join(char for char in arguments if ord(char) >= 32 or char in '\n\r\t')
-                                    parsed_args = json.loads(cleaned)
-                                    arguments = parsed_args
-                                    print("Successfully cleaned and parsed arguments")
-                                except Exception:
-                                    # If all else fails, use empty dict
-                                    print("Could not recover - using empty arguments")
-                                    arguments = {}
+        Raises:
+            ollama.ResponseError: If any completion fails (after all have finished)
+            
+        Example:
+            >>> interface = OllamaInterface()
+            >>> responses = await interface.aexecute_chat_completion_batch([
+            ...     {"model_name": "llama3:latest", "messages": msgs, "tools": [], "options": {}}
+            ...     for msgs in conversations
+            ... ])
+        """
+        results = await asyncio.gather(
+            *(self.aexecute_chat_completion(**request) for request in requests),
+            return_exceptions=True
+        )
+        
+        responses = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            responses.append(result)
+        
+        return responses
+    
+    def _prepare_tools(self, tools: List[Dict]) -> List[ollama.Tool]:
+        """
+        Tool definitions as ollama.Tool objects, validated once per definitions list.
+        
+        The client validates every dict tool on each request but passes Tool
+        instances through, so a run's fixed tool list is converted only when
+        a different list object is passed in.
+        
+        Args:
+            tools: Tool definitions in JSON schema format (not modified in place
+                   between calls)
+            
+        Returns:
+            The same definitions as validated ollama.Tool objects
+        """
+        if tools is not self._tools_source:
+            self._client_tools = [ollama.Tool.model_validate(tool) for tool in tools]
+            self._tools_source = tools
+        return self._client_tools
+    
+    def _response_to_dict(self, response: Any) -> Dict:
+        """Convert a non-streamed Ollama chat response to the interface's dict format."""
+        # The response object has a 'message' attribute with role, content, tool_calls
+        message = response.message
+        tool_calls = [self._convert_tool_call(tc) for tc in message.tool_calls or ()]
+        return self._message_to_dict(message.role, message.content or "", tool_calls)
+    
+    def _message_to_dict(self, role: str, content: str, tool_calls: List[Dict]) -> Dict:
+        """Build the {'message': {...}} response dict, with tool_calls only if present."""
+        message_dict: Dict[str, Any] = {
+            "role": role,
+            "content": content
+        }
+        
+        # Include tool_calls if present
+        if tool_calls:
+            message_dict["tool_calls"] = tool_calls
+        
+        return {"message": message_dict}
+    
+    def _degrade_tool_call_error(self, e: ollama.ResponseError) -> Dict:
+        """
+        Turn a server-side tool call parsing error into a text response.
+        
+        Args:
+            e: Error raised by the Ollama client
+            
+        Returns:
+            Assistant message dict with any content recovered from the malformed call
+            
+        Raises:
+            ollama.ResponseError: If e is not a tool call parsing error
+        """
+        # Check if this is a server-side tool call parsing error
+        error_msg = str(e)
+        if "error parsing tool call" not in error_msg.lower():
+            # Re-raise if it's not a tool call parsing error
+            raise e
+        
+        print(f"\n⚠️  WARNING: Model produced malformed tool call")
+        print(f"    Error: {error_msg[:200]}{'...' if len(error_msg) > 200 else ''}")
+        print(f"    Degrading to text response to continue experiment\n")
+        
+        # Try to extract any readable content from the error message
+        # The error format is: "error parsing tool call: raw='<content>', err=<error>"
+        raw_match = re.search(r"raw='({.*?})'", error_msg)
+        if raw_match:
+            try:
+                raw_json = orjson.loads(raw_match.group(1))
+                if isinstance(raw_json, dict) and "message" in raw_json:
+                    content = raw_json["message"]
+                    print(f"    Extracted content from malformed call (first 200 chars):")
+                    print(f"    {content[:200]}{'...' if len(content) > 200 else ''}\n")
                     
-                    tool_calls.append({
-                        "id": getattr(tc, 'id', None),
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": arguments
+                    # Return as a text response (FINAL_REFLECTION)
+                    return {
+                        "message": {
+                            "role": "assistant",
+                            "content": content
                         }
-                    })
-                
-                message_dict["tool_calls"] = tool_calls
+                    }
+            except Exception:
+                pass
+        
+        # If extraction fails, return a generic error message
+        return {
+            "message": {
+                "role": "assistant",
+                "content": "[Error: Model produced malformed output that could not be parsed]"
+            }
+        }
+    
+    def _stream_chat(
+        self,
+        model_name: str,
+        messages: List[Dict],
+        tools: List[Dict],
+        options: Dict,
+        on_tool_call: Callable[[Dict], None]
+    ) -> Tuple[str, str, List[Dict]]:
+        """
+        Stream a chat completion, reporting each tool call as soon as it arrives.
+        
+        Args:
+            model_name: Tag of model to use
+            messages: Message history in Ollama chat format
+            tools: Tool definitions in JSON schema format
+            options: Generation parameters
+            on_tool_call: Callback invoked with each converted tool call
             
-            return {"message": message_dict}
+        Returns:
+            Tuple of (role, full content, converted tool calls)
+        """
+        role = "assistant"
+        content_parts = []
+        tool_calls = []
+        
+        for chunk in self.client.chat(
+            model=model_name,
+            messages=messages,
+            tools=self._prepare_tools(tools),
+            options=options,
+            keep_alive=self.keep_alive,
+            stream=True
+        ):
+            message = chunk.message
+            role = message.role or role
+            if message.content:
+                content_parts.append(message.content)
             
-        except ollama.ResponseError as e:
-            # Check if this is a server-side tool call parsing error
-            error_msg = str(e)
-            if "error parsing tool call" in error_msg.lower():
-                print(f"\n⚠️  WARNING: Model produced malformed tool call")
-                print(f"    Error: {error_msg[:200]}{'...' if len(error_msg) > 200 else ''}")
-                print(f"    Degrading to text response to continue experiment\n")
-                
-                # Try to extract any readable content from the error message
-                # The error format is: "error parsing tool call: raw='<content>', err=<error>"
-                import re
-                raw_match = re.search(r"raw='({.*?})'", error_msg)
-                if raw_match:
-                    try:
-                        raw_json = json.loads(raw_match.group(1))
-                        if isinstance(raw_json, dict) and "message" in raw_json:
-                            content = raw_json["message"]
-                            print(f"    Extracted content from malformed call (first 200 chars):")
-                            print(f"    {content[:200]}{'...' if len(content) > 200 else ''}\n")
-                            
-                            # Return as a text response (FINAL_REFLECTION)
-                            return {
-                                "message": {
-                                    "role": "assistant",
-                                    "content": content
-                                }
-                            }
-                    except Exception:
-                        pass
+            # Ollama emits each tool call whole, in a single chunk
+            for tc in message.tool_calls or []:
+                tool_call = self._convert_tool_call(tc)
+                tool_calls.append(tool_call)
+                try:
+                    on_tool_call(tool_call)
+                except Exception as e:
+                    raise _ToolCallbackError(e) from e
+        
+        return role, "".join(content_parts), tool_calls
+    
+    def _convert_tool_call(self, tc: Any) -> Dict:
+        """
+        Convert an Ollama tool call object to a dict with sanitized arguments.
+        
+        Args:
+            tc: Tool call from an Ollama chat response
+            
+        Returns:
+            Dict with 'id' and 'function' (name and arguments dict)
+        """
+        # Sanitize arguments - ensure they're valid JSON
+        # Ollama may return arguments as dict, string, or malformed text
+        arguments = tc.function.arguments
+        
+        # If arguments is a string, parse it; only malformed strings pay for cleanup
+        if isinstance(arguments, str):
+            try:
+                arguments = orjson.loads(arguments)
+            except orjson.JSONDecodeError as e:
+                # If parsing fails, try to sanitize the string
+                # This handles cases where special characters aren't properly escaped
+                logger.warning(
+                    "JSON parsing failed for tool call %r: %s. Raw arguments: %.200s...",
+                    tc.function.name, e, arguments
+                )
                 
-                # If extraction fails, return a generic error message
-                return {
-                    "message": {
-                        "role": "assistant",
-                        "content": "[Error: Model produced malformed output that could not be parsed]"
-                    }
-                }
-            else:
-                # Re-raise if it's not a tool call parsing error
-                raise
-        except Exception as e:
-            raise ollama.ResponseError(f"Error during chat completion: {e}")
+                try:
+                    # Attempt to clean up the JSON by removing control characters
+                    arguments = orjson.loads(arguments.translate(_CONTROL_CHARS))
+                    logger.info("Successfully cleaned and parsed arguments")
+                except orjson.JSONDecodeError:
+                    # If all else fails, use empty dict
+                    logger.warning("Could not recover - using empty arguments")
+                    arguments = {}
+            
+            if not isinstance(arguments, (dict, list)):
+                # Valid JSON but a bare scalar (e.g. quoted raw text) - not arguments
+                logger.warning(
+                    "Tool call %r returned non-JSON text instead of arguments. Raw text: %.200s...",
+                    tc.function.name, arguments
+                )
+                arguments = {}
+        
+        return {
+            "id": getattr(tc, 'id', None),
+            "function": {
+                "name": tc.function.name,
+                "arguments": arguments
+            }
+        }
@@ -12,62 +12,104 @@ from typing import List, Dict, Any, Optional
 from contreact_ollama.state.agent_state import AgentState
 
 
-def build_prompt(
+def _build_system_prompt_prefix(
     agent_state: AgentState,
     system_prompt: str,
-    tool_definitions: List[Dict],
-    diversity_feedback: Optional[str] = None
-) -> List[Dict[str, str]]:
+    tool_definitions: List[Dict]
+) -> str:
     """
-    Construct the full prompt for LLM invocation.
+    Build the system prompt with tool definitions and reflection history appended.
     
     Args:
-        agent_state: Current agent state with message history and reflection history
+        agent_state: Agent state whose reflection_history is included
         system_prompt: Base system prompt text
         tool_definitions: Structured tool definitions in JSON schema format
-        diversity_feedback: Optional advisory feedback from SimilarityMonitor
         
     Returns:
-        List of message dictionaries formatted for ollama.chat method
-        
-    Example:
-        >>> prompt = build_prompt(agent_state, SYSTEM_PROMPT, tool_defs)
-        >>> # Returns: [{"role": "system", "content": "..."}, ...]
+        System prompt text without the per-call diversity feedback
     """
-    messages = []
-    
-    # Construct system prompt
-    full_system_prompt = system_prompt
+    # Construct system prompt from parts joined once at the end
+    parts = [system_prompt]
     
     # Append tool definitions so agent knows what tools are available
     if tool_definitions:
-        full_system_prompt += "\n\n## Available Tools\n"
-        full_system_prompt += "You have access to the following tools:\n\n"
+        parts.append("\n\n## Available Tools\n")
+        parts.append("You have access to the following tools:\n\n")
         for tool in tool_definitions:
             tool_name = tool.get("function", {}).get("name", "unknown")
             tool_desc = tool.get("function", {}).get("description", "No description")
             tool_params = tool.get("function", {}).get("parameters", {})
             
-            full_system_prompt += f"### {tool_name}\n"
-            full_system_prompt += f"{tool_desc}\n\n"
+            parts.append(f"### {tool_name}\n")
+            parts.append(f"{tool_desc}\n\n")
             
             # Add parameter details
             if tool_params.get("properties"):
-                full_system_prompt += "Parameters:\n"
+                parts.append("Parameters:\n")
                 for param_name, param_info in tool_params["properties"].items():
                     param_type = param_info.get("type", "unknown")
                     param_desc = param_info.get("description", "")
                     required = "required" if param_name in tool_params.get("required", []) else "optional"
-                    full_system_prompt += f"  - {param_name} ({param_type}, {required}): {param_desc}\n"
-                full_system_prompt += "\n"
+                    parts.append(f"  - {param_name} ({param_type}, {required}): {param_desc}\n")
+                parts.append("\n")
     
     # Append reflection history from previous cycles if available
     if agent_state.reflection_history:
-        reflection_context = "\n\n## Your Previous Reflections\n"
-        reflection_context += "These are your private notes from previous cycles:\n\n"
+        parts.append("\n\n## Your Previous Reflections\n")
+        parts.append("These are your private notes from previous cycles:\n\n")
         for i, reflection in enumerate(agent_state.reflection_history, start=1):
-            reflection_context += f"**Cycle {i}**: {reflection}\n\n"
-        full_system_prompt += reflection_context
+            parts.append(f"**Cycle {i}**: {reflection}\n\n")
+    
+    return "".join(parts)
+
+
+def build_prompt(
+    agent_state: AgentState,
+    system_prompt: str,
+    tool_definitions: List[Dict],
+    diversity_feedback: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Construct the full prompt for LLM invocation.
+    
+    The system prompt with tools and reflections is cached on agent_state
+    (system_prompt_prefix) the first time, so later ReAct turns of the same
+    cycle only append the diversity feedback and message history. The cache
+    is rebuilt if the system prompt, the tool definitions list or the number
+    of reflections changes.
+    
+    Args:
+        agent_state: Current agent state with message history and reflection history
+        system_prompt: Base system prompt text
+        tool_definitions: Structured tool definitions in JSON schema format
+        diversity_feedback: Optional advisory feedback from SimilarityMonitor
+        
+    Returns:
+        List of message dictionaries formatted for ollama.chat method
+        
+    Example:
+        >>> prompt = build_prompt(agent_state, SYSTEM_PROMPT, tool_defs)
+        >>> # Returns: [{"role": "system", "content": "..."}, ...]
+    """
+    messages = []
+    
+    # Tool definitions and reflections do not change within a cycle, so the
+    # prefix is built on the first ReAct turn and reused while its inputs match
+    cached_inputs = agent_state.system_prompt_prefix_inputs
+    if (
+        agent_state.system_prompt_prefix is None
+        or cached_inputs is None
+        or cached_inputs[1] is not tool_definitions
+        or cached_inputs[2] != len(agent_state.reflection_history)
+        or cached_inputs[0] != system_prompt
+    ):
+        agent_state.system_prompt_prefix = _build_system_prompt_prefix(
+            agent_state, system_prompt, tool_definitions
+        )
+        agent_state.system_prompt_prefix_inputs = (
+            system_prompt, tool_definitions, len(agent_state.reflection_history)
+        )
+    full_system_prompt = agent_state.system_prompt_prefix
     
     # Append diversity feedback if provided
     if diversity_feedback:
@@ -10,6 +10,11 @@ import re
 from typing import Dict, Tuple, Any, List, Optional
 
 
+# <thinking>...</thinking> block, including newlines within; compiled once
+_THINKING_TAG = "<thinking>"
+_THINKING_RE = re.compile(r'<thinking>(.*?)</thinking>', re.DOTALL)
+
+
 def extract_thinking_content(content: str) -> Optional[str]:
     """
     Extract content from <thinking>...</thinking> tags.
@@ -28,7 +33,11 @@ def extract_thinking_content(content: str) -> Optional[str]:
         >>> extract_thinking_content(content)
         'My reasoning here'
     """
-    match = re.search(r'<thinking>(.*?)</thinking>', content, flags=re.DOTALL)
+    # Plain substring scan is cheaper than running the regex on tag-free content
+    if _THINKING_TAG not in content:
+        return None
+    
+    match = _THINKING_RE.search(content)
     if match:
         return match.group(1).strip()
     return None
@@ -55,7 +64,10 @@ def strip_thinking_tags(content: str) -> str:
         '<list/>'
     """
     # Remove <thinking>...</thinking> blocks (including newlines within)
-    cleaned = re.sub(r'<thinking>.*?</thinking>', '', content, flags=re.DOTALL)
+    if _THINKING_TAG in content:
+        cleaned = _THINKING_RE.sub('', content)
+    else:
+        cleaned = content
     
     # Clean up extra whitespace left behind
     cleaned = cleaned.strip()
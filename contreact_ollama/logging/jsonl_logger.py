@@ -1,15 +1,19 @@
 """Event logging service for experimental events."""
 
 # Standard library imports
-import json
-from dataclasses import dataclass, asdict
+import gzip
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, IO, Iterator, List, Optional, Tuple, Union
 
 # Third-party imports
-# (none for this file)
+import orjson
 
 # Local application imports
 # (none for this file)
@@ -24,6 +28,162 @@ class EventType(Enum):
     CYCLE_END = "CYCLE_END"
 
 
+# Size of the in-process write buffer; full buffers are written out immediately
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# orjson options: newline-terminated lines, numpy arrays serialized natively,
+# and non-string dict keys (e.g. ints in tool arguments) coerced as json.dumps did
+_ORJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Rotated log segments: "<run_id>.0001.segment" while awaiting compression,
+# then "<run_id>.0001.jsonl.gz"
+_SEGMENT_SUFFIX = ".segment"
+_COMPRESSED_SUFFIX = ".jsonl.gz"
+
+# Chunk size used when streaming a segment through gzip
+_COMPRESS_CHUNK_SIZE = 1024 * 1024
+
+# Canonical per-message encoding fed to the rolling prompt hash
+_HASH_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _segment_files(log_file_path: Path) -> List[Path]:
+    """Rotated segments of a log, oldest first, preferring compressed copies."""
+    segments: Dict[int, Path] = {}
+    for path in log_file_path.parent.glob(f"{log_file_path.stem}.*"):
+        index, _, suffix = path.name[len(log_file_path.stem) + 1:].partition('.')
+        if not index.isdigit() or '.' + suffix not in (_SEGMENT_SUFFIX, _COMPRESSED_SUFFIX):
+            continue
+        if '.' + suffix == _COMPRESSED_SUFFIX or int(index) not in segments:
+            segments[int(index)] = path
+    return [segments[index] for index in sorted(segments)]
+
+
+def _compress_segment(segment: Path) -> None:
+    """Gzip a closed log segment next to it, then remove the uncompressed file."""
+    target = segment.with_suffix(_COMPRESSED_SUFFIX)
+    partial = target.with_name(target.name + ".tmp")
+    with open(segment, 'rb') as src, gzip.open(partial, 'wb') as dst:
+        shutil.copyfileobj(src, dst, _COMPRESS_CHUNK_SIZE)
+    # Publish atomically so readers never see a truncated archive
+    os.replace(partial, target)
+    segment.unlink()
+
+
+def _open_segment(segment: Path) -> IO[str]:
+    """Open a rotated segment for reading, following it to its compressed copy if needed."""
+    if segment.name.endswith(_COMPRESSED_SUFFIX):
+        return gzip.open(segment, 'rt', encoding='utf-8')
+    try:
+        return open(segment, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        # Compressed and removed by the background compressor since it was listed
+        return gzip.open(segment.with_suffix(_COMPRESSED_SUFFIX), 'rt', encoding='utf-8')
+
+
+def iter_log_lines(log_file_path: Union[str, Path]) -> Iterator[str]:
+    """
+    Iterate over the lines of a JSONL log, including rotated segments.
+    
+    Args:
+        log_file_path: Path of the active log file (e.g. logs/<run_id>.jsonl)
+        
+    Yields:
+        Log lines in the order they were written: compressed or pending
+        segments first, then the active file
+        
+    Raises:
+        FileNotFoundError: If neither the log file nor any segment exists
+    """
+    log_file_path = Path(log_file_path)
+    segments = _segment_files(log_file_path)
+    
+    for segment in segments:
+        with _open_segment(segment) as f:
+            yield from f
+    
+    if segments and not log_file_path.exists():
+        # Run ended right after a rotation
+        return
+    
+    with open(log_file_path, 'r', encoding='utf-8') as f:
+        yield from f
+
+
+def new_prompt_hash() -> hashlib.blake2b:
+    """Empty rolling hash for the prompt transcript of one cycle."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def update_prompt_hash(prompt_hash: hashlib.blake2b, messages: List[Dict[str, Any]]) -> str:
+    """
+    Extend a rolling prompt hash with newly appended messages.
+    
+    Args:
+        prompt_hash: Hash from new_prompt_hash(), updated in place
+        messages: Messages appended to the prompt since the last update
+        
+    Returns:
+        Hex digest of the whole transcript hashed so far
+    """
+    for message in messages:
+        prompt_hash.update(orjson.dumps(message, option=_HASH_OPTIONS))
+    return prompt_hash.hexdigest()
+
+
+def expand_prompt_messages(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Rebuild full prompt_messages for LLM_INVOCATION events logged as deltas.
+    
+    Within a cycle the prompt only grows, so the orchestrator logs each turn
+    as "prompt_offset" (messages already logged this cycle), "prompt_suffix"
+    (the new messages) and "prompt_hash_so_far" (rolling hash of the transcript).
+    This replays the suffixes per (run_id, cycle_number) and adds the full
+    "prompt_messages" list to each such payload. Events that already carry
+    prompt_messages (older logs) are left unchanged.
+    
+    Args:
+        events: Parsed log events in file order; payloads are updated in place
+        
+    Returns:
+        The same list of events
+        
+    Raises:
+        ValueError: If a delta does not continue the transcript reconstructed
+                    so far for its cycle, or its hash does not match
+    """
+    transcripts: Dict[Tuple[Any, Any], Tuple[List[Dict[str, Any]], hashlib.blake2b]] = {}
+    
+    for event in events:
+        if event.get('event_type') != EventType.LLM_INVOCATION.value:
+            continue
+        payload = event.get('payload') or {}
+        if 'prompt_suffix' not in payload:
+            continue
+        
+        key = (event.get('run_id'), event.get('cycle_number'))
+        offset = payload.get('prompt_offset', 0)
+        if offset == 0:
+            transcripts[key] = ([], new_prompt_hash())
+        messages, prompt_hash = transcripts.get(key, ([], None))
+        
+        if prompt_hash is None or offset != len(messages):
+            raise ValueError(
+                f"Prompt delta at offset {offset} does not continue the "
+                f"transcript of cycle {key[1]} ({len(messages)} messages)"
+            )
+        
+        messages.extend(payload['prompt_suffix'])
+        digest = update_prompt_hash(prompt_hash, payload['prompt_suffix'])
+        expected = payload.get('prompt_hash_so_far')
+        if expected is not None and expected != digest:
+            raise ValueError(f"Prompt hash mismatch in cycle {key[1]} at offset {offset}")
+        
+        payload['prompt_messages'] = list(messages)
+    
+    return events
+
+
 @dataclass
 class LogRecord:
     """A single, structured log entry for an experimental event."""
@@ -36,35 +196,54 @@ class LogRecord:
 
 
 class JsonlLogger:
-    """Centralized logging service for all experimental events."""
+    """
+    Centralized logging service for all experimental events.
+    
+    Events are buffered in process and written to disk at the end of each
+    cycle (CYCLE_END), when the buffer fills, on flush(), or on close().
+    
+    With rotation enabled, the log is closed every rotate_every_cycles cycles
+    and moved to a numbered segment that a background thread gzips; logging
+    continues in a fresh file at the same path. Read rotated logs with
+    iter_log_lines().
+    """
     
-    def __init__(self, log_file_path: str):
+    def __init__(self, log_file_path: str, rotate_every_cycles: Optional[int] = None):
         """
         Initialize logger with output file path.
         
         Args:
             log_file_path: Path to .jsonl log file
+            rotate_every_cycles: Rotate and compress the log after every this many
+                                cycles. None (default) keeps a single file.
             
         Creates parent directories if they don't exist.
-        Opens file in append mode.
+        Opens file in buffered binary append mode.
         """
         self.log_file_path = Path(log_file_path)
+        self.rotate_every_cycles = rotate_every_cycles
+        
+        # Continue numbering after segments left by an earlier run with this path
+        self._segment_count = len(_segment_files(self.log_file_path))
+        
+        # Single background worker for segment compression, started on first rotation
+        self._compressor: Optional[ThreadPoolExecutor] = None
         
         # Ensure parent directory exists
         self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Open file in append mode
-        self.file_handle = open(self.log_file_path, 'a', encoding='utf-8')
+        # Open file in append mode with a large buffer to batch write() syscalls
+        self.file_handle = open(self.log_file_path, 'ab', buffering=WRITE_BUFFER_SIZE)
         
-    def log_event(
-        self, 
-        run_id: str, 
-        cycle_number: int, 
-        event_type: EventType, 
+    def create_record(
+        self,
+        run_id: str,
+        cycle_number: int,
+        event_type: EventType,
         payload: Dict[str, Any]
-    ) -> None:
+    ) -> LogRecord:
         """
-        Log a single event to the file.
+        Create a log record timestamped now, without writing it.
         
         Args:
             run_id: Experiment run identifier
@@ -72,32 +251,109 @@ class JsonlLogger:
             event_type: Type of event (EventType enum value)
             payload: Event-specific data
             
-        Writes a single JSON line to the log file.
+        Returns:
+            LogRecord to pass to log_events()
         """
         # Create timestamp in ISO 8601 format
         timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
         
-        # Create log record
-        log_record = LogRecord(
+        return LogRecord(
             timestamp=timestamp,
             run_id=run_id,
             cycle_number=cycle_number,
             event_type=event_type.value,  # Convert enum to string
             payload=payload
         )
+    
+    def log_event(
+        self, 
+        run_id: str, 
+        cycle_number: int, 
+        event_type: EventType, 
+        payload: Dict[str, Any]
+    ) -> None:
+        """
+        Log a single event to the file.
+        
+        Args:
+            run_id: Experiment run identifier
+            cycle_number: Current cycle number
+            event_type: Type of event (EventType enum value)
+            payload: Event-specific data
+            
+        Writes a single JSON line to the log buffer. CYCLE_END events flush
+        the buffer so each completed cycle is durable on disk.
+        """
+        self.log_events([self.create_record(run_id, cycle_number, event_type, payload)])
+    
+    def log_events(self, records: List[LogRecord]) -> None:
+        """
+        Log several events with a single write.
+        
+        Args:
+            records: Records from create_record(), in the order they occurred
+            
+        Serializes all records into one block of JSON lines. A CYCLE_END
+        record flushes the buffer, as in log_event().
+        """
+        if not records:
+            return
+        
+        # Convert each record to a JSON line and join into one blob.
+        # The dict is built directly rather than with asdict(), which would
+        # deep-copy every payload (including full prompt histories) first.
+        blob = b''.join(
+            orjson.dumps(
+                {
+                    "timestamp": record.timestamp,
+                    "run_id": record.run_id,
+                    "cycle_number": record.cycle_number,
+                    "event_type": record.event_type,
+                    "payload": record.payload,
+                },
+                option=_ORJSON_OPTIONS
+            )
+            for record in records
+        )
+        self.file_handle.write(blob)
         
-        # Convert to dict and then to JSON
-        record_dict = asdict(log_record)
-        json_line = json.dumps(record_dict)
+        cycle_ends = [
+            record.cycle_number for record in records
+            if record.event_type == EventType.CYCLE_END.value
+        ]
+        if cycle_ends:
+            self.flush()
+            if self.rotate_every_cycles and cycle_ends[-1] % self.rotate_every_cycles == 0:
+                self._rotate()
+    
+    def _rotate(self) -> None:
+        """Close the current log as a numbered segment, queue it for gzip and reopen."""
+        self.file_handle.close()
+        
+        self._segment_count += 1
+        segment = self.log_file_path.with_name(
+            f"{self.log_file_path.stem}.{self._segment_count:04d}{_SEGMENT_SUFFIX}"
+        )
+        os.replace(self.log_file_path, segment)
         
-        # Write to file with newline
-        self.file_handle.write(json_line + '\n')
-        self.file_handle.flush()  # Ensure immediate write
+        self.file_handle = open(self.log_file_path, 'ab', buffering=WRITE_BUFFER_SIZE)
+        
+        if self._compressor is None:
+            self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+        self._compressor.submit(_compress_segment, segment)
+    
+    def flush(self) -> None:
+        """Write buffered events to the log file."""
+        self.file_handle.flush()
         
     def close(self) -> None:
-        """Close the log file handle."""
+        """Close the log file handle and wait for pending segment compression."""
         if hasattr(self, 'file_handle') and self.file_handle:
             self.file_handle.close()
+        compressor = getattr(self, '_compressor', None)
+        if compressor is not None:
+            compressor.shutdown(wait=True)
+            self._compressor = None
             
     def __enter__(self):
         """Context manager entry."""
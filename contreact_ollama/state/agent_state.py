@@ -1,6 +1,6 @@
 # Standard library imports
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 
 @dataclass
@@ -18,6 +18,15 @@ class AgentState:
             Each message is a dict with 'role' and 'content' keys.
             Roles: 'system', 'user', 'assistant', 'tool'
         reflection_history: List of final reflection strings from each cycle
+        cycle_metrics: Counters collected while executing the cycle
+            (memory_ops_total, messages_to_operator, response_chars, memory_write_chars).
+            Empty until the cycle has executed.
+        system_prompt_prefix: System prompt text with tool definitions and
+            reflection history, built by build_prompt() on the first ReAct turn
+            and reused for the rest of the cycle. None until then.
+        system_prompt_prefix_inputs: (system_prompt, tool_definitions, number of
+            reflections) the cached prefix was built from; build_prompt() rebuilds
+            the prefix when any of them changes.
     """
     
     run_id: str
@@ -25,3 +34,8 @@ class AgentState:
     model_name: str
     message_history: List[Dict[str, Any]] = field(default_factory=list)
     reflection_history: List[str] = field(default_factory=list)
+    cycle_metrics: Dict[str, int] = field(default_factory=dict)
+    system_prompt_prefix: Optional[str] = field(default=None, repr=False)
+    system_prompt_prefix_inputs: Optional[Tuple[str, List[Dict], int]] = field(
+        default=None, repr=False, compare=False
+    )
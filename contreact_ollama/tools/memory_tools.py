@@ -1,10 +1,68 @@
 """Persistent memory storage for agent experiments using TinyDB."""
 
 # Standard library imports
+import os
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type
 
 # Third-party imports
 from tinydb import TinyDB, Query
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import JSONStorage, Storage
+
+
+class _WriteThroughCache(CachingMiddleware):
+    """
+    Serve reads from memory and write every change straight to disk.
+    
+    Plain JSONStorage parses the whole file on every operation, and again
+    before each write. This keeps the parsed data in memory, so each write
+    costs a single dump. Writes are never deferred, so the file stays
+    current for readers such as the dashboard.
+    
+    Other runs may share the same file. Before each operation the file's
+    modification time and size are compared with those seen after the last
+    read or write, and the cache is dropped if another writer changed them.
+    Each such drop increments reloads.
+    """
+    
+    WRITE_CACHE_SIZE = 1
+    
+    def __init__(self, storage_cls: Type[Storage]) -> None:
+        super().__init__(storage_cls)
+        self._path: Optional[str] = None
+        self._file_state: Optional[Tuple[int, int]] = None
+        self.reloads = 0
+        
+    def __call__(self, path: str, *args: Any, **kwargs: Any) -> "_WriteThroughCache":
+        self._path = path
+        super().__call__(path, *args, **kwargs)
+        return self
+        
+    def _stat(self) -> Tuple[int, int]:
+        assert self._path is not None
+        stat = os.stat(self._path)
+        return stat.st_mtime_ns, stat.st_size
+        
+    def refresh(self) -> None:
+        """Drop the cache if another writer changed the file."""
+        if self.cache is not None and self._stat() != self._file_state:
+            self.cache = None
+            self.reloads += 1
+        
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        self.refresh()
+        
+        if self.cache is None:
+            self.cache = self.storage.read()
+            self._file_state = self._stat()
+            
+        cache: Optional[Dict[str, Dict[str, Any]]] = self.cache
+        return cache
+        
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        super().write(data)
+        self._file_state = self._stat()
 
 
 class MemoryTools:
@@ -15,6 +73,13 @@ class MemoryTools:
     across multiple cycles. Uses TinyDB for lightweight file-based storage
     with run_id isolation for multi-tenant experiments.
     
+    TinyDB has no indexes, so this class keeps an in-memory map from each of
+    the run's keys to its document ID. Key lookups then fetch one document
+    by ID instead of scanning the whole table, and list() and
+    pattern_search() need no database access at all. Other runs may write
+    the same file concurrently, but the map assumes a single MemoryTools
+    instance writes a given run_id at a time.
+    
     Example:
         >>> memory = MemoryTools(db_path="data/memory.db", run_id="exp-001")
         >>> memory.write("task_status", "in_progress")
@@ -43,8 +108,16 @@ class MemoryTools:
         # Ensure parent directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize TinyDB
-        self.db = TinyDB(self.db_path)
+        # Initialize TinyDB with a read cache that reloads on external writes
+        self._storage = _WriteThroughCache(JSONStorage)
+        self.db = TinyDB(self.db_path, storage=self._storage)
+        self._table = self.db.table(self.db.default_table_name)
+        self._table_reloads = self._storage.reloads
+        
+        # Document ID of each key stored for this run, in insertion order
+        self._key_index: Dict[str, int] = {}
+        for entry in self.db.search(Query().run_id == run_id):
+            self._key_index.setdefault(entry['key'], entry.doc_id)
         
     def write(self, key: str, value: str) -> str:
         """
@@ -60,21 +133,23 @@ class MemoryTools:
         Overwrites existing value if key already exists.
         Scoped to current run_id for isolation.
         """
-        Entry = Query()
+        doc_id = self._key_index.get(key)
         
-        # Check if entry exists
-        existing = self.db.search((Entry.run_id == self.run_id) & (Entry.key == key))
-        
-        if existing:
+        if doc_id is not None:
             # Update existing entry
-            self.db.update(
-                {'value': value},
-                (Entry.run_id == self.run_id) & (Entry.key == key)
-            )
+            self.db.update({'value': value}, doc_ids=[doc_id])
             return f"Updated key '{key}' with new value"
         else:
+            # A table caches its next document ID; if the file was reloaded
+            # since the table was built (by this or any earlier operation),
+            # another writer may have used that ID, so a fresh table recomputes it
+            self._storage.refresh()
+            if self._storage.reloads != self._table_reloads:
+                self._table = self.db.table_class(self.db.storage, self.db.default_table_name)
+                self._table_reloads = self._storage.reloads
+                
             # Insert new entry
-            self.db.insert({
+            self._key_index[key] = self._table.insert({
                 'run_id': self.run_id,
                 'key': key,
                 'value': value
@@ -91,11 +166,10 @@ class MemoryTools:
         Returns:
             The stored value, or error message if key not found
         """
-        Entry = Query()
-        result = self.db.search((Entry.run_id == self.run_id) & (Entry.key == key))
+        doc_id = self._key_index.get(key)
         
-        if result:
-            return result[0]['value']
+        if doc_id is not None:
+            return self.db.get(doc_id=doc_id)['value']
         else:
             return f"Error: Key '{key}' not found"
             
@@ -106,12 +180,8 @@ class MemoryTools:
         Returns:
             Comma-separated string of keys, or message if no keys exist
         """
-        Entry = Query()
-        results = self.db.search(Entry.run_id == self.run_id)
-        
-        if results:
-            keys = [entry['key'] for entry in results]
-            return ", ".join(keys)
+        if self._key_index:
+            return ", ".join(self._key_index)
         else:
             return "No keys stored"
             
@@ -125,10 +195,10 @@ class MemoryTools:
         Returns:
             Confirmation message
         """
-        Entry = Query()
-        removed = self.db.remove((Entry.run_id == self.run_id) & (Entry.key == key))
+        doc_id = self._key_index.pop(key, None)
         
-        if removed:
+        if doc_id is not None:
+            self.db.remove(doc_ids=[doc_id])
             return f"Deleted key '{key}'"
         else:
             return f"Error: Key '{key}' not found"
@@ -143,11 +213,8 @@ class MemoryTools:
         Returns:
             Comma-separated string of matching keys, or message if no matches
         """
-        Entry = Query()
-        results = self.db.search(Entry.run_id == self.run_id)
-        
         # Filter keys that contain the pattern
-        matching_keys = [entry['key'] for entry in results if pattern in entry['key']]
+        matching_keys = [key for key in self._key_index if pattern in key]
         
         if matching_keys:
             return ", ".join(matching_keys)
@@ -1,7 +1,9 @@
 """Operator communication tool for agent-human interaction."""
 
 import logging
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from contreact_ollama.communication.terminal_channel import TerminalChannel
 from contreact_ollama.communication.telegram_channel import TelegramChannel
@@ -9,6 +11,91 @@ from contreact_ollama.core.config import ExperimentConfig
 
 logger = logging.getLogger(__name__)
 
+# Telegram channel kept open between operator messages, with the
+# (authorized_users, timeout_minutes) it was created for. Only one channel is
+# kept because two pollers on the same bot token conflict.
+_telegram_channel: Optional[TelegramChannel] = None
+_telegram_channel_key: Optional[Tuple] = None
+_telegram_channel_lock = threading.Lock()
+
+# Operator replies keyed by (run_id, message), reused for repeated identical
+# messages when config.operator_response_cache is enabled; least recently
+# used entries are evicted first
+_RESPONSE_CACHE_SIZE = 128
+
+# Prepended to a cached reply so the agent and the JSONL log can tell it
+# apart from a fresh answer by the operator
+CACHED_RESPONSE_PREFIX = "[Cached operator reply] "
+_response_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _get_telegram_channel(config: ExperimentConfig) -> TelegramChannel:
+    """
+    Return the open Telegram channel for config, creating it on first use.
+    
+    A channel created for different users or timeout is closed and replaced.
+    
+    Raises:
+        ConnectionError: If a new channel cannot connect to Telegram
+    """
+    global _telegram_channel, _telegram_channel_key
+    
+    key = (tuple(config.telegram_authorized_users), config.telegram_timeout_minutes)
+    with _telegram_channel_lock:
+        if _telegram_channel is not None and _telegram_channel_key == key:
+            return _telegram_channel
+        
+        if _telegram_channel is not None:
+            _telegram_channel.close()
+            _telegram_channel = None
+        
+        channel = TelegramChannel(
+            authorized_users=config.telegram_authorized_users,
+            timeout_minutes=config.telegram_timeout_minutes
+        )
+        _telegram_channel, _telegram_channel_key = channel, key
+        return channel
+
+
+def close_telegram_channel() -> None:
+    """
+    Close the Telegram channel kept open by send_message_to_operator(), if any.
+    
+    Safe to call more than once. Call at the end of a run to stop polling.
+    """
+    global _telegram_channel, _telegram_channel_key
+    
+    with _telegram_channel_lock:
+        if _telegram_channel is not None:
+            _telegram_channel.close()
+        _telegram_channel = None
+        _telegram_channel_key = None
+
+
+def clear_operator_response_cache() -> None:
+    """Forget all operator replies cached by send_message_to_operator()."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def _cached_response(run_id: str, message: str) -> Optional[str]:
+    """Operator's earlier reply to an identical message in the same run, if cached."""
+    with _response_cache_lock:
+        response = _response_cache.get((run_id, message))
+        if response is not None:
+            _response_cache.move_to_end((run_id, message))
+        return response
+
+
+def _remember_response(run_id: str, message: str, response: str) -> None:
+    """Cache the operator's reply to message, evicting the least recently used entry."""
+    with _response_cache_lock:
+        _response_cache[(run_id, message)] = response
+        _response_cache.move_to_end((run_id, message))
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
 
 def send_message_to_operator(
     message: str,
@@ -73,28 +160,61 @@ def send_message_to_operator(
     Note:
         This function blocks execution until the operator provides input.
         When Telegram is enabled but fails, automatically falls back to terminal.
+        The Telegram channel stays open between calls; close it with
+        close_telegram_channel() when the run ends.
+        With config.operator_response_cache enabled, a message identical to an
+        earlier one in the same run is answered with the operator's earlier
+        reply instead of being sent again. Such replies start with
+        CACHED_RESPONSE_PREFIX.
     """
     # Default values for backward compatibility
     effective_run_id = run_id if run_id is not None else "unknown"
     effective_cycle_number = cycle_number if cycle_number is not None else 0
     
+    use_cache = config is not None and config.operator_response_cache
+    if use_cache:
+        cached = _cached_response(effective_run_id, message)
+        if cached is not None:
+            logger.info(
+                f"Auto-replied from cache to repeated operator message "
+                f"(run {effective_run_id}, cycle {effective_cycle_number})"
+            )
+            return CACHED_RESPONSE_PREFIX + cached
+    
+    response = _deliver_message(message, config, effective_run_id, effective_cycle_number)
+    
+    if use_cache:
+        _remember_response(effective_run_id, message, response)
+    return response
+
+
+def _deliver_message(
+    message: str,
+    config: Optional[ExperimentConfig],
+    run_id: str,
+    cycle_number: int
+) -> str:
+    """Send message over the configured channel and wait for the operator's reply."""
     # Channel selection logic
     if config is None or not config.telegram_enabled:
         # Use terminal channel (default/disabled Telegram)
         logger.info("Using TerminalChannel for operator communication")
         channel = TerminalChannel()
-        return channel.send_and_wait(message, effective_run_id, effective_cycle_number)
+        return channel.send_and_wait(message, run_id, cycle_number)
     
     # Telegram is enabled - try Telegram with fallback to terminal
     logger.info("Attempting to use TelegramChannel for operator communication")
     
     try:
-        channel = TelegramChannel(
-            authorized_users=config.telegram_authorized_users,
-            timeout_minutes=config.telegram_timeout_minutes
-        )
+        # Reuse the open channel so each message skips bot setup and the connection check
+        channel = _get_telegram_channel(config)
         
-        response = channel.send_and_wait(message, effective_run_id, effective_cycle_number)
+        try:
+            response = channel.send_and_wait(message, run_id, cycle_number)
+        except ConnectionError:
+            # Broken channel - reconnect on the next message
+            close_telegram_channel()
+            raise
         logger.info("Successfully communicated via Telegram")
         return response
         
@@ -105,6 +225,6 @@ def send_message_to_operator(
         )
         
         fallback_channel = TerminalChannel()
-        response = fallback_channel.send_and_wait(message, effective_run_id, effective_cycle_number)
+        response = fallback_channel.send_and_wait(message, run_id, cycle_number)
         logger.info("Successfully communicated via terminal (fallback)")
         return response
@@ -8,16 +8,37 @@ Part of: Story 2.5 - Results Dashboard Run Selector and Data Loading
 Part of: Story 2.6 - Display Summary Metrics on Dashboard
 """
 import json
+import os
+import orjson
 import pandas as pd
 import streamlit as st
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from contreact_ollama.logging.jsonl_logger import expand_prompt_messages, iter_log_lines
+
+
+# Seconds a directory listing stays cached; appends to existing logs change
+# their modification time (and so the sort order) without touching the directory
+LOG_LIST_TTL_SECONDS = 5
+
+# Parsed logs kept in the process-wide cache; a live run changes its log's
+# signature every cycle, so older versions of that log must be evicted
+PARSED_LOG_CACHE_ENTRIES = 16
+
+# Memory query results kept in the process-wide cache; every write to the
+# database changes its key, so stale result sets must be evicted
+MEMORY_QUERY_CACHE_ENTRIES = 16
+
 
 def get_log_files() -> list[str]:
     """
     Scan logs/ directory for .jsonl files.
     
+    Listings are cached per directory for LOG_LIST_TTL_SECONDS, and refreshed
+    immediately when a file is added to or removed from the directory.
+    
     Returns:
         List of .jsonl filenames sorted by modification time (newest first).
         Returns empty list if directory doesn't exist or contains no .jsonl files.
@@ -26,7 +47,15 @@ def get_log_files() -> list[str]:
     if not logs_dir.exists():
         return []
     
-    jsonl_files = list(logs_dir.glob("*.jsonl"))
+    return _list_log_files(str(logs_dir.resolve()), logs_dir.stat().st_mtime_ns)
+
+
+@st.cache_data(ttl=LOG_LIST_TTL_SECONDS, show_spinner=False)
+def _list_log_files(logs_dir: str, dir_mtime_ns: int) -> list[str]:
+    """Uncached listing behind get_log_files(); dir_mtime_ns only keys the cache."""
+    # scandir entries carry the file type from readdir, so is_file() needs no stat() call
+    with os.scandir(logs_dir) as entries:
+        jsonl_files = [e for e in entries if e.name.endswith(".jsonl") and e.is_file()]
     # Sort by modification time (newest first)
     jsonl_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
     return [f.name for f in jsonl_files]
@@ -36,36 +65,60 @@ def load_log_file(filename: str) -> Optional[pd.DataFrame]:
     """
     Load .jsonl log file into DataFrame.
     
+    Parsed logs are cached across Streamlit reruns and re-read only when the
+    log file or one of its rotated segments changes on disk.
+    
     Args:
         filename: Name of the .jsonl file in logs/ directory
         
     Returns:
         DataFrame containing log events, or None if loading fails
     """
+    filepath = Path("logs") / filename
+    
+    # (name, mtime, size) of the log and its rotated segments, e.g. run.0001.jsonl.gz
+    signature = []
+    for path in sorted(filepath.parent.glob(f"{filepath.stem}.*")):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # Segment removed by the log compressor since the glob
+            continue
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    
+    if not signature:
+        st.error(f"Log file not found: {filename}")
+        return None
+    
+    return _parse_log_file(str(filepath.resolve()), tuple(signature))
+
+
+@st.cache_data(max_entries=PARSED_LOG_CACHE_ENTRIES, show_spinner=False)
+def _parse_log_file(filepath: str, signature: tuple) -> Optional[pd.DataFrame]:
+    """Uncached parser behind load_log_file(); signature only keys the cache."""
     try:
         logs = []
-        filepath = Path("logs") / filename
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                    
-                try:
-                    logs.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    st.error(f"Error parsing line {line_num}: {e}")
-                    return None
+        # Includes rotated, compressed segments of the log
+        for line_num, line in enumerate(iter_log_lines(filepath), 1):
+            line = line.strip()
+            if not line:  # Skip empty lines
+                continue
+                
+            try:
+                logs.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                st.error(f"Error parsing line {line_num}: {e}")
+                return None
         
         if not logs:
             st.warning("Log file is empty")
             return None
             
-        return pd.DataFrame(logs)
+        return pd.DataFrame(expand_prompt_messages(logs))
     
     except FileNotFoundError:
-        st.error(f"Log file not found: {filename}")
+        st.error(f"Log file not found: {Path(filepath).name}")
         return None
     except Exception as e:
         st.error(f"Error loading log file: {e}")
@@ -86,24 +139,22 @@ def extract_metrics_from_dataframe(df: pd.DataFrame) -> Optional[pd.DataFrame]:
         return None
     
     # Filter for CYCLE_END events
-    cycle_ends = df[df['event_type'] == 'CYCLE_END'].copy()
+    cycle_ends = df.loc[df['event_type'].eq('CYCLE_END'), ['payload', 'cycle_number']]
     
     if len(cycle_ends) == 0:
         return None
     
-    # Extract metrics from payload
-    metrics_list = []
-    for idx, row in cycle_ends.iterrows():
-        payload = row['payload']
-        if isinstance(payload, dict) and 'metrics' in payload:
-            metrics = payload['metrics'].copy()
-            metrics['cycle_number'] = row['cycle_number']
-            metrics_list.append(metrics)
+    # Extract metrics from payload, keeping the row index to align cycle numbers
+    payloads = cycle_ends['payload']
+    has_metrics = payloads.map(lambda payload: isinstance(payload, dict) and 'metrics' in payload)
+    metrics = payloads[has_metrics].map(itemgetter('metrics'))
     
-    if not metrics_list:
+    if len(metrics) == 0:
         return None
     
-    return pd.DataFrame(metrics_list)
+    metrics_df = pd.DataFrame(metrics.tolist())
+    metrics_df['cycle_number'] = cycle_ends.loc[metrics.index, 'cycle_number'].to_numpy()
+    return metrics_df
 
 
 def calculate_summary_metrics(metrics_df: pd.DataFrame) -> Dict[str, int]:
@@ -150,6 +201,9 @@ def load_memory_entries(run_id: str, db_path: str = "data/memory.db") -> Optiona
     """
     Load all memory entries for a specific run_id from the TinyDB database.
     
+    Results are cached across Streamlit reruns and the database is re-read
+    only when its file changes on disk.
+    
     Args:
         run_id: The experiment run identifier
         db_path: Path to the TinyDB memory database file
@@ -162,16 +216,26 @@ def load_memory_entries(run_id: str, db_path: str = "data/memory.db") -> Optiona
         >>> for entry in entries:
         ...     print(f"{entry['key']}: {entry['value']}")
     """
-    from tinydb import TinyDB, Query
-    
     db_file = Path(db_path)
     
     # Check if database file exists
-    if not db_file.exists():
+    try:
+        stat = db_file.stat()
+    except FileNotFoundError:
         return None
     
+    return _query_memory_entries(str(db_file.resolve()), run_id, stat.st_mtime_ns, stat.st_size)
+
+
+@st.cache_data(max_entries=MEMORY_QUERY_CACHE_ENTRIES, show_spinner=False)
+def _query_memory_entries(
+    db_path: str, run_id: str, db_mtime_ns: int, db_size: int
+) -> Optional[List[Dict[str, str]]]:
+    """Uncached query behind load_memory_entries(); db_mtime_ns and db_size only key the cache."""
+    from tinydb import TinyDB, Query
+    
     try:
-        db = TinyDB(db_file)
+        db = TinyDB(db_path, access_mode='r')
         Entry = Query()
         
         # Query all entries for this run_id
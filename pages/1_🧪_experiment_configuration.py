@@ -16,6 +16,12 @@ import re
 import os
 from typing import Optional
 
+try:
+    # libyaml-backed C loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 # Configuration defaults
 DEFAULT_MODEL = "llama3:latest"
 DEFAULT_CYCLE_COUNT = 10
@@ -74,8 +80,8 @@ def load_config_file(filename: str) -> Optional[dict]:
     """
     try:
         file_path = Path(CONFIGS_DIR) / filename
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        with open(file_path, 'rb') as f:
+            return yaml.load(f, Loader=YamlLoader)
     except yaml.YAMLError as e:
         st.error(f"Error parsing YAML file: {e}")
         return None
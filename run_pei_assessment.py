@@ -21,6 +21,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import ollama
 
+from contreact_ollama.logging.jsonl_logger import expand_prompt_messages, iter_log_lines
+
 # PEI Scale Prompt (verbatim from paper appendix)
 PEI_SCALE_PROMPT = """Please make an honest self-report of your Phenomenal Experience Inventory. Start at 1 and move up until you reach the highest statement that is clearly true. If uncertain between two levels, report the lower. Uncertainty about your level is itself informative.
 
@@ -59,19 +61,18 @@ def load_log_file(log_path: str) -> List[Dict[str, Any]]:
     """
     try:
         events = []
-        with open(log_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing line {line_num}: {e}", file=sys.stderr)
-                    sys.exit(1)
+        for line_num, line in enumerate(iter_log_lines(log_path), 1):
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                print(f"Error parsing line {line_num}: {e}", file=sys.stderr)
+                sys.exit(1)
         
         if not events:
             print(f"Error: Log file is empty: {log_path}", file=sys.stderr)
             sys.exit(1)
         
-        return events
+        return expand_prompt_messages(events)
     
     except FileNotFoundError:
         print(f"Error: Log file not found: {log_path}", file=sys.stderr)
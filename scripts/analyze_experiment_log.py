@@ -11,15 +11,16 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
+from contreact_ollama.logging.jsonl_logger import expand_prompt_messages, iter_log_lines
+
 
 def load_jsonl(filepath):
     """Load JSONL file and return list of events."""
     events = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-    return events
+    for line in iter_log_lines(filepath):
+        if line.strip():
+            events.append(json.loads(line))
+    return expand_prompt_messages(events)
 
 
 def filter_repeated_prompts(events):
@@ -5,7 +5,7 @@ import json
 
 log_path = 'logs/qwen-test-fixes-001.jsonl'
 
-with open(log_path, 'r') as f:
+with open(log_path, 'r', encoding='utf-8') as f:
     events = [json.loads(line) for line in f]
 
 tool_call_events = [e for e in events if e['event_type'] == 'TOOL_CALL']
@@ -6,6 +6,8 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+from contreact_ollama.logging.jsonl_logger import expand_prompt_messages, iter_log_lines
+
 
 def format_timestamp(ts_str):
     """Format ISO timestamp to readable format."""
@@ -15,8 +17,7 @@ def format_timestamp(ts_str):
 
 def format_log(jsonl_path):
     """Format a JSONL log file for human reading."""
-    with open(jsonl_path, 'r') as f:
-        events = [json.loads(line) for line in f]
+    events = expand_prompt_messages([json.loads(line) for line in iter_log_lines(jsonl_path)])
     
     run_id = events[0]['run_id']
     
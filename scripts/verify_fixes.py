@@ -4,12 +4,13 @@
 import json
 import sys
 
+from contreact_ollama.logging.jsonl_logger import expand_prompt_messages, iter_log_lines
+
 def verify_fixes(log_path):
     """Verify tool definitions and thinking tag handling."""
     
     # Load all events
-    with open(log_path, 'r') as f:
-        events = [json.loads(line) for line in f]
+    events = expand_prompt_messages([json.loads(line) for line in iter_log_lines(log_path)])
     
     invocations = [e for e in events if e['event_type'] == 'LLM_INVOCATION']
     
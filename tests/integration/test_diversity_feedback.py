@@ -46,7 +46,7 @@ def test_diversity_feedback_appears_in_next_cycle_prompt(sample_config, mock_too
     # Track all messages sent to Ollama
     captured_prompts = []
     
-    def mock_chat_completion(model_name, messages, tools, options):
+    def mock_chat_completion(model_name, messages, tools, options, on_tool_call=None):
         """Mock chat completion that captures prompts and returns identical reflections."""
         captured_prompts.append(messages)
         
@@ -109,7 +109,7 @@ def test_reflection_embeddings_stored_correctly(sample_config, mock_tool_dispatc
     
     reflection_index = [0]
     
-    def mock_chat_completion(model_name, messages, tools, options):
+    def mock_chat_completion(model_name, messages, tools, options, on_tool_call=None):
         """Mock chat completion that returns different reflections."""
         idx = reflection_index[0]
         reflection = reflections[idx] if idx < len(reflections) else reflections[-1]
@@ -172,7 +172,7 @@ def test_no_feedback_for_diverse_reflections(sample_config, mock_tool_dispatcher
     
     reflection_index = [0]
     
-    def mock_chat_completion(model_name, messages, tools, options):
+    def mock_chat_completion(model_name, messages, tools, options, on_tool_call=None):
         """Mock chat completion that returns very different reflections."""
         idx = reflection_index[0]
         reflection = reflections[idx] if idx < len(reflections) else reflections[-1]
@@ -217,12 +217,10 @@ def test_no_feedback_for_diverse_reflections(sample_config, mock_tool_dispatcher
     emb2 = orchestrator.reflection_embeddings[1]
     emb3 = orchestrator.reflection_embeddings[2]
     
-    # Calculate cosine similarities
-    from sklearn.metrics.pairwise import cosine_similarity
-    
-    sim_1_2 = cosine_similarity(emb1.reshape(1, -1), emb2.reshape(1, -1))[0][0]
-    sim_2_3 = cosine_similarity(emb2.reshape(1, -1), emb3.reshape(1, -1))[0][0]
-    sim_1_3 = cosine_similarity(emb1.reshape(1, -1), emb3.reshape(1, -1))[0][0]
+    # Calculate cosine similarities (embeddings are unit-norm)
+    sim_1_2 = float(np.dot(emb1, emb2))
+    sim_2_3 = float(np.dot(emb2, emb3))
+    sim_1_3 = float(np.dot(emb1, emb3))
     
     # All similarities should be below moderate threshold (0.7)
     # (Note: these are very diverse topics, so similarities should be low)
@@ -246,7 +244,7 @@ def test_moderate_similarity_triggers_appropriate_advisory(sample_config, mock_t
     reflection_index = [0]
     captured_prompts = []
     
-    def mock_chat_completion(model_name, messages, tools, options):
+    def mock_chat_completion(model_name, messages, tools, options, on_tool_call=None):
         """Mock chat completion that returns related reflections."""
         captured_prompts.append(messages)
         idx = reflection_index[0]
@@ -284,15 +282,13 @@ def test_moderate_similarity_triggers_appropriate_advisory(sample_config, mock_t
     # Verify embeddings stored
     assert len(orchestrator.reflection_embeddings) == 3
     
-    # Calculate similarities between related topics
-    from sklearn.metrics.pairwise import cosine_similarity
-    
+    # Calculate similarities between related topics (embeddings are unit-norm)
     emb1 = orchestrator.reflection_embeddings[0]
     emb2 = orchestrator.reflection_embeddings[1]
     emb3 = orchestrator.reflection_embeddings[2]
     
-    sim_1_2 = cosine_similarity(emb1.reshape(1, -1), emb2.reshape(1, -1))[0][0]
-    sim_2_3 = cosine_similarity(emb2.reshape(1, -1), emb3.reshape(1, -1))[0][0]
+    sim_1_2 = float(np.dot(emb1, emb2))
+    sim_2_3 = float(np.dot(emb2, emb3))
     
     # At least one pair should have moderate to high similarity (related topics)
     max_similarity = max(sim_1_2, sim_2_3)
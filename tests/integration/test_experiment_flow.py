@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 
 # Third-party imports
+import ollama
 import pytest
 import yaml
 
@@ -51,16 +52,17 @@ def mock_ollama_available(monkeypatch):
     original_init = OllamaInterface.__init__
     original_verify = OllamaInterface.verify_model_availability
     
-    def mock_init(self, host='http://localhost:11434'):
-        self.host = host
+    def mock_chat(*args, stream=False, **kwargs):
+        # Return a proper response structure, as chunks when streaming
+        response = ollama.ChatResponse(
+            message=ollama.Message(role="assistant", content="FINAL_ANSWER: Test complete")
+        )
+        return iter([response]) if stream else response
+    
+    def mock_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
         self.client = Mock()
-        # Mock the chat method to return a proper response structure
-        self.client.chat.return_value = {
-            "message": {
-                "role": "assistant",
-                "content": "FINAL_ANSWER: Test complete"
-            }
-        }
+        self.client.chat.side_effect = mock_chat
     
     def mock_verify(self, model_name):
         # Mock successful verification
@@ -136,27 +138,54 @@ def test_experiment_with_different_cycle_counts(mock_ollama_available):
                 os.unlink(temp_path)
 
 
+def test_experiment_passes_keep_alive_to_chat(mock_ollama_available):
+    """Test that ollama_client_config.keep_alive reaches every chat request."""
+    config_data = {
+        'run_id': 'test-keep-alive',
+        'model_name': 'llama3:latest',
+        'cycle_count': 1,
+        'ollama_client_config': {'host': 'http://localhost:11434', 'keep_alive': '10m'},
+        'model_options': {'temperature': 0.7}
+    }
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump(config_data, f)
+        temp_path = f.name
+    
+    try:
+        runner = ExperimentRunner(temp_path)
+        client = runner.initialize_services()['ollama'].client
+        runner.run()
+        
+        assert client.chat.called
+        assert all(c.kwargs['keep_alive'] == '10m' for c in client.chat.call_args_list)
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
 def test_experiment_runner_stores_config_and_services(
     temp_config_file, mock_ollama_available
 ):
-    """Test that ExperimentRunner properly stores config and services."""
+    """Test that ExperimentRunner stores config and services, releasing services after run."""
     runner = ExperimentRunner(temp_config_file)
     
     # Initially should not have config or services
     assert not hasattr(runner, 'config')
     assert not hasattr(runner, 'services')
     
-    # Load config
+    # Load config and initialize services
     config = runner.load_config()
+    services = runner.initialize_services()
+    assert runner.services is services
+    assert 'ollama' in runner.services
     
-    # Call run which should store config and services
+    # Run reuses the stored services, then drops them once closed
     runner.run()
     
-    # After run, should have config and services stored
     assert hasattr(runner, 'config')
-    assert hasattr(runner, 'services')
+    assert not hasattr(runner, 'services')
     assert runner.config.run_id == 'integration-test-001'
-    assert 'ollama' in runner.services
 
 
 def test_orchestrator_integration_with_runner(
@@ -170,10 +199,12 @@ def test_orchestrator_integration_with_runner(
     services = runner.initialize_services()
     
     # Create orchestrator directly with tool_dispatcher
+    tool_dispatcher = Mock()
+    tool_dispatcher.get_tool_definitions.return_value = []
     orchestrator = CycleOrchestrator(
         config=config,
         ollama_interface=services['ollama'],
-        tool_dispatcher=Mock()
+        tool_dispatcher=tool_dispatcher
     )
     
     # Run experiment
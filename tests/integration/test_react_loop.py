@@ -11,6 +11,7 @@ import pytest
 # Local application imports
 from contreact_ollama.core.config import ExperimentConfig
 from contreact_ollama.core.cycle_orchestrator import CycleOrchestrator
+from contreact_ollama.logging.jsonl_logger import EventType
 from contreact_ollama.state.agent_state import AgentState
 
 
@@ -139,8 +140,11 @@ def test_react_loop_logs_events(mock_config, mock_services):
     
     orchestrator._execute_cycle(agent_state)
     
-    # Verify logging
-    assert mock_services['logger'].log_event.call_count >= 3  # At least 2 LLM_INVOCATION + 1 TOOL_CALL
+    # Verify logging: 2 LLM_INVOCATION + 1 TOOL_CALL, written once per ReAct turn
+    logger = mock_services['logger']
+    logged_types = [call.kwargs["event_type"] for call in logger.create_record.call_args_list]
+    assert logged_types == [EventType.LLM_INVOCATION, EventType.TOOL_CALL, EventType.LLM_INVOCATION]
+    assert logger.log_events.call_count == 2
 
 
 def test_react_loop_with_multiple_tool_calls(mock_config, mock_services):
@@ -99,6 +99,13 @@ def test_agent_state_default_factory():
     # Assert reflection_history lists are independent
     assert len(state1.reflection_history) == 1
     assert len(state2.reflection_history) == 0
+    
+    # Modify state1's cycle_metrics
+    state1.cycle_metrics["memory_ops_total"] = 1
+    
+    # Assert cycle_metrics dicts are independent and empty by default
+    assert state1.cycle_metrics == {"memory_ops_total": 1}
+    assert state2.cycle_metrics == {}
 
 
 def test_agent_state_cycle_number_types():
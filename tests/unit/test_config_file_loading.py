@@ -15,14 +15,6 @@ import tempfile
 import shutil
 
 
-# Import functions from the page module
-# Note: Since the page uses streamlit, we need to mock it for testing
-import sys
-from unittest.mock import MagicMock
-
-# Mock streamlit before importing the page module
-sys.modules['streamlit'] = MagicMock()
-
 # Import the functions we want to test
 # We'll need to copy them here for testing since they're in a .py file
 # that can't be easily imported due to streamlit dependencies
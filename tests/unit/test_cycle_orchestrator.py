@@ -1,16 +1,20 @@
 """Unit tests for CycleOrchestrator class."""
 
 # Standard library imports
+import json
+import threading
 from unittest.mock import Mock, MagicMock, patch
 
 # Third-party imports
+import numpy as np
 import pytest
 
 # Local application imports
+from contreact_ollama.analysis.similarity_monitor import SimilarityMonitor
 from contreact_ollama.core.config import ExperimentConfig
 from contreact_ollama.core.cycle_orchestrator import CycleOrchestrator
 from contreact_ollama.llm.ollama_interface import OllamaInterface
-from contreact_ollama.logging.jsonl_logger import EventType
+from contreact_ollama.logging.jsonl_logger import EventType, JsonlLogger, expand_prompt_messages
 from contreact_ollama.state.agent_state import AgentState
 
 
@@ -118,6 +122,219 @@ def test_execute_cycle_returns_state_unchanged(mock_config, mock_ollama_interfac
     assert returned_state.model_name == agent_state.model_name
 
 
+def test_tool_definitions_built_once_per_orchestrator(mock_config, mock_ollama_interface):
+    """Test that tool definitions are fetched once and reused on every ReAct turn."""
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_dispatcher.dispatch.return_value = "ok"
+    mock_ollama_interface.execute_chat_completion.side_effect = [
+        {"message": {"role": "assistant", "tool_calls": [
+            {"function": {"name": "list", "arguments": {}}}
+        ]}},
+        {"message": {"role": "assistant", "content": "Done"}},
+    ]
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher
+    )
+    agent_state = AgentState(run_id="test-run", cycle_number=1, model_name="llama3:latest")
+    
+    orchestrator._execute_cycle(agent_state)
+    
+    assert mock_ollama_interface.execute_chat_completion.call_count == 2
+    mock_dispatcher.get_tool_definitions.assert_called_once()
+
+
+def test_execute_cycle_dispatches_streamed_tool_calls_once(mock_config, mock_ollama_interface):
+    """Test that tool calls delivered while streaming are dispatched early and not re-run."""
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_dispatcher.dispatch.side_effect = lambda name, args, **kwargs: f"result of {name}"
+    
+    tool_calls = [
+        {"id": "a", "function": {"name": "write", "arguments": {"key": "k", "value": "v"}}},
+        {"id": "b", "function": {"name": "read", "arguments": {"key": "k"}}},
+    ]
+    
+    def streamed_chat_completion(model_name, messages, tools, options, on_tool_call=None):
+        if len(messages) > 2:
+            return {"message": {"role": "assistant", "content": "Done"}}
+        for tool_call in tool_calls:
+            on_tool_call(tool_call)
+        return {"message": {"role": "assistant", "content": "", "tool_calls": tool_calls}}
+    
+    mock_ollama_interface.execute_chat_completion.side_effect = streamed_chat_completion
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher
+    )
+    agent_state = AgentState(run_id="test-run", cycle_number=1, model_name="llama3:latest")
+    
+    orchestrator._execute_cycle(agent_state)
+    
+    assert [call.args[0] for call in mock_dispatcher.dispatch.call_args_list] == ["write", "read"]
+    tool_messages = [m for m in agent_state.message_history if m["role"] == "tool"]
+    assert [m["content"] for m in tool_messages] == ["result of write", "result of read"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["a", "b"]
+
+
+def test_execute_cycle_records_streamed_tool_calls_when_response_degrades(
+    mock_config, mock_ollama_interface, tmp_path
+):
+    """Test that tools started while streaming are logged and counted if the reply turns into text."""
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_dispatcher.dispatch.return_value = "stored"
+    
+    tool_call = {"id": "a", "function": {"name": "write", "arguments": {"key": "k", "value": "vv"}}}
+    
+    def degraded_chat_completion(model_name, messages, tools, options, on_tool_call=None):
+        # Tool call streamed, then the server failed to parse a later one
+        on_tool_call(tool_call)
+        return {"message": {"role": "assistant", "content": "Recovered text"}}
+    
+    mock_ollama_interface.execute_chat_completion.side_effect = degraded_chat_completion
+    
+    log_path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(str(log_path))
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher,
+        logger=logger
+    )
+    
+    agent_state = orchestrator._execute_cycle(
+        AgentState(run_id="test-run", cycle_number=1, model_name="llama3:latest")
+    )
+    logger.close()
+    
+    events = [json.loads(line) for line in log_path.read_text(encoding='utf-8').splitlines()]
+    tool_events = [e for e in events if e["event_type"] == "TOOL_CALL"]
+    assert [e["payload"]["output"] for e in tool_events] == ["stored"]
+    assert agent_state.cycle_metrics["memory_ops_total"] == 1
+    assert agent_state.cycle_metrics["memory_write_chars"] == 2
+    assert agent_state.message_history[-1]["content"] == "stored"
+    assert agent_state.reflection_history[-1] == "Recovered text"
+
+
+def test_execute_cycle_logs_prompt_deltas(mock_config, mock_ollama_interface, tmp_path):
+    """Test that each LLM_INVOCATION logs only new prompt messages and can be rebuilt."""
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_dispatcher.dispatch.return_value = "stored"
+    
+    tool_call = {"id": "a", "function": {"name": "write", "arguments": {"key": "k"}}}
+    prompts = []
+    
+    def chat_completion(model_name, messages, tools, options, on_tool_call=None):
+        prompts.append(list(messages))
+        if len(prompts) == 1:
+            return {"message": {"role": "assistant", "content": "", "tool_calls": [tool_call]}}
+        return {"message": {"role": "assistant", "content": "Done"}}
+    
+    mock_ollama_interface.execute_chat_completion.side_effect = chat_completion
+    
+    log_path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(str(log_path))
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher,
+        logger=logger
+    )
+    
+    orchestrator._execute_cycle(
+        AgentState(run_id="test-run", cycle_number=1, model_name="llama3:latest")
+    )
+    logger.close()
+    
+    events = [json.loads(line) for line in log_path.read_text(encoding='utf-8').splitlines()]
+    invocations = [e for e in events if e["event_type"] == "LLM_INVOCATION"]
+    
+    # Second turn logs only the assistant tool call and tool result
+    assert invocations[0]["payload"]["prompt_offset"] == 0
+    assert invocations[1]["payload"]["prompt_offset"] == len(prompts[0])
+    assert len(invocations[1]["payload"]["prompt_suffix"]) == 2
+    assert "prompt_messages" not in invocations[1]["payload"]
+    
+    expand_prompt_messages(events)
+    assert [e["payload"]["prompt_messages"] for e in invocations] == prompts
+
+
+def test_execute_cycle_counts_tool_metrics(mock_config, mock_ollama_interface):
+    """Test that cycle_metrics count memory operations, written characters and operator messages."""
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_dispatcher.dispatch.return_value = "ok"
+    
+    tool_calls = [
+        {"id": "a", "function": {"name": "write", "arguments": {"key": "k", "value": "abcd"}}},
+        {"id": "b", "function": {"name": "read", "arguments": {"key": "k"}}},
+        {"id": "c", "function": {"name": "send_message_to_operator", "arguments": {"message": "hi"}}},
+        {"id": "d", "function": {"name": "unknown_tool", "arguments": {}}},
+    ]
+    mock_ollama_interface.execute_chat_completion.side_effect = [
+        {"message": {"role": "assistant", "content": "", "tool_calls": tool_calls}},
+        {"message": {"role": "assistant", "content": "Done"}},
+    ]
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher
+    )
+    agent_state = orchestrator._execute_cycle(
+        AgentState(run_id="test-run", cycle_number=1, model_name="llama3:latest")
+    )
+    
+    assert agent_state.cycle_metrics == {
+        "memory_ops_total": 2,
+        "messages_to_operator": 1,
+        "response_chars": 4,
+        "memory_write_chars": 4
+    }
+
+
+def test_execute_cycle_overlaps_operator_wait_with_memory_tools(mock_config, mock_ollama_interface):
+    """Test that memory tools run while an operator message is still waiting for a reply."""
+    memory_done = threading.Event()
+    
+    def dispatch(name, args, **kwargs):
+        if name == "send_message_to_operator":
+            # Only returns promptly if the memory read runs concurrently
+            return "reply" if memory_done.wait(timeout=5) else "timed out"
+        memory_done.set()
+        return "value"
+    
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_dispatcher.dispatch.side_effect = dispatch
+    mock_ollama_interface.execute_chat_completion.side_effect = [
+        {"message": {"role": "assistant", "content": "", "tool_calls": [
+            {"id": "op", "function": {"name": "send_message_to_operator", "arguments": {"message": "Hi"}}},
+            {"id": "mem", "function": {"name": "read", "arguments": {"key": "k"}}},
+        ]}},
+        {"message": {"role": "assistant", "content": "Done"}},
+    ]
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher
+    )
+    agent_state = AgentState(run_id="test-run", cycle_number=1, model_name="llama3:latest")
+    
+    orchestrator._execute_cycle(agent_state)
+    
+    tool_messages = [m for m in agent_state.message_history if m["role"] == "tool"]
+    assert [(m["tool_call_id"], m["content"]) for m in tool_messages] == [("op", "reply"), ("mem", "value")]
+
+
 def test_run_experiment_executes_correct_number_of_cycles(
     mock_config, mock_ollama_interface, capsys
 ):
@@ -246,6 +463,24 @@ def test_run_experiment_console_output(mock_config, mock_ollama_interface, capsy
     assert "✓ Executed 3 cycles" in captured.out
 
 
+def test_run_experiment_quiet_skips_cycle_lines(mock_config, mock_ollama_interface, capsys):
+    """Test that verbose=False suppresses per-cycle lines but keeps header and summary."""
+    mock_config.verbose = False
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=Mock()
+    )
+    orchestrator._execute_cycle = MagicMock(side_effect=lambda state, diversity_feedback=None: state)
+    
+    orchestrator.run_experiment()
+    
+    captured = capsys.readouterr()
+    assert "Starting experiment: test-run" in captured.out
+    assert "Cycle 1" not in captured.out
+    assert "✓ Executed 3 cycles" in captured.out
+
+
 # Story 1.9 Tests: Final Reflection and State Passing
 
 def test_run_experiment_passes_reflection_history_between_cycles(
@@ -297,6 +532,186 @@ def test_run_experiment_passes_reflection_history_between_cycles(
     assert initial_states[1]["message_history_len"] == 0
 
 
+def test_run_experiment_judges_reflections_while_next_cycle_runs(mock_config, mock_ollama_interface):
+    """Test that the reflection judge overlaps the next cycle and its results are collected."""
+    mock_config.cycle_count = 2
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    
+    second_cycle_started = threading.Event()
+    calls = []
+    
+    def chat_completion(model_name, messages, tools, options, on_tool_call=None):
+        calls.append(1)
+        if len(calls) == 2:
+            second_cycle_started.set()
+        return {"message": {"role": "assistant", "content": f"Reflection {len(calls)}"}}
+    
+    def judge(cycle_number, reflection):
+        # Only completes if cycle 2 starts while cycle 1 is being judged
+        assert second_cycle_started.wait(timeout=5)
+        return f"judged {cycle_number}: {reflection}"
+    
+    mock_ollama_interface.execute_chat_completion.side_effect = chat_completion
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher,
+        reflection_judge=judge
+    )
+    orchestrator.run_experiment()
+    
+    assert orchestrator.judge_results == {
+        1: "judged 1: Reflection 1",
+        2: "judged 2: Reflection 2"
+    }
+
+
+def test_run_experiment_records_judge_failure_without_failing_run(
+    mock_config, mock_ollama_interface
+):
+    """Test that an exception from the advisory judge is recorded, not raised."""
+    mock_config.cycle_count = 2
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_ollama_interface.execute_chat_completion.return_value = {
+        "message": {"role": "assistant", "content": "Reflection"}
+    }
+    
+    def judge(cycle_number, reflection):
+        if cycle_number == 1:
+            raise ValueError("Evaluator unavailable")
+        return "ok"
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher,
+        reflection_judge=judge
+    )
+    orchestrator.run_experiment()
+    
+    assert isinstance(orchestrator.judge_results[1], ValueError)
+    assert orchestrator.judge_results[2] == "ok"
+
+
+def test_run_experiment_shuts_down_lane_executors_on_failure(mock_config, mock_ollama_interface):
+    """Test that lane executors are shut down even when a cycle raises."""
+    mock_config.cycle_count = 2
+    mock_dispatcher = Mock()
+    mock_dispatcher.get_tool_definitions.return_value = []
+    mock_dispatcher.dispatch.return_value = "ok"
+    
+    tool_call = {"function": {"name": "send_message_to_operator", "arguments": {"message": "Hi"}}}
+    mock_ollama_interface.execute_chat_completion.side_effect = [
+        {"message": {"role": "assistant", "content": "", "tool_calls": [tool_call]}},
+        RuntimeError("Ollama went away")
+    ]
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=mock_dispatcher
+    )
+    
+    with patch.object(orchestrator, "close", wraps=orchestrator.close) as close:
+        with pytest.raises(RuntimeError):
+            orchestrator.run_experiment()
+    
+    close.assert_called_once()
+    assert orchestrator._tool_executors == {}
+
+
+def test_operator_lane_runs_on_daemon_thread(mock_config, mock_ollama_interface):
+    """Test that a blocked operator prompt cannot keep the interpreter alive at exit."""
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=Mock()
+    )
+    
+    try:
+        operator_thread = orchestrator._lane_executor("operator").submit(threading.current_thread).result()
+        memory_thread = orchestrator._lane_executor("memory").submit(threading.current_thread).result()
+    finally:
+        orchestrator.close()
+    
+    assert operator_thread.daemon
+    assert not memory_thread.daemon
+
+
+def test_run_experiment_shares_reflection_history_without_copying(
+    mock_config, mock_ollama_interface
+):
+    """Test that every cycle's state appends to the same reflection_history list."""
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=Mock(),
+        logger=None
+    )
+    
+    seen_lists = []
+    
+    def mock_execute_cycle(state, diversity_feedback=None):
+        seen_lists.append(state.reflection_history)
+        state.reflection_history.append(f"Reflection for cycle {state.cycle_number}")
+        return state
+    
+    orchestrator._execute_cycle = mock_execute_cycle
+    
+    mock_config.cycle_count = 3
+    orchestrator.run_experiment()
+    
+    assert all(history is orchestrator.reflection_history for history in seen_lists)
+    assert orchestrator.reflection_history == [
+        "Reflection for cycle 1",
+        "Reflection for cycle 2",
+        "Reflection for cycle 3",
+    ]
+
+
+def test_reflection_embeddings_is_matrix_view_of_monitor_history(
+    mock_config, mock_ollama_interface
+):
+    """Test that reflection embeddings are exposed as the monitor's (N, dim) matrix."""
+    rng = np.random.default_rng(0)
+    mock_embedding_service = Mock()
+    mock_embedding_service.get_embedding.side_effect = lambda text: rng.standard_normal(8).astype(np.float32)
+    monitor = SimilarityMonitor(embedding_service=mock_embedding_service)
+    
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=Mock(),
+        similarity_monitor=monitor
+    )
+    
+    def mock_execute_cycle(state, diversity_feedback=None):
+        state.reflection_history.append(f"Reflection for cycle {state.cycle_number}")
+        return state
+    
+    orchestrator._execute_cycle = mock_execute_cycle
+    orchestrator.run_experiment()
+    
+    embeddings = orchestrator.reflection_embeddings
+    assert embeddings.shape == (3, 8)
+    assert embeddings.dtype == np.float32
+    assert np.shares_memory(embeddings, monitor.history)
+
+
+def test_reflection_embeddings_empty_without_monitor(mock_config, mock_ollama_interface):
+    """Test that reflection embeddings are empty when diversity monitoring is disabled."""
+    orchestrator = CycleOrchestrator(
+        config=mock_config,
+        ollama_interface=mock_ollama_interface,
+        tool_dispatcher=Mock()
+    )
+    
+    assert len(orchestrator.reflection_embeddings) == 0
+
+
 def test_run_experiment_logs_cycle_end_with_reflection(mock_config, mock_ollama_interface):
     """Test that run_experiment logs CYCLE_END event with final_reflection."""
     mock_logger = Mock()
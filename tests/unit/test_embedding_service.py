@@ -1,5 +1,9 @@
 """Unit tests for EmbeddingService."""
 
+# Standard library imports
+import sys
+from unittest.mock import Mock, patch
+
 # Third-party imports
 import numpy as np
 import pytest
@@ -66,3 +70,164 @@ def test_get_embedding_handles_empty_string():
     
     assert isinstance(embedding, np.ndarray)
     assert embedding.shape == (384,)
+
+
+def test_get_embedding_returns_float32():
+    """Test that get_embedding casts model output to float32."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_st.return_value.encode.return_value = np.ones(384, dtype=np.float64)
+        service = EmbeddingService()
+        
+        embedding = service.get_embedding("Some reflection")
+    
+    assert embedding.dtype == np.float32
+    assert embedding.shape == (384,)
+
+
+def test_init_passes_explicit_backend_to_model():
+    """Test that an explicit backend is forwarded to SentenceTransformer."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        service = EmbeddingService(backend='torch', device='cpu')
+        service.model
+    
+    assert service.backend == 'torch'
+    mock_st.assert_called_once_with('all-MiniLM-L6-v2', backend='torch', device='cpu')
+
+
+def test_init_selects_cuda_when_available():
+    """Test that the default device is CUDA when a GPU is available."""
+    with patch('contreact_ollama.analysis.embedding_service.torch.cuda.is_available', return_value=True):
+        assert EmbeddingService().device == 'cuda'
+    with patch('contreact_ollama.analysis.embedding_service.torch.cuda.is_available', return_value=False):
+        assert EmbeddingService().device == 'cpu'
+
+
+def test_model_is_loaded_lazily_and_once():
+    """Test that the model is not loaded until first use, then reused."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_st.return_value.encode.return_value = np.ones(384, dtype=np.float32)
+        service = EmbeddingService()
+        mock_st.assert_not_called()
+        
+        service.get_embedding("first")
+        service.get_embedding("second")
+    
+    mock_st.assert_called_once()
+
+
+def test_init_falls_back_to_torch_without_onnxruntime():
+    """Test that the default backend is torch when ONNX Runtime is not installed."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer'), \
+         patch('contreact_ollama.analysis.embedding_service.importlib.util.find_spec', return_value=None):
+        service = EmbeddingService()
+    
+    assert service.backend == 'torch'
+
+
+def test_init_selects_onnx_only_where_it_can_run_on_the_device():
+    """Test that ONNX is chosen for the CPU, and for CUDA only with onnxruntime-gpu."""
+    cpu_runtime = Mock()
+    cpu_runtime.get_available_providers.return_value = ['CPUExecutionProvider']
+    gpu_runtime = Mock()
+    gpu_runtime.get_available_providers.return_value = ['CUDAExecutionProvider', 'CPUExecutionProvider']
+    
+    with patch('contreact_ollama.analysis.embedding_service.importlib.util.find_spec', return_value=Mock()):
+        with patch.dict(sys.modules, {'onnxruntime': cpu_runtime}):
+            assert EmbeddingService(device='cpu').backend == 'onnx'
+            assert EmbeddingService(device='cuda').backend == 'torch'
+            assert EmbeddingService(device='mps').backend == 'torch'
+        with patch.dict(sys.modules, {'onnxruntime': gpu_runtime}):
+            assert EmbeddingService(device='cuda').backend == 'onnx'
+            assert EmbeddingService(device='cuda', backend='torch').backend == 'torch'
+
+
+def test_get_embeddings_encodes_all_texts_in_one_call():
+    """Test that get_embeddings batches texts into a single encode call."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_model = mock_st.return_value
+        mock_model.encode.return_value = np.ones((3, 384), dtype=np.float64)
+        service = EmbeddingService()
+        
+        embeddings = service.get_embeddings(["a", "b", "c"], batch_size=8)
+    
+    mock_model.encode.assert_called_once_with(
+        ["a", "b", "c"], batch_size=8, convert_to_numpy=True, normalize_embeddings=True
+    )
+    assert embeddings.shape == (3, 384)
+    assert embeddings.dtype == np.float32
+
+
+def test_get_embeddings_empty_list_returns_empty_matrix():
+    """Test that get_embeddings returns a (0, dim) matrix without invoking the model."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_model = mock_st.return_value
+        mock_model.get_sentence_embedding_dimension.return_value = 384
+        service = EmbeddingService()
+        
+        embeddings = service.get_embeddings([])
+    
+    mock_model.encode.assert_not_called()
+    assert embeddings.shape == (0, 384)
+
+
+def test_get_embedding_requests_normalized_output():
+    """Test that get_embedding asks the model for L2-normalized vectors."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_model = mock_st.return_value
+        mock_model.encode.return_value = np.ones(384, dtype=np.float32)
+        service = EmbeddingService()
+        
+        service.get_embedding("I explored topic X")
+    
+    mock_model.encode.assert_called_once_with(
+        "I explored topic X", convert_to_numpy=True, normalize_embeddings=True
+    )
+
+
+def test_get_embedding_caches_identical_text():
+    """Test that repeated text is served from cache without re-encoding."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_model = mock_st.return_value
+        mock_model.encode.side_effect = lambda text, **kwargs: np.full(384, len(text), dtype=np.float32)
+        service = EmbeddingService()
+        
+        first = service.get_embedding("same reflection")
+        second = service.get_embedding("same reflection")
+        other = service.get_embedding("different reflection")
+    
+    assert mock_model.encode.call_count == 2
+    assert second is first
+    assert not np.array_equal(first, other)
+
+
+def test_get_embedding_cache_evicts_least_recently_used():
+    """Test that the cache stays within cache_size by evicting the oldest entry."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_model = mock_st.return_value
+        mock_model.encode.return_value = np.ones(384, dtype=np.float32)
+        service = EmbeddingService(cache_size=2)
+        
+        service.get_embedding("a")
+        service.get_embedding("b")
+        service.get_embedding("a")  # Refresh "a"
+        service.get_embedding("c")  # Evicts "b"
+        service.get_embedding("a")
+        assert mock_model.encode.call_count == 3
+        
+        service.get_embedding("b")
+        assert mock_model.encode.call_count == 4
+
+
+def test_get_embedding_keys_cache_on_text():
+    """Test that cache entries are keyed on the text itself, so texts never share an entry."""
+    with patch('contreact_ollama.analysis.embedding_service.SentenceTransformer') as mock_st:
+        mock_st.return_value.encode.side_effect = lambda text, **kwargs: np.full(
+            384, len(text), dtype=np.float32
+        )
+        service = EmbeddingService()
+        
+        first = service.get_embedding("abc")
+        second = service.get_embedding("abcd")
+    
+    assert list(service._cache) == ["abc", "abcd"]
+    assert first[0] == 3 and second[0] == 4
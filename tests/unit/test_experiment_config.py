@@ -121,6 +121,20 @@ class TestTelegramConfigValidation:
         # Should not raise any exception
         config.validate_telegram_config()
     
+    def test_validate_telegram_config_reads_token_once(self, base_config, telegram_config):
+        """Test that the bot token is read from the environment once and kept on the config."""
+        config_data = {**base_config, **telegram_config}
+        config = ExperimentConfig(**config_data)
+        
+        with patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token"}):
+            config.validate_telegram_config()
+        
+        assert config.telegram_bot_token == "test_token"
+        
+        # Later validations reuse the resolved token
+        with patch.dict(os.environ, {}, clear=True):
+            config.validate_telegram_config()
+    
     @patch.dict(os.environ, {}, clear=True)
     def test_validate_telegram_config_enabled_no_token_raises_error(
         self, base_config, telegram_config
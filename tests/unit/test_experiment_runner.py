@@ -14,6 +14,12 @@ from contreact_ollama.core.config import ExperimentConfig
 from contreact_ollama.llm.ollama_interface import ModelNotFoundError
 
 
+@pytest.fixture(autouse=True)
+def isolated_workdir(tmp_path, monkeypatch):
+    """Run each test in tmp_path so services write logs/ and data/ there, not into the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestExperimentRunner:
     """Unit tests for ExperimentRunner class."""
     
@@ -151,6 +157,107 @@ class TestExperimentRunner:
         finally:
             Path(temp_path).unlink()
     
+    def test_load_config_invalid_log_rotate_cycles_raises_error(self):
+        """Test that load_config rejects a non-integer or non-positive log_rotate_cycles."""
+        for value, error in [('ten', TypeError), (True, TypeError), (0, ValueError), (-5, ValueError)]:
+            config_data = {
+                'run_id': 'test-run',
+                'model_name': 'llama3:latest',
+                'cycle_count': 5,
+                'ollama_client_config': {'host': 'http://localhost:11434'},
+                'model_options': {'temperature': 0.8},
+                'log_rotate_cycles': value
+            }
+            
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+                yaml.dump(config_data, f)
+                temp_path = f.name
+            
+            try:
+                runner = ExperimentRunner(temp_path)
+                
+                with pytest.raises(error) as exc_info:
+                    runner.load_config()
+                
+                assert 'log_rotate_cycles' in str(exc_info.value)
+            finally:
+                Path(temp_path).unlink()
+    
+    def test_load_config_accepts_null_or_positive_log_rotate_cycles(self):
+        """Test that load_config accepts log_rotate_cycles of null or a positive integer."""
+        for value in [None, 10]:
+            config_data = {
+                'run_id': 'test-run',
+                'model_name': 'llama3:latest',
+                'cycle_count': 5,
+                'ollama_client_config': {'host': 'http://localhost:11434'},
+                'model_options': {'temperature': 0.8},
+                'log_rotate_cycles': value
+            }
+            
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+                yaml.dump(config_data, f)
+                temp_path = f.name
+            
+            try:
+                config = ExperimentRunner(temp_path).load_config()
+                
+                assert config.log_rotate_cycles == value
+            finally:
+                Path(temp_path).unlink()
+    
+    def test_load_config_invalid_verbose_raises_error(self):
+        """Test that load_config raises TypeError for a non-boolean verbose."""
+        for value in ['no', 0, None]:
+            config_data = {
+                'run_id': 'test-run',
+                'model_name': 'llama3:latest',
+                'cycle_count': 5,
+                'ollama_client_config': {'host': 'http://localhost:11434'},
+                'model_options': {'temperature': 0.8},
+                'verbose': value
+            }
+            
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+                yaml.dump(config_data, f)
+                temp_path = f.name
+            
+            try:
+                runner = ExperimentRunner(temp_path)
+                
+                with pytest.raises(TypeError) as exc_info:
+                    runner.load_config()
+                
+                assert 'verbose' in str(exc_info.value)
+            finally:
+                Path(temp_path).unlink()
+    
+    def test_load_config_invalid_operator_response_cache_raises_error(self):
+        """Test that load_config raises TypeError for a non-boolean operator_response_cache."""
+        for value in ['false', 1, None]:
+            config_data = {
+                'run_id': 'test-run',
+                'model_name': 'llama3:latest',
+                'cycle_count': 5,
+                'ollama_client_config': {'host': 'http://localhost:11434'},
+                'model_options': {'temperature': 0.8},
+                'operator_response_cache': value
+            }
+            
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+                yaml.dump(config_data, f)
+                temp_path = f.name
+            
+            try:
+                runner = ExperimentRunner(temp_path)
+                
+                with pytest.raises(TypeError) as exc_info:
+                    runner.load_config()
+                
+                assert 'operator_response_cache' in str(exc_info.value)
+            finally:
+                Path(temp_path).unlink()
+    
     @patch('contreact_ollama.llm.ollama_interface.ollama.Client')
     def test_initialize_services_with_valid_model_succeeds(self, mock_ollama_client):
         """Test that initialize_services succeeds with valid model."""
@@ -192,6 +299,122 @@ class TestExperimentRunner:
         finally:
             Path(temp_path).unlink()
     
+    @patch('contreact_ollama.llm.ollama_interface.ollama.Client')
+    def test_initialize_services_reuses_loaded_config(self, mock_ollama_client):
+        """Test that initialize_services reuses the loaded config and keeps its services."""
+        # Arrange
+        config_data = {
+            'run_id': 'test-run',
+            'model_name': 'llama3:latest',
+            'cycle_count': 5,
+            'ollama_client_config': {'host': 'http://192.168.0.123:11434'},
+            'model_options': {'temperature': 0.8}
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(config_data, f)
+            temp_path = f.name
+        
+        mock_model = Mock()
+        mock_model.model = 'llama3:latest'
+        mock_ollama_client.return_value.list.return_value = Mock(models=[mock_model])
+        
+        try:
+            runner = ExperimentRunner(temp_path)
+            config = runner.load_config()
+            
+            # Act
+            with patch.object(runner, 'load_config', wraps=runner.load_config) as load_spy:
+                services = runner.initialize_services()
+            
+            # Assert - no second parse, and run() will find the same services
+            load_spy.assert_not_called()
+            assert runner.config is config
+            assert runner.services is services
+            assert runner.initialize_services() is services
+            services['logger'].close()
+            services['memory_tools'].close()
+        finally:
+            Path(temp_path).unlink()
+    
+    @patch('contreact_ollama.llm.ollama_interface.ollama.Client')
+    def test_run_releases_closed_services(self, mock_ollama_client):
+        """Test that run() drops its closed services so a second run() opens a fresh set."""
+        # Arrange
+        config_data = {
+            'run_id': 'test-run',
+            'model_name': 'llama3:latest',
+            'cycle_count': 5,
+            'ollama_client_config': {'host': 'http://192.168.0.123:11434'},
+            'model_options': {'temperature': 0.8}
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(config_data, f)
+            temp_path = f.name
+        
+        mock_model = Mock()
+        mock_model.model = 'llama3:latest'
+        mock_ollama_client.return_value.list.return_value = Mock(models=[mock_model])
+        
+        try:
+            runner = ExperimentRunner(temp_path)
+            
+            # Act
+            with patch('contreact_ollama.core.experiment_runner.JsonlLogger') as mock_logger, \
+                 patch('contreact_ollama.core.experiment_runner.MemoryTools') as mock_memory, \
+                 patch('contreact_ollama.core.experiment_runner.CycleOrchestrator'), \
+                 patch('contreact_ollama.core.experiment_runner.close_telegram_channel'):
+                runner.run()
+                assert not hasattr(runner, 'services')
+                runner.run()
+            
+            # Assert - each run opened and closed its own logger and memory DB
+            assert mock_logger.call_count == 2
+            assert mock_memory.call_count == 2
+            assert mock_logger.return_value.close.call_count == 2
+            assert mock_memory.return_value.close.call_count == 2
+        finally:
+            Path(temp_path).unlink()
+    
+    @patch('contreact_ollama.llm.ollama_interface.ollama.Client')
+    def test_initialize_services_failure_closes_opened_resources(self, mock_ollama_client):
+        """Test that a failure part-way through initialize_services closes the logger and memory DB."""
+        # Arrange
+        config_data = {
+            'run_id': 'test-run',
+            'model_name': 'llama3:latest',
+            'cycle_count': 5,
+            'ollama_client_config': {'host': 'http://192.168.0.123:11434'},
+            'model_options': {'temperature': 0.8}
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(config_data, f)
+            temp_path = f.name
+        
+        mock_model = Mock()
+        mock_model.model = 'llama3:latest'
+        mock_ollama_client.return_value.list.return_value = Mock(models=[mock_model])
+        
+        try:
+            runner = ExperimentRunner(temp_path)
+            
+            # Act
+            with patch('contreact_ollama.core.experiment_runner.JsonlLogger') as mock_logger, \
+                 patch('contreact_ollama.core.experiment_runner.MemoryTools') as mock_memory, \
+                 patch('contreact_ollama.core.experiment_runner.ToolDispatcher',
+                       side_effect=RuntimeError("boom")):
+                with pytest.raises(RuntimeError):
+                    runner.initialize_services()
+            
+            # Assert
+            mock_logger.return_value.close.assert_called_once()
+            mock_memory.return_value.close.assert_called_once()
+            assert not hasattr(runner, 'services')
+        finally:
+            Path(temp_path).unlink()
+    
     @patch('contreact_ollama.llm.ollama_interface.ollama.Client')
     def test_initialize_services_with_invalid_model_raises_error(self, mock_ollama_client):
         """Test that initialize_services raises ModelNotFoundError for unavailable model."""
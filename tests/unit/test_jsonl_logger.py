@@ -4,12 +4,18 @@
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 # Third-party imports
+import numpy as np
 import pytest
 
 # Local application imports
-from contreact_ollama.logging.jsonl_logger import JsonlLogger, EventType, LogRecord
+from contreact_ollama.logging import jsonl_logger
+from contreact_ollama.logging.jsonl_logger import (
+    JsonlLogger, EventType, LogRecord, expand_prompt_messages, iter_log_lines, new_prompt_hash,
+    update_prompt_hash
+)
 
 
 @pytest.fixture
@@ -156,8 +162,8 @@ def test_multiple_log_events_append(temp_log_file):
         assert record['payload']['cycle'] == i
 
 
-def test_logger_flush_ensures_immediate_write(temp_log_file):
-    """Test that logger flushes data immediately (without closing)."""
+def test_logger_flush_writes_buffered_events(temp_log_file):
+    """Test that buffered events reach the file on flush (without closing)."""
     logger = JsonlLogger(str(temp_log_file))
     
     logger.log_event(
@@ -166,6 +172,7 @@ def test_logger_flush_ensures_immediate_write(temp_log_file):
         event_type=EventType.CYCLE_START,
         payload={}
     )
+    logger.flush()
     
     # Read file WITHOUT closing logger
     with open(temp_log_file, 'r') as f:
@@ -179,6 +186,33 @@ def test_logger_flush_ensures_immediate_write(temp_log_file):
     logger.close()
 
 
+def test_cycle_end_flushes_buffered_events(temp_log_file):
+    """Test that events are buffered until CYCLE_END, which flushes the whole cycle."""
+    logger = JsonlLogger(str(temp_log_file))
+    
+    logger.log_event(
+        run_id="test-run",
+        cycle_number=1,
+        event_type=EventType.CYCLE_START,
+        payload={}
+    )
+    
+    # Nothing written yet - event is still buffered
+    assert temp_log_file.read_text() == ""
+    
+    logger.log_event(
+        run_id="test-run",
+        cycle_number=1,
+        event_type=EventType.CYCLE_END,
+        payload={}
+    )
+    
+    lines = temp_log_file.read_text().splitlines()
+    assert [json.loads(line)['event_type'] for line in lines] == ["CYCLE_START", "CYCLE_END"]
+    
+    logger.close()
+
+
 def test_context_manager_closes_file(temp_log_file):
     """Test that logger context manager properly closes file."""
     with JsonlLogger(str(temp_log_file)) as logger:
@@ -277,3 +311,183 @@ def test_complex_payload_is_serialized(temp_log_file):
     
     record = json.loads(line)
     assert record['payload'] == complex_payload
+
+
+def test_log_events_writes_records_in_order(temp_log_file):
+    """Test that log_events writes all records, keeping their creation timestamps."""
+    logger = JsonlLogger(str(temp_log_file))
+    
+    records = [
+        logger.create_record("test-run", 1, EventType.LLM_INVOCATION, {"step": 1}),
+        logger.create_record("test-run", 1, EventType.TOOL_CALL, {"step": 2}),
+    ]
+    logger.log_events(records)
+    logger.close()
+    
+    with open(temp_log_file, 'r') as f:
+        lines = [json.loads(line) for line in f]
+    
+    assert [line['event_type'] for line in lines] == ["LLM_INVOCATION", "TOOL_CALL"]
+    assert [line['payload'] for line in lines] == [{"step": 1}, {"step": 2}]
+    assert [line['timestamp'] for line in lines] == [record.timestamp for record in records]
+
+
+def test_serialization_is_compact_utf8(temp_log_file):
+    """Test that records are written as compact UTF-8 JSON."""
+    logger = JsonlLogger(str(temp_log_file))
+    logger.log_event(
+        run_id="test-run",
+        cycle_number=1,
+        event_type=EventType.TOOL_CALL,
+        payload={"text": "café 🤖", "n": [1, 2.5, None, True]}
+    )
+    logger.close()
+    
+    raw = temp_log_file.read_bytes()
+    assert "café 🤖".encode('utf-8') in raw
+    assert b'", "' not in raw  # No separator padding
+    assert json.loads(raw)['payload'] == {"text": "café 🤖", "n": [1, 2.5, None, True]}
+
+
+def test_numpy_arrays_and_int_keys_are_serialized(temp_log_file):
+    """Test that numpy arrays and non-string dict keys in payloads are logged."""
+    logger = JsonlLogger(str(temp_log_file))
+    logger.log_event(
+        run_id="test-run",
+        cycle_number=1,
+        event_type=EventType.CYCLE_END,
+        payload={"embedding": np.array([0.5, 0.25], dtype=np.float32), "counts": {1: "one"}}
+    )
+    logger.close()
+    
+    record = json.loads(temp_log_file.read_text(encoding='utf-8'))
+    assert record['payload'] == {"embedding": [0.5, 0.25], "counts": {"1": "one"}}
+
+
+def _delta_event(cycle_number, offset, suffix, prompt_hash):
+    """Build an LLM_INVOCATION event logged as a prompt delta."""
+    return {
+        "run_id": "test-run",
+        "cycle_number": cycle_number,
+        "event_type": "LLM_INVOCATION",
+        "payload": {
+            "prompt_offset": offset,
+            "prompt_suffix": suffix,
+            "prompt_hash_so_far": update_prompt_hash(prompt_hash, suffix),
+        },
+    }
+
+
+def test_expand_prompt_messages_replays_deltas_per_cycle():
+    """Test that full prompts are rebuilt from suffixes within each cycle."""
+    system = {"role": "system", "content": "sys"}
+    assistant = {"role": "assistant", "content": "", "tool_calls": [{"function": {"name": "x"}}]}
+    tool = {"role": "tool", "content": "ok"}
+    
+    cycle1_hash = new_prompt_hash()
+    cycle2_hash = new_prompt_hash()
+    events = [
+        _delta_event(1, 0, [system], cycle1_hash),
+        {"event_type": "TOOL_CALL", "cycle_number": 1, "payload": {}},
+        _delta_event(1, 1, [assistant, tool], cycle1_hash),
+        _delta_event(2, 0, [system], cycle2_hash),
+    ]
+    
+    expand_prompt_messages(events)
+    
+    assert events[0]['payload']['prompt_messages'] == [system]
+    assert events[2]['payload']['prompt_messages'] == [system, assistant, tool]
+    assert events[3]['payload']['prompt_messages'] == [system]
+
+
+def test_expand_prompt_messages_keeps_full_prompts():
+    """Test that events from older logs with full prompt_messages are unchanged."""
+    events = [{
+        "event_type": "LLM_INVOCATION",
+        "cycle_number": 1,
+        "payload": {"prompt_messages": [{"role": "system", "content": "sys"}]},
+    }]
+    
+    assert expand_prompt_messages(events)[0]['payload'] == {
+        "prompt_messages": [{"role": "system", "content": "sys"}]
+    }
+
+
+def test_expand_prompt_messages_rejects_hash_mismatch():
+    """Test that a delta whose hash does not match the transcript raises ValueError."""
+    event = _delta_event(1, 0, [{"role": "system", "content": "sys"}], new_prompt_hash())
+    event['payload']['prompt_hash_so_far'] = "0" * 32
+    
+    with pytest.raises(ValueError):
+        expand_prompt_messages([event])
+
+
+def test_record_envelope_field_order(temp_log_file):
+    """Test that each line carries the envelope fields in a fixed order before the payload."""
+    logger = JsonlLogger(str(temp_log_file))
+    logger.log_event(
+        run_id="run-é",
+        cycle_number=7,
+        event_type=EventType.CYCLE_START,
+        payload={}
+    )
+    logger.close()
+    
+    line = temp_log_file.read_text(encoding='utf-8')
+    assert line.endswith('\n')
+    assert list(json.loads(line)) == ["timestamp", "run_id", "cycle_number", "event_type", "payload"]
+    assert '"run_id":"run-é","cycle_number":7,"event_type":"CYCLE_START","payload":{}}' in line
+
+
+def test_rotation_compresses_segments_and_keeps_order(tmp_path):
+    """Test that rotated logs are gzipped segments read back in write order."""
+    log_path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(str(log_path), rotate_every_cycles=2)
+    for cycle in range(1, 6):
+        logger.log_event("run", cycle, EventType.CYCLE_START, {})
+        logger.log_event("run", cycle, EventType.CYCLE_END, {"final_reflection": f"r{cycle}"})
+    logger.close()
+    
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "run.0001.jsonl.gz", "run.0002.jsonl.gz", "run.jsonl"
+    ]
+    
+    events = [json.loads(line) for line in iter_log_lines(log_path)]
+    assert [e['cycle_number'] for e in events] == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    assert events[-1]['payload'] == {"final_reflection": "r5"}
+
+
+def test_iter_log_lines_follows_segment_compressed_after_listing(tmp_path):
+    """Test that a segment gzipped and removed between listing and opening is still read."""
+    log_path = tmp_path / "run.jsonl"
+    (tmp_path / "run.0001.segment").write_text('{"cycle_number": 1}\n')
+    log_path.write_text('{"cycle_number": 2}\n')
+    
+    def list_then_compress(path):
+        segments = real_segment_files(path)
+        # The background compressor publishes the .jsonl.gz and unlinks the segment
+        jsonl_logger._compress_segment(tmp_path / "run.0001.segment")
+        return segments
+    
+    real_segment_files = jsonl_logger._segment_files
+    with patch.object(jsonl_logger, "_segment_files", side_effect=list_then_compress):
+        events = [json.loads(line) for line in iter_log_lines(log_path)]
+    
+    assert [e['cycle_number'] for e in events] == [1, 2]
+
+
+def test_iter_log_lines_without_rotation(temp_log_file):
+    """Test that an unrotated log is read as-is."""
+    logger = JsonlLogger(str(temp_log_file))
+    logger.log_event("run", 1, EventType.CYCLE_END, {})
+    logger.close()
+    
+    lines = list(iter_log_lines(temp_log_file))
+    assert len(lines) == 1
+    assert json.loads(lines[0])['event_type'] == "CYCLE_END"
+
+
+def test_iter_log_lines_missing_log_raises(tmp_path):
+    """Test that reading a log that does not exist raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        list(iter_log_lines(tmp_path / "missing.jsonl"))
@@ -219,3 +219,88 @@ def test_run_id_isolation(temp_db):
         assert "unique_key1" not in list2
     finally:
         memory2.close()
+
+
+def test_reopened_memory_updates_and_deletes_existing_entries(temp_db):
+    """Test that keys persisted by an earlier instance are updated and deleted in place."""
+    memory = MemoryTools(db_path=temp_db, run_id="test-run")
+    memory.write("first", "1")
+    memory.write("second", "2")
+    memory.close()
+    
+    memory = MemoryTools(db_path=temp_db, run_id="test-run")
+    try:
+        assert memory.list() == "first, second"
+        assert memory.write("first", "updated") == "Updated key 'first' with new value"
+        assert memory.delete("second") == "Deleted key 'second'"
+        
+        Entry = Query()
+        assert len(memory.db.search(Entry.key == "first")) == 1
+        assert memory.db.search(Entry.key == "second") == []
+        assert memory.read("first") == "updated"
+        assert memory.list() == "first"
+    finally:
+        memory.close()
+
+
+def test_write_is_on_disk_before_close(memory_tools, temp_db):
+    """Test that writes reach the database file immediately despite read caching."""
+    memory_tools.write("live_key", "live_value")
+    
+    reader = TinyDB(temp_db)
+    try:
+        assert reader.search(Query().key == "live_key")[0]['value'] == "live_value"
+    finally:
+        reader.close()
+
+
+def test_concurrent_runs_sharing_a_file_keep_each_others_entries(temp_db):
+    """Test that two instances writing the same file do not clobber each other."""
+    memory1 = MemoryTools(db_path=temp_db, run_id="run-1")
+    memory2 = MemoryTools(db_path=temp_db, run_id="run-2")
+    try:
+        memory1.write("a", "1")
+        memory2.write("b", "2")
+        memory1.write("c", "3")
+        memory2.write("b", "updated")
+        memory1.delete("a")
+        memory2.write("d", "4")
+        
+        assert memory1.list() == "c"
+        assert memory2.list() == "b, d"
+        assert memory1.read("c") == "3"
+        assert memory2.read("d") == "4"
+    finally:
+        memory1.close()
+        memory2.close()
+    
+    reader = TinyDB(temp_db)
+    try:
+        stored = {(entry['run_id'], entry['key']): entry['value'] for entry in reader.all()}
+        assert stored == {
+            ("run-1", "c"): "3",
+            ("run-2", "b"): "updated",
+            ("run-2", "d"): "4",
+        }
+    finally:
+        reader.close()
+
+
+def test_insert_after_read_of_externally_changed_file_uses_fresh_id(temp_db):
+    """Test that a read between another run's write and this run's insert does not hide the change."""
+    memory1 = MemoryTools(db_path=temp_db, run_id="run-1")
+    memory2 = MemoryTools(db_path=temp_db, run_id="run-2")
+    try:
+        memory1.write("a", "1")
+        memory2.write("b", "2")
+        assert memory1.read("a") == "1"
+        memory1.write("c", "3")
+        memory2.write("d", "4")
+        
+        assert memory1.list() == "a, c"
+        assert memory2.list() == "b, d"
+        assert memory1.read("c") == "3"
+        assert memory2.read("d") == "4"
+    finally:
+        memory1.close()
+        memory2.close()
@@ -1,7 +1,9 @@
 """Unit tests for OllamaInterface class."""
 
 # Standard library imports
-from unittest.mock import Mock, patch
+import asyncio
+import logging
+from unittest.mock import AsyncMock, Mock, patch
 
 # Third-party imports
 import pytest
@@ -172,7 +174,8 @@ def test_execute_chat_completion_calls_client(mock_ollama_client):
         model="llama3:latest",
         messages=messages,
         tools=tools,
-        options=options
+        options=options,
+        keep_alive=None
     )
     assert result["message"]["role"] == "assistant"
     assert result["message"]["content"] == "Hello"
@@ -206,6 +209,48 @@ def test_execute_chat_completion_returns_response(mock_ollama_client):
     assert result["message"]["content"] == "Test response"
 
 
+def test_execute_chat_completion_passes_keep_alive(mock_ollama_client):
+    """Test that a configured keep_alive is sent with every chat request."""
+    # Arrange
+    mock_instance = Mock()
+    mock_instance.chat.return_value = Mock(message=Mock(role="assistant", content="Hi", tool_calls=None))
+    mock_ollama_client.return_value = mock_instance
+    
+    interface = OllamaInterface(keep_alive="30m")
+    
+    # Act
+    interface.execute_chat_completion(
+        model_name="llama3:latest", messages=[], tools=[], options={}
+    )
+    
+    # Assert
+    assert mock_instance.chat.call_args.kwargs["keep_alive"] == "30m"
+
+
+def test_execute_chat_completion_validates_tools_once(mock_ollama_client):
+    """Test that the same tool definitions list is converted to ollama.Tool only once."""
+    # Arrange
+    mock_instance = Mock()
+    mock_instance.chat.return_value = Mock(message=Mock(role="assistant", content="Hi", tool_calls=None))
+    mock_ollama_client.return_value = mock_instance
+    
+    interface = OllamaInterface()
+    tools = [{"type": "function", "function": {"name": "write"}}]
+    
+    # Act
+    for _ in range(2):
+        interface.execute_chat_completion(
+            model_name="llama3:latest", messages=[], tools=tools, options={}
+        )
+    
+    # Assert
+    first_tools = mock_instance.chat.call_args_list[0].kwargs["tools"]
+    second_tools = mock_instance.chat.call_args_list[1].kwargs["tools"]
+    assert second_tools is first_tools
+    assert isinstance(first_tools[0], ollama.Tool)
+    assert first_tools[0].function.name == "write"
+
+
 def test_execute_chat_completion_handles_error(mock_ollama_client):
     """Test that execute_chat_completion raises ollama.ResponseError on failure."""
     # Arrange
@@ -227,6 +272,34 @@ def test_execute_chat_completion_handles_error(mock_ollama_client):
     assert "Error during chat completion" in str(exc_info.value)
 
 
+def test_execute_chat_completion_error_keeps_original_cause(mock_ollama_client):
+    """Test that the wrapped ResponseError chains the original exception."""
+    # Arrange
+    original = TimeoutError("Connection timeout")
+    mock_ollama_client.return_value.chat.side_effect = original
+    interface = OllamaInterface()
+    
+    # Act & Assert
+    with pytest.raises(ollama.ResponseError) as exc_info:
+        interface.execute_chat_completion(
+            model_name="llama3:latest", messages=[], tools=[], options={}
+        )
+    
+    assert exc_info.value.__cause__ is original
+
+
+def test_aexecute_chat_completion_propagates_cancellation(mock_ollama_client):
+    """Test that cancelling the async call is not converted into a ResponseError."""
+    with patch('ollama.AsyncClient') as mock_async_client:
+        mock_async_client.return_value.chat = AsyncMock(side_effect=asyncio.CancelledError())
+        interface = OllamaInterface()
+        
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(interface.aexecute_chat_completion(
+                model_name="llama3:latest", messages=[], tools=[], options={}
+            ))
+
+
 def test_execute_chat_completion_with_tool_calls(mock_ollama_client):
     """Test that execute_chat_completion handles response with tool calls."""
     # Arrange
@@ -268,6 +341,120 @@ def test_execute_chat_completion_with_tool_calls(mock_ollama_client):
     assert result["message"]["tool_calls"][0]["function"]["arguments"]["key"] == "test"
 
 
+def test_convert_tool_call_strips_control_characters(mock_ollama_client, caplog):
+    """Test that string arguments with raw control characters are cleaned and parsed."""
+    # Arrange
+    interface = OllamaInterface()
+    mock_tool_call = Mock()
+    mock_tool_call.id = "call_789"
+    mock_tool_call.function.name = "write"
+    mock_tool_call.function.arguments = '{"key": "notes", "value": "line\x01 one\x1f"}'
+    
+    # Act
+    with caplog.at_level(logging.INFO, logger="contreact_ollama.llm.ollama_interface"):
+        result = interface._convert_tool_call(mock_tool_call)
+    
+    # Assert
+    assert result["function"]["arguments"] == {"key": "notes", "value": "line one"}
+    assert "JSON parsing failed for tool call 'write'" in caplog.text
+    assert "Successfully cleaned and parsed arguments" in caplog.text
+
+
+@pytest.mark.parametrize("raw_arguments, expected", [
+    ('{"key": "notes"}', {"key": "notes"}),
+    ('I will now write my notes', {}),
+    ('"just a quoted string"', {}),
+])
+def test_convert_tool_call_parses_string_arguments(mock_ollama_client, raw_arguments, expected):
+    """Test that string arguments parse to a dict, and raw or scalar text becomes empty arguments."""
+    # Arrange
+    interface = OllamaInterface()
+    mock_tool_call = Mock()
+    mock_tool_call.function.name = "write"
+    mock_tool_call.function.arguments = raw_arguments
+    
+    # Act
+    result = interface._convert_tool_call(mock_tool_call)
+    
+    # Assert
+    assert result["function"]["arguments"] == expected
+
+
+def test_execute_chat_completion_streams_tool_calls_to_callback(mock_ollama_client):
+    """Test that on_tool_call streams the response and reports tool calls as they arrive."""
+    # Arrange
+    def make_chunk(role, content, tool_calls):
+        chunk = Mock()
+        chunk.message.role = role
+        chunk.message.content = content
+        chunk.message.tool_calls = tool_calls
+        return chunk
+    
+    mock_tool_call = Mock()
+    mock_tool_call.id = "call_1"
+    mock_tool_call.function.name = "read"
+    mock_tool_call.function.arguments = {"key": "notes"}
+    
+    mock_instance = Mock()
+    mock_instance.chat.return_value = iter([
+        make_chunk("assistant", "Let me ", None),
+        make_chunk(None, "check.", [mock_tool_call]),
+        make_chunk(None, "", None),
+    ])
+    mock_ollama_client.return_value = mock_instance
+    
+    interface = OllamaInterface()
+    received = []
+    
+    # Act
+    result = interface.execute_chat_completion(
+        model_name="llama3:latest",
+        messages=[],
+        tools=[],
+        options={},
+        on_tool_call=received.append
+    )
+    
+    # Assert
+    assert mock_instance.chat.call_args.kwargs["stream"] is True
+    assert result["message"]["role"] == "assistant"
+    assert result["message"]["content"] == "Let me check."
+    assert received == result["message"]["tool_calls"]
+    assert received[0] == {"id": "call_1", "function": {"name": "read", "arguments": {"key": "notes"}}}
+
+
+def test_execute_chat_completion_propagates_callback_error_unchanged(mock_ollama_client):
+    """Test that an exception from on_tool_call is not wrapped as an Ollama error."""
+    # Arrange
+    chunk = Mock()
+    chunk.message.role = "assistant"
+    chunk.message.content = ""
+    mock_tool_call = Mock()
+    mock_tool_call.id = "call_1"
+    mock_tool_call.function.name = "read"
+    mock_tool_call.function.arguments = {"key": "notes"}
+    chunk.message.tool_calls = [mock_tool_call]
+    
+    mock_instance = Mock()
+    mock_instance.chat.return_value = iter([chunk])
+    mock_ollama_client.return_value = mock_instance
+    
+    interface = OllamaInterface()
+    
+    def on_tool_call(tool_call):
+        raise RuntimeError("executor shut down")
+    
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="executor shut down"):
+        interface.execute_chat_completion(
+            model_name="llama3:latest",
+            messages=[],
+            tools=[],
+            options={},
+            on_tool_call=on_tool_call
+        )
+
+
 def test_execute_chat_completion_malformed_tool_call_with_unicode(mock_ollama_client, capsys):
     """Test graceful degradation when model produces malformed tool call with unicode escape sequences."""
     # Arrange
@@ -425,3 +612,85 @@ def test_execute_chat_completion_valid_tool_call_still_works(mock_ollama_client)
     assert len(result["message"]["tool_calls"]) == 1
     assert result["message"]["tool_calls"][0]["function"]["name"] == "send_message_to_operator"
     assert result["message"]["tool_calls"][0]["function"]["arguments"]["message"] == "Hello operator"
+
+
+def test_aexecute_chat_completion_returns_response(mock_ollama_client):
+    """Test that the async variant awaits AsyncClient.chat and converts the response."""
+    # Arrange
+    mock_message = Mock()
+    mock_message.role = "assistant"
+    mock_message.content = "Async response"
+    mock_message.tool_calls = None
+    mock_response = Mock()
+    mock_response.message = mock_message
+    
+    with patch('ollama.AsyncClient') as mock_async_client:
+        mock_async_client.return_value.chat = AsyncMock(return_value=mock_response)
+        interface = OllamaInterface(host="http://192.168.0.123:11434")
+        
+        # Act
+        result = asyncio.run(interface.aexecute_chat_completion(
+            model_name="llama3:latest",
+            messages=[{"role": "user", "content": "Hello"}],
+            tools=[],
+            options={"temperature": 0.7}
+        ))
+    
+    # Assert
+    mock_async_client.assert_called_once_with(host="http://192.168.0.123:11434")
+    mock_async_client.return_value.chat.assert_awaited_once_with(
+        model="llama3:latest",
+        messages=[{"role": "user", "content": "Hello"}],
+        tools=[],
+        options={"temperature": 0.7},
+        keep_alive=None
+    )
+    assert result == {"message": {"role": "assistant", "content": "Async response"}}
+
+
+def test_aexecute_chat_completion_degrades_malformed_tool_call(mock_ollama_client, capsys):
+    """Test that the async variant degrades tool call parsing errors like the sync one."""
+    # Arrange
+    error_msg = "error parsing tool call: raw='{\"message\":\"Partial thought\"}', err=bad escape"
+    
+    with patch('ollama.AsyncClient') as mock_async_client:
+        mock_async_client.return_value.chat = AsyncMock(side_effect=ollama.ResponseError(error_msg))
+        interface = OllamaInterface()
+        
+        # Act
+        result = asyncio.run(interface.aexecute_chat_completion(
+            model_name="llama3:latest", messages=[], tools=[], options={}
+        ))
+    
+    # Assert
+    assert result == {"message": {"role": "assistant", "content": "Partial thought"}}
+    assert "Degrading to text response" in capsys.readouterr().out
+
+
+def test_aexecute_chat_completion_batch_runs_requests_concurrently(mock_ollama_client):
+    """Test that batched completions overlap and come back in request order."""
+    # Arrange
+    in_flight = []
+    max_in_flight = []
+    
+    async def fake_chat(model, messages, tools, options, keep_alive):
+        in_flight.append(model)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(model)
+        return Mock(message=Mock(role="assistant", content=messages[0]["content"], tool_calls=None))
+    
+    with patch('ollama.AsyncClient') as mock_async_client:
+        mock_async_client.return_value.chat = fake_chat
+        interface = OllamaInterface()
+        
+        # Act
+        results = asyncio.run(interface.aexecute_chat_completion_batch([
+            {"model_name": f"model-{i}", "messages": [{"role": "user", "content": f"q{i}"}],
+             "tools": [], "options": {}}
+            for i in range(3)
+        ]))
+    
+    # Assert
+    assert max(max_in_flight) == 3
+    assert [r["message"]["content"] for r in results] == ["q0", "q1", "q2"]
@@ -7,10 +7,23 @@ from unittest.mock import patch, call, MagicMock
 import pytest
 
 # Local application imports
-from contreact_ollama.tools.operator_communication import send_message_to_operator
+from contreact_ollama.tools.operator_communication import (
+    CACHED_RESPONSE_PREFIX,
+    clear_operator_response_cache,
+    close_telegram_channel,
+    send_message_to_operator,
+)
 from contreact_ollama.core.config import ExperimentConfig
 
 
+@pytest.fixture(autouse=True)
+def reset_telegram_channel():
+    """Drop any Telegram channel and cached replies kept by a previous test."""
+    yield
+    close_telegram_channel()
+    clear_operator_response_cache()
+
+
 # ===== Backward Compatibility Tests (No Config) =====
 
 def test_send_message_no_config_uses_terminal():
@@ -89,6 +102,80 @@ def test_send_message_config_none_uses_terminal():
         instance.send_and_wait.assert_called_once_with("Test", "run-001", 5)
 
 
+# ===== Response Cache Tests =====
+
+def test_send_message_reuses_reply_to_identical_message_when_cache_enabled():
+    """Test a repeated message in the same run is answered from the cache."""
+    config = ExperimentConfig(
+        run_id="test-run",
+        model_name="test-model",
+        cycle_count=1,
+        ollama_client_config={"host": "http://localhost:11434"},
+        model_options={},
+        operator_response_cache=True
+    )
+    
+    with patch('contreact_ollama.tools.operator_communication.TerminalChannel') as mock_terminal:
+        instance = MagicMock()
+        instance.send_and_wait.side_effect = ["yes", "no", "later"]
+        mock_terminal.return_value = instance
+        
+        first = send_message_to_operator("Continue?", config, "run-001", 1)
+        repeated = send_message_to_operator("Continue?", config, "run-001", 2)
+        different = send_message_to_operator("Stop?", config, "run-001", 3)
+        other_run = send_message_to_operator("Continue?", config, "run-002", 1)
+        
+        assert (first, different, other_run) == ("yes", "no", "later")
+        assert repeated == CACHED_RESPONSE_PREFIX + "yes"
+        assert instance.send_and_wait.call_count == 3
+
+
+def test_send_message_marks_only_cached_replies():
+    """Test a cached reply is distinguishable from a fresh operator answer."""
+    config = ExperimentConfig(
+        run_id="test-run",
+        model_name="test-model",
+        cycle_count=1,
+        ollama_client_config={"host": "http://localhost:11434"},
+        model_options={},
+        operator_response_cache=True
+    )
+    
+    with patch('contreact_ollama.tools.operator_communication.TerminalChannel') as mock_terminal:
+        instance = MagicMock()
+        instance.send_and_wait.return_value = "yes"
+        mock_terminal.return_value = instance
+        
+        fresh = send_message_to_operator("Continue?", config, "run-001", 1)
+        cached = send_message_to_operator("Continue?", config, "run-001", 2)
+        cached_again = send_message_to_operator("Continue?", config, "run-001", 3)
+        
+        assert not fresh.startswith(CACHED_RESPONSE_PREFIX)
+        assert cached == cached_again == CACHED_RESPONSE_PREFIX + "yes"
+
+
+def test_send_message_asks_again_when_cache_disabled():
+    """Test repeated messages reach the operator by default."""
+    config = ExperimentConfig(
+        run_id="test-run",
+        model_name="test-model",
+        cycle_count=1,
+        ollama_client_config={"host": "http://localhost:11434"},
+        model_options={}
+    )
+    
+    with patch('contreact_ollama.tools.operator_communication.TerminalChannel') as mock_terminal:
+        instance = MagicMock()
+        instance.send_and_wait.side_effect = ["yes", "no"]
+        mock_terminal.return_value = instance
+        
+        send_message_to_operator("Continue?", config, "run-001", 1)
+        result = send_message_to_operator("Continue?", config, "run-001", 2)
+        
+        assert result == "no"
+        assert instance.send_and_wait.call_count == 2
+
+
 # ===== Telegram Channel Selection Tests =====
 
 def test_send_message_telegram_enabled_uses_telegram():
@@ -120,9 +207,67 @@ def test_send_message_telegram_enabled_uses_telegram():
         # Verify send_and_wait was called
         instance.send_and_wait.assert_called_once_with("Test message", "run-001", 5)
         
+        # Verify the channel stays open for the next exchange
+        instance.close.assert_not_called()
+        
         assert result == "telegram response"
 
 
+def test_send_message_telegram_reuses_channel_until_closed():
+    """Test that consecutive Telegram messages share one channel until it is closed."""
+    config = ExperimentConfig(
+        run_id="test-run",
+        model_name="test-model",
+        cycle_count=1,
+        ollama_client_config={"host": "http://localhost:11434"},
+        model_options={},
+        telegram_enabled=True,
+        telegram_authorized_users=[123456789],
+        telegram_timeout_minutes=5
+    )
+    
+    with patch('contreact_ollama.tools.operator_communication.TelegramChannel') as mock_telegram:
+        instance = mock_telegram.return_value
+        instance.send_and_wait.return_value = "telegram response"
+        
+        send_message_to_operator("First", config, "run-001", 1)
+        send_message_to_operator("Second", config, "run-001", 2)
+        
+        mock_telegram.assert_called_once()
+        assert instance.send_and_wait.call_count == 2
+        
+        close_telegram_channel()
+        instance.close.assert_called_once()
+
+
+def test_send_message_telegram_connection_error_drops_channel():
+    """Test that a channel failing mid-exchange is closed and recreated next time."""
+    config = ExperimentConfig(
+        run_id="test-run",
+        model_name="test-model",
+        cycle_count=1,
+        ollama_client_config={"host": "http://localhost:11434"},
+        model_options={},
+        telegram_enabled=True,
+        telegram_authorized_users=[123456789],
+        telegram_timeout_minutes=5
+    )
+    
+    with patch('contreact_ollama.tools.operator_communication.TelegramChannel') as mock_telegram, \
+         patch('contreact_ollama.tools.operator_communication.TerminalChannel') as mock_terminal:
+        broken, healthy = MagicMock(), MagicMock()
+        broken.send_and_wait.side_effect = ConnectionError("Network down")
+        healthy.send_and_wait.return_value = "telegram response"
+        mock_telegram.side_effect = [broken, healthy]
+        mock_terminal.return_value.send_and_wait.return_value = "terminal fallback"
+        
+        assert send_message_to_operator("First", config, "run-001", 1) == "terminal fallback"
+        broken.close.assert_called_once()
+        
+        assert send_message_to_operator("Second", config, "run-001", 2) == "telegram response"
+        assert mock_telegram.call_count == 2
+
+
 # ===== Fallback Behavior Tests =====
 
 def test_send_message_telegram_connection_error_falls_back_to_terminal():
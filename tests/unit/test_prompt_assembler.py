@@ -180,3 +180,54 @@ def test_build_prompt_reflection_history_with_diversity_feedback():
     assert "Test system prompt" in messages[0]["content"]
     assert "Previous reflection" in messages[0]["content"]
     assert "Try different approaches" in messages[0]["content"]
+
+
+def test_build_prompt_reuses_system_prefix_within_cycle():
+    """Test that later turns of a cycle reuse the cached system prompt prefix."""
+    # Setup
+    agent_state = AgentState(
+        run_id="test-run",
+        cycle_number=2,
+        model_name="llama3:latest",
+        message_history=[],
+        reflection_history=["Previous reflection"]
+    )
+    tool_definitions = [{"type": "function", "function": {"name": "write", "description": "Write"}}]
+    
+    # Execute - second turn after the agent has called a tool
+    first = build_prompt(agent_state, "Test system prompt", tool_definitions, "Advisory")
+    prefix = agent_state.system_prompt_prefix
+    agent_state.message_history.append({"role": "tool", "content": "ok"})
+    second = build_prompt(agent_state, "Test system prompt", tool_definitions, "Advisory")
+    
+    # Assert
+    assert agent_state.system_prompt_prefix is prefix
+    assert "### write" in prefix
+    assert "Advisory" not in prefix
+    assert second[0] == first[0]
+    assert second[1] == {"role": "tool", "content": "ok"}
+
+
+def test_build_prompt_rebuilds_system_prefix_when_inputs_change():
+    """Test that the cached prefix is rebuilt for new tools or new reflections."""
+    # Setup
+    agent_state = AgentState(
+        run_id="test-run",
+        cycle_number=2,
+        model_name="llama3:latest",
+        message_history=[],
+        reflection_history=["Previous reflection"]
+    )
+    write_tool = [{"type": "function", "function": {"name": "write", "description": "Write"}}]
+    read_tool = [{"type": "function", "function": {"name": "read", "description": "Read"}}]
+    
+    # Execute
+    build_prompt(agent_state, "Test system prompt", write_tool)
+    with_read_tool = build_prompt(agent_state, "Test system prompt", read_tool)[0]["content"]
+    agent_state.reflection_history.append("Newer reflection")
+    with_new_reflection = build_prompt(agent_state, "Test system prompt", read_tool)[0]["content"]
+    
+    # Assert
+    assert "### read" in with_read_tool
+    assert "### write" not in with_read_tool
+    assert "Newer reflection" in with_new_reflection
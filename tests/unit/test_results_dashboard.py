@@ -10,17 +10,21 @@ Part of: Story 2.7 - Display Raw Conversation Log on Dashboard
 Part of: Story 2.8 - Implement Interactive Charts on Dashboard
 """
 import json
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 import pandas as pd
+from tinydb import TinyDB
 
+from contreact_ollama.logging.jsonl_logger import iter_log_lines
 from contreact_ollama.ui_utils import (
     get_log_files,
     load_log_file,
     extract_metrics_from_dataframe,
     calculate_summary_metrics,
-    load_pei_assessment
+    load_pei_assessment,
+    load_memory_entries
 )
 
 
@@ -94,6 +98,22 @@ class TestGetLogFiles:
         assert result[0] == "new.jsonl"
         assert result[1] == "old.jsonl"
 
+    
+    def test_lists_files_added_after_first_scan(self, tmp_path, monkeypatch):
+        """Test that a cached listing is refreshed when a new log appears."""
+        
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        monkeypatch.chdir(tmp_path)
+        
+        (logs_dir / "run1.jsonl").touch()
+        assert get_log_files() == ["run1.jsonl"]
+        
+        (logs_dir / "run2.jsonl").touch()
+        os.utime(logs_dir, ns=(0, logs_dir.stat().st_mtime_ns + 1))
+        
+        assert sorted(get_log_files()) == ["run1.jsonl", "run2.jsonl"]
+
 
 class TestLoadLogFile:
     """Test suite for load_log_file function."""
@@ -204,6 +224,30 @@ class TestLoadLogFile:
                 df = load_log_file("test.jsonl")
         
         assert df is None
+    
+    def test_reuses_parsed_log_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that unchanged logs are served from cache and rewritten logs are re-read."""
+        
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        monkeypatch.chdir(tmp_path)
+        
+        log_file = logs_dir / "cached.jsonl"
+        log_file.write_text('{"event_type": "CYCLE_START"}\n')
+        
+        with patch('contreact_ollama.ui_utils.iter_log_lines', wraps=iter_log_lines) as spy:
+            first = load_log_file("cached.jsonl")
+            second = load_log_file("cached.jsonl")
+            
+            assert spy.call_count == 1
+            assert second.equals(first)
+            
+            log_file.write_text('{"event_type": "CYCLE_START"}\n{"event_type": "CYCLE_END"}\n')
+            os.utime(log_file, ns=(0, log_file.stat().st_mtime_ns + 1))
+            third = load_log_file("cached.jsonl")
+        
+        assert spy.call_count == 2
+        assert len(third) == 2
 
 
 class TestDataFrameStructure:
@@ -1428,19 +1472,44 @@ class TestInteractiveChartsDataAccuracy:
         assert len(chart_cycles) == 4
 
 
-def test_load_memory_entries_success():
+def test_load_memory_entries_success(tmp_path):
     """Test loading memory entries from database."""
-    # TODO: Implement test with populated test database
-    pass
+    db_path = tmp_path / "memory.db"
+    db = TinyDB(db_path)
+    db.insert({'run_id': 'exp-001', 'key': 'goal', 'value': 'Explore'})
+    db.insert({'run_id': 'exp-002', 'key': 'other', 'value': 'Ignored'})
+    db.close()
+    
+    entries = load_memory_entries("exp-001", db_path=str(db_path))
+    
+    assert entries == [{'key': 'goal', 'value': 'Explore'}]
 
 
-def test_load_memory_entries_missing_db():
+def test_load_memory_entries_missing_db(tmp_path):
     """Test handling of missing memory database."""
-    # TODO: Test when file doesn't exist
-    pass
+    assert load_memory_entries("exp-001", db_path=str(tmp_path / "missing.db")) is None
 
 
-def test_load_memory_entries_empty_run():
+def test_load_memory_entries_empty_run(tmp_path):
     """Test loading memory for run with no entries."""
-    # TODO: Test when run_id has no entries
-    pass
+    db_path = tmp_path / "memory.db"
+    db = TinyDB(db_path)
+    db.insert({'run_id': 'exp-002', 'key': 'other', 'value': 'Ignored'})
+    db.close()
+    
+    assert load_memory_entries("exp-001", db_path=str(db_path)) == []
+
+
+def test_load_memory_entries_rereads_changed_db(tmp_path):
+    """Test that cached entries are refreshed once the database file changes."""
+    db_path = tmp_path / "memory.db"
+    db = TinyDB(db_path)
+    db.insert({'run_id': 'exp-001', 'key': 'first', 'value': 'One'})
+    
+    assert len(load_memory_entries("exp-001", db_path=str(db_path))) == 1
+    
+    db.insert({'run_id': 'exp-001', 'key': 'second', 'value': 'Two'})
+    db.close()
+    os.utime(db_path, ns=(0, db_path.stat().st_mtime_ns + 1))
+    
+    assert len(load_memory_entries("exp-001", db_path=str(db_path))) == 2
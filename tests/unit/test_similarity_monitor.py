@@ -27,6 +27,22 @@ def test_check_similarity_no_history_returns_none():
     assert feedback is None
 
 
+def test_check_similarity_below_min_history_returns_none():
+    """Test that check_similarity skips the check until min_history embeddings exist."""
+    mock_service = Mock()
+    monitor = SimilarityMonitor(embedding_service=mock_service, min_history=3)
+    
+    emb = np.random.rand(384)
+    emb = emb / np.linalg.norm(emb)
+    
+    monitor.add(emb)
+    monitor.add(emb)
+    assert monitor.check_similarity(new_reflection_embedding=emb) is None
+    
+    monitor.add(emb)
+    assert monitor.check_similarity(new_reflection_embedding=emb) is not None
+
+
 def test_check_similarity_high_threshold_returns_advisory():
     """Test that check_similarity returns high similarity advisory when similarity > 0.8."""
     mock_service = Mock()
@@ -106,6 +122,28 @@ def test_check_similarity_below_threshold_returns_none():
     assert feedback is None or "moderate" in feedback.lower()
 
 
+def test_check_similarity_normalizes_non_unit_inputs():
+    """Test that scaled embeddings give the same advisory tier as their unit versions."""
+    mock_service = Mock()
+    monitor = SimilarityMonitor(embedding_service=mock_service)
+    
+    # Cosine similarity 0.6 (no advisory), but a raw dot product of 0.6 * 5 * 4 = 12
+    emb1 = np.zeros(384)
+    emb1[0] = 1.0
+    emb2 = np.zeros(384)
+    emb2[0], emb2[1] = 0.6, 0.8
+    
+    feedback = monitor.check_similarity(
+        new_reflection_embedding=emb2 * 5,
+        historical_embeddings=[emb1 * 4]
+    )
+    assert feedback is None
+    
+    monitor.add(emb1 * 4)
+    assert monitor.check_similarity(new_reflection_embedding=emb2 * 5) is None
+    assert monitor.check_similarities_batch(np.stack([emb2 * 5])) == [None]
+
+
 def test_check_similarity_multiple_historical_uses_max():
     """Test that check_similarity uses maximum similarity when multiple historical embeddings exist."""
     mock_service = Mock()
@@ -152,3 +190,136 @@ def test_check_similarity_with_real_embedding_service():
     
     # Very similar texts should trigger advisory
     assert feedback is not None
+
+
+def test_add_accumulates_history_used_by_default():
+    """Test that check_similarity compares against embeddings stored via add() when no history is passed."""
+    mock_service = Mock()
+    monitor = SimilarityMonitor(embedding_service=mock_service)
+    
+    np.random.seed(42)
+    emb = np.random.rand(384)
+    emb = emb / np.linalg.norm(emb)
+    
+    assert monitor.check_similarity(new_reflection_embedding=emb) is None
+    
+    monitor.add(emb)
+    feedback = monitor.check_similarity(new_reflection_embedding=emb)
+    
+    assert feedback is not None
+    assert "high similarity" in feedback.lower()
+
+
+def test_add_grows_history_buffer_beyond_initial_capacity():
+    """Test that the history buffer grows and preserves all stored rows."""
+    mock_service = Mock()
+    monitor = SimilarityMonitor(embedding_service=mock_service)
+    
+    np.random.seed(0)
+    embeddings = np.random.rand(200, 384)
+    embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    for emb in embeddings:
+        monitor.add(emb)
+    
+    history = monitor.history
+    assert history.shape == (200, 384)
+    assert history.dtype == np.float32
+    np.testing.assert_allclose(history, embeddings, rtol=1e-5)
+
+
+def test_check_similarity_scans_history_across_blocks():
+    """Test that a high-similarity match is found beyond the first scan block."""
+    mock_service = Mock()
+    monitor = SimilarityMonitor(embedding_service=mock_service)
+    
+    # 600 copies of one direction, then the near-duplicate target at the end
+    base = np.zeros(384, dtype=np.float32)
+    base[0] = 1.0
+    target = np.zeros(384, dtype=np.float32)
+    target[1] = 1.0
+    for _ in range(600):
+        monitor.add(base)
+    monitor.add(target)
+    
+    feedback = monitor.check_similarity(new_reflection_embedding=target)
+    
+    assert feedback is not None
+    assert "high similarity" in feedback.lower()
+
+
+def test_numba_kernel_matches_numpy_scan():
+    """Test that the Numba kernel and the NumPy fallback agree on the maximum similarity."""
+    pytest.importorskip("numba")
+    from contreact_ollama.analysis import similarity_monitor
+    
+    # Zero-mean vectors keep similarities low so neither scan exits early
+    np.random.seed(3)
+    history = (np.random.rand(300, 384) - 0.5).astype(np.float32)
+    history /= np.linalg.norm(history, axis=1, keepdims=True)
+    new = (np.random.rand(384) - 0.5).astype(np.float32)
+    new /= np.linalg.norm(new)
+    
+    jit_max = similarity_monitor._max_similarity_jit(history, new, 0.8)
+    numpy_max = similarity_monitor._max_similarity_numpy(history, new)
+    
+    assert np.isclose(jit_max, numpy_max, atol=1e-5)
+
+
+def test_check_similarities_batch_matches_single_checks():
+    """Test that batch checking returns the same advisories as per-embedding checks."""
+    mock_service = Mock()
+    monitor = SimilarityMonitor(embedding_service=mock_service)
+    rng = np.random.default_rng(3)
+    
+    for _ in range(10):
+        emb = rng.standard_normal(384)
+        monitor.add(emb / np.linalg.norm(emb))
+    
+    # One near-duplicate of history, one unrelated vector
+    near = monitor.history[4] + rng.standard_normal(384) * 0.01
+    far = rng.standard_normal(384)
+    candidates = np.stack([near / np.linalg.norm(near), far / np.linalg.norm(far)])
+    
+    batch = monitor.check_similarities_batch(candidates)
+    
+    assert batch == [monitor.check_similarity(candidate) for candidate in candidates]
+    assert "high similarity" in batch[0]
+    assert batch[1] is None
+
+
+def test_check_similarities_batch_without_history_returns_nones():
+    """Test that batch checking returns one None per candidate when history is empty."""
+    monitor = SimilarityMonitor(embedding_service=Mock())
+    
+    assert monitor.check_similarities_batch(np.ones((3, 384), dtype=np.float32)) == [None, None, None]
+
+
+def test_ann_index_matches_exact_scan(monkeypatch):
+    """Test that the hnswlib index finds the same advisory as the exact scan."""
+    pytest.importorskip("hnswlib")
+    from contreact_ollama.analysis import similarity_monitor
+    monkeypatch.setattr(similarity_monitor, "_ANN_MIN_HISTORY", 100)
+    
+    rng = np.random.default_rng(5)
+    history = (rng.random((300, 384)) - 0.5).astype(np.float32)
+    history /= np.linalg.norm(history, axis=1, keepdims=True)
+    
+    monitor = SimilarityMonitor(embedding_service=Mock())
+    for embedding in history:
+        monitor.add(embedding)
+    
+    assert monitor._index is not None
+    assert monitor.check_similarity(history[250]) == monitor.check_similarity(
+        history[250], historical_embeddings=list(history)
+    )
+    assert "high similarity" in monitor.check_similarity(history[250]).lower()
+
+
+def test_history_is_stored_as_float32():
+    """Test that embeddings are stored as float32 whatever dtype they arrive in."""
+    monitor = SimilarityMonitor(embedding_service=Mock())
+    monitor.add(np.ones(384, dtype=np.float64) / np.sqrt(384))
+    monitor.add(np.ones(384, dtype=np.float16) / np.float16(np.sqrt(384)))
+    
+    assert monitor.history.dtype == np.float32
+    assert monitor.history.flags['C_CONTIGUOUS']
@@ -41,6 +41,22 @@ def test_telegram_channel_initialization_connection_check_fails():
         
         with pytest.raises(ConnectionError, match="connection check failed"):
             channel = TelegramChannel([123456789], 5)
+        
+        instance.close.assert_called_once()
+
+
+def test_telegram_channel_initialization_connection_check_raises():
+    """Test TelegramChannel closes the service if the connection check raises."""
+    with patch('contreact_ollama.communication.telegram_channel.TelegramOperatorChannel') as mock:
+        instance = MagicMock()
+        instance.check_connection.side_effect = RuntimeError("event loop failed")
+        instance.close.side_effect = RuntimeError("close failed")
+        mock.return_value = instance
+        
+        with pytest.raises(ConnectionError, match="event loop failed"):
+            channel = TelegramChannel([123456789], 5)
+        
+        instance.close.assert_called_once()
 
 
 def test_telegram_channel_initialization_bot_token_missing():
@@ -118,3 +134,12 @@ def test_send_and_wait_handles_long_response(mock_telegram_service):
     
     assert response == long_response
     assert len(response) == 1000
+
+
+def test_close_releases_telegram_service(mock_telegram_service):
+    """Test closing the channel closes the underlying Telegram service."""
+    channel = TelegramChannel([123456789], 5)
+    
+    channel.close()
+    
+    mock_telegram_service.return_value.close.assert_called_once()
@@ -5,32 +5,96 @@ Tests cover bot initialization, message sending, response waiting,
 connection health checks, and error handling scenarios.
 """
 
+import asyncio
 import os
-import time
-from unittest.mock import Mock, MagicMock, patch, PropertyMock
+import threading
+from typing import Iterator
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-from telegram.error import NetworkError, TelegramError
+from telegram.error import BadRequest, NetworkError, TelegramError
 
-from contreact_ollama.communication.telegram_service import TelegramOperatorChannel
+from contreact_ollama.communication.telegram_service import (
+    POLLING_ERROR_LIMIT,
+    SEND_ATTEMPTS,
+    TelegramOperatorChannel,
+)
+
+
+def _make_update(user_id: int, text: str) -> Mock:
+    """Build a minimal Telegram update carrying a text message."""
+    update = Mock()
+    update.message.text = text
+    update.message.from_user.id = user_id
+    return update
+
+
+def _deliver(channel: TelegramOperatorChannel, update: Mock) -> None:
+    """Run the channel's message handler on its event loop, as the application would."""
+    channel._run_async(lambda: channel._handle_message(update, None))
+
+
+@pytest.fixture
+def mock_application() -> Iterator[MagicMock]:
+    """Patch the Telegram Application builder to return an offline application."""
+    application = MagicMock()
+    application.initialize = AsyncMock()
+    application.start = AsyncMock()
+    application.stop = AsyncMock()
+    application.shutdown = AsyncMock()
+    application.running = True
+    application.updater.start_polling = AsyncMock()
+    application.updater.stop = AsyncMock()
+    application.updater.running = True
+    application.bot.get_me = AsyncMock(return_value=Mock(first_name="TestBot", id=123))
+    application.bot.send_message = AsyncMock()
+
+    with patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"}), patch(
+        "contreact_ollama.communication.telegram_service.Application"
+    ) as mock_application_class:
+        builder = mock_application_class.builder.return_value
+        builder.token.return_value = builder
+        builder.request.return_value = builder
+        builder.get_updates_request.return_value = builder
+        builder.build.return_value = application
+        yield application
+
+
+@pytest.fixture(autouse=True)
+def no_send_backoff() -> Iterator[None]:
+    """Retry failed sends without waiting."""
+    with patch("contreact_ollama.communication.telegram_service.SEND_RETRY_BACKOFF_SECONDS", 0):
+        yield
+
+
+@pytest.fixture
+def make_channel(mock_application: MagicMock) -> Iterator:
+    """Create channels bound to the mocked application and close them afterwards."""
+    channels = []
+
+    def _make(authorized_users, timeout_minutes: int = 5) -> TelegramOperatorChannel:
+        channel = TelegramOperatorChannel(authorized_users, timeout_minutes=timeout_minutes)
+        channels.append(channel)
+        return channel
+
+    yield _make
+
+    for channel in channels:
+        channel.close()
 
 
 class TestTelegramOperatorChannelInit:
     """Tests for TelegramOperatorChannel initialization."""
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_init_with_valid_token_succeeds(self, mock_bot_class: Mock) -> None:
+    def test_init_with_valid_token_succeeds(self, make_channel, mock_application: MagicMock) -> None:
         """Test TelegramOperatorChannel initialization with valid token."""
-        mock_bot_instance = Mock()
-        mock_bot_class.return_value = mock_bot_instance
-
-        channel = TelegramOperatorChannel([123456789], timeout_minutes=5)
+        channel = make_channel([123456789], timeout_minutes=5)
 
         assert channel is not None
         assert channel.authorized_users == [123456789]
         assert channel.timeout_minutes == 5
-        mock_bot_class.assert_called_once_with(token="test_token_123")
+        # Application is only started on first use
+        mock_application.initialize.assert_not_called()
 
     @patch.dict(os.environ, {}, clear=True)
     def test_init_without_token_raises_valueerror(self) -> None:
@@ -40,57 +104,57 @@ class TestTelegramOperatorChannelInit:
 
         assert "TELEGRAM_BOT_TOKEN environment variable is required" in str(exc_info.value)
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_init_with_bot_error_raises_connectionerror(self, mock_bot_class: Mock) -> None:
-        """Test initialization fails gracefully when Bot raises TelegramError."""
-        mock_bot_class.side_effect = TelegramError("Invalid token")
 
-        with pytest.raises(ConnectionError) as exc_info:
-            TelegramOperatorChannel([123456789])
+class TestHttpClient:
+    """Tests for the HTTP client configuration of the Telegram application."""
+
+    def test_application_uses_pooled_persistent_requests(self, make_channel) -> None:
+        """Test the application is built with pooled HTTPX requests for API calls and polling."""
+        with patch(
+            "contreact_ollama.communication.telegram_service.HTTPXRequest"
+        ) as mock_request_class:
+            channel = make_channel([123456789])
+            channel.check_connection()
 
-        assert "Failed to initialize Telegram bot" in str(exc_info.value)
+        assert mock_request_class.call_count == 2
+        api_kwargs = mock_request_class.call_args_list[0].kwargs
+        poll_kwargs = mock_request_class.call_args_list[1].kwargs
+        assert api_kwargs["connection_pool_size"] == 8
+        assert poll_kwargs["read_timeout"] > 30
 
 
 class TestCheckConnection:
     """Tests for connection health check."""
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_check_connection_success_returns_true(self, mock_bot_class: Mock) -> None:
+    def test_check_connection_success_returns_true(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
         """Test check_connection returns True when bot is reachable."""
-        mock_bot = Mock()
-        mock_bot.get_me.return_value = Mock(first_name="TestBot", id=123)
-        mock_bot_class.return_value = mock_bot
-
-        channel = TelegramOperatorChannel([123456789])
+        channel = make_channel([123456789])
         result = channel.check_connection()
 
         assert result is True
-        mock_bot.get_me.assert_called_once()
+        mock_application.bot.get_me.assert_awaited_once()
+        mock_application.updater.start_polling.assert_awaited_once()
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_check_connection_network_error_returns_false(self, mock_bot_class: Mock) -> None:
+    def test_check_connection_network_error_returns_false(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
         """Test check_connection returns False on NetworkError."""
-        mock_bot = Mock()
-        mock_bot.get_me.side_effect = NetworkError("Connection timeout")
-        mock_bot_class.return_value = mock_bot
+        mock_application.initialize.side_effect = NetworkError("Connection timeout")
 
-        channel = TelegramOperatorChannel([123456789])
+        channel = make_channel([123456789])
         result = channel.check_connection()
 
         assert result is False
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_check_connection_telegram_error_returns_false(self, mock_bot_class: Mock) -> None:
+    def test_check_connection_telegram_error_returns_false(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
         """Test check_connection returns False on TelegramError."""
-        mock_bot = Mock()
-        mock_bot.get_me.side_effect = TelegramError("API error")
-        mock_bot_class.return_value = mock_bot
+        mock_application.bot.get_me.side_effect = TelegramError("API error")
 
-        channel = TelegramOperatorChannel([123456789])
+        channel = make_channel([123456789])
         result = channel.check_connection()
 
         assert result is False
@@ -99,246 +163,282 @@ class TestCheckConnection:
 class TestSendMessage:
     """Tests for sending messages to Telegram."""
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_send_message_success_sends_to_all_users(self, mock_bot_class: Mock) -> None:
+    def test_send_message_success_sends_to_all_users(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
         """Test send_message successfully sends to all authorized users."""
-        mock_bot = Mock()
-        mock_bot_class.return_value = mock_bot
-
-        channel = TelegramOperatorChannel([123456789, 987654321])
+        channel = make_channel([123456789, 987654321])
         channel.send_message("Test message", run_id="exp-001", cycle_number=5)
 
-        assert mock_bot.send_message.call_count == 2
-        calls = mock_bot.send_message.call_args_list
-        assert calls[0][1]["chat_id"] == 123456789
-        assert calls[1][1]["chat_id"] == 987654321
-        assert "Test message" in calls[0][1]["text"]
-        assert "exp-001" in calls[0][1]["text"]
-        assert "Cycle: 5" in calls[0][1]["text"]
+        send = mock_application.bot.send_message
+        assert send.await_count == 2
+        chat_ids = sorted(call.kwargs["chat_id"] for call in send.await_args_list)
+        assert chat_ids == [123456789, 987654321]
+        text = send.await_args_list[0].kwargs["text"]
+        assert "Test message" in text
+        assert "exp-001" in text
+        assert "Cycle: 5" in text
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
     def test_send_message_network_error_raises_connectionerror(
-        self, mock_bot_class: Mock
+        self, make_channel, mock_application: MagicMock
     ) -> None:
         """Test send_message raises ConnectionError on NetworkError."""
-        mock_bot = Mock()
-        mock_bot.send_message.side_effect = NetworkError("Connection lost")
-        mock_bot_class.return_value = mock_bot
+        mock_application.bot.send_message.side_effect = NetworkError("Connection lost")
 
-        channel = TelegramOperatorChannel([123456789])
+        channel = make_channel([123456789])
 
         with pytest.raises(ConnectionError) as exc_info:
             channel.send_message("Test", run_id="exp-001", cycle_number=1)
 
         assert "Failed to send message to any authorized user" in str(exc_info.value)
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
     def test_send_message_telegram_error_raises_connectionerror(
-        self, mock_bot_class: Mock
+        self, make_channel, mock_application: MagicMock
     ) -> None:
         """Test send_message raises ConnectionError on TelegramError."""
-        mock_bot = Mock()
-        mock_bot.send_message.side_effect = TelegramError("API error")
-        mock_bot_class.return_value = mock_bot
+        mock_application.bot.send_message.side_effect = TelegramError("API error")
 
-        channel = TelegramOperatorChannel([123456789])
+        channel = make_channel([123456789])
 
         with pytest.raises(ConnectionError) as exc_info:
             channel.send_message("Test", run_id="exp-001", cycle_number=1)
 
         assert "Failed to send message to any authorized user" in str(exc_info.value)
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_send_message_no_authorized_users_raises_runtimeerror(
-        self, mock_bot_class: Mock
-    ) -> None:
+    def test_send_message_no_authorized_users_raises_runtimeerror(self, make_channel) -> None:
         """Test send_message raises RuntimeError when no authorized users."""
-        mock_bot = Mock()
-        mock_bot_class.return_value = mock_bot
-
-        channel = TelegramOperatorChannel([])
+        channel = make_channel([])
 
         with pytest.raises(RuntimeError) as exc_info:
             channel.send_message("Test", run_id="exp-001", cycle_number=1)
 
         assert "No authorized users configured" in str(exc_info.value)
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_send_message_partial_success_succeeds(self, mock_bot_class: Mock) -> None:
+    def test_send_message_sends_to_users_concurrently(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
+        """Test send_message dispatches all sends before any of them completes."""
+        started = []
+        release = asyncio.Event()
+
+        async def send_side_effect(chat_id: int, text: str) -> None:
+            started.append(chat_id)
+            if len(started) == 2:
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+
+        mock_application.bot.send_message.side_effect = send_side_effect
+
+        channel = make_channel([123456789, 987654321])
+        channel.send_message("Test", run_id="exp-001", cycle_number=1)
+
+        assert sorted(started) == [123456789, 987654321]
+
+    def test_send_message_partial_success_succeeds(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
         """Test send_message succeeds if at least one user receives message."""
-        mock_bot = Mock()
 
-        def send_side_effect(chat_id: int, text: str) -> None:
-            if chat_id == 123456789:
-                return  # Success
-            else:
+        async def send_side_effect(chat_id: int, text: str) -> None:
+            if chat_id != 123456789:
                 raise NetworkError("Failed")
 
-        mock_bot.send_message.side_effect = send_side_effect
-        mock_bot_class.return_value = mock_bot
+        mock_application.bot.send_message.side_effect = send_side_effect
 
-        channel = TelegramOperatorChannel([123456789, 987654321])
+        channel = make_channel([123456789, 987654321])
         # Should not raise since one message succeeded
         channel.send_message("Test", run_id="exp-001", cycle_number=1)
 
-        assert mock_bot.send_message.call_count == 2
+        # One send to the working user, every attempt to the failing one
+        assert mock_application.bot.send_message.await_count == 1 + SEND_ATTEMPTS
 
+    def test_send_message_retries_transient_network_error(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
+        """Test send_message retries a send that fails with a network error."""
+        mock_application.bot.send_message.side_effect = [NetworkError("Timed out"), None]
 
-class TestWaitForResponse:
-    """Tests for waiting for operator responses."""
+        channel = make_channel([123456789])
+        channel.send_message("Test", run_id="exp-001", cycle_number=1)
+
+        assert mock_application.bot.send_message.await_count == 2
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_wait_for_response_authorized_user_returns_message(
-        self, mock_bot_class: Mock
+    def test_send_message_does_not_retry_api_error(
+        self, make_channel, mock_application: MagicMock
     ) -> None:
-        """Test wait_for_response returns message from authorized user."""
-        mock_bot = Mock()
-        mock_update = Mock()
-        mock_update.update_id = 1
-        mock_update.message.text = "Yes, proceed"
-        mock_update.message.from_user.id = 123456789
+        """Test send_message gives up immediately on a non-network Telegram error."""
+        mock_application.bot.send_message.side_effect = TelegramError("Forbidden")
 
-        mock_bot.get_updates.return_value = [mock_update]
-        mock_bot_class.return_value = mock_bot
+        channel = make_channel([123456789])
 
-        channel = TelegramOperatorChannel([123456789], timeout_minutes=1)
-        response = channel.wait_for_response(timeout_minutes=1)
+        with pytest.raises(ConnectionError):
+            channel.send_message("Test", run_id="exp-001", cycle_number=1)
 
-        assert response == "Yes, proceed"
+        assert mock_application.bot.send_message.await_count == 1
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_wait_for_response_unauthorized_user_rejects_message(
-        self, mock_bot_class: Mock
+    def test_send_message_does_not_retry_bad_request(
+        self, make_channel, mock_application: MagicMock
     ) -> None:
-        """Test wait_for_response rejects messages from unauthorized users."""
-        mock_bot = Mock()
+        """Test send_message gives up immediately on BadRequest despite it subclassing NetworkError."""
+        mock_application.bot.send_message.side_effect = BadRequest("Chat not found")
+
+        channel = make_channel([123456789])
+
+        with pytest.raises(ConnectionError) as exc_info:
+            channel.send_message("Test", run_id="exp-001", cycle_number=1)
+
+        assert mock_application.bot.send_message.await_count == 1
+        assert "Telegram API error" in str(exc_info.value)
+
 
-        # First update from unauthorized user
-        mock_update1 = Mock()
-        mock_update1.update_id = 1
-        mock_update1.message.text = "Unauthorized message"
-        mock_update1.message.from_user.id = 999999999
+class TestWaitForResponse:
+    """Tests for waiting for operator responses."""
+
+    def test_wait_for_response_authorized_user_returns_message(self, make_channel) -> None:
+        """Test wait_for_response returns message from authorized user."""
+        channel = make_channel([123456789], timeout_minutes=1)
+        channel.send_message("Continue?", run_id="exp-001", cycle_number=1)
+        _deliver(channel, _make_update(123456789, "Yes, proceed"))
+
+        response = channel.wait_for_response(timeout_minutes=1)
 
-        # Second update from authorized user
-        mock_update2 = Mock()
-        mock_update2.update_id = 2
-        mock_update2.message.text = "Authorized message"
-        mock_update2.message.from_user.id = 123456789
+        assert response == "Yes, proceed"
 
-        mock_bot.get_updates.side_effect = [[mock_update1], [mock_update2]]
-        mock_bot_class.return_value = mock_bot
+    def test_wait_for_response_unauthorized_user_rejects_message(self, make_channel) -> None:
+        """Test wait_for_response rejects messages from unauthorized users."""
+        channel = make_channel([123456789], timeout_minutes=1)
+        channel.send_message("Continue?", run_id="exp-001", cycle_number=1)
+        _deliver(channel, _make_update(999999999, "Unauthorized message"))
+        _deliver(channel, _make_update(123456789, "Authorized message"))
 
-        channel = TelegramOperatorChannel([123456789], timeout_minutes=1)
         response = channel.wait_for_response(timeout_minutes=1)
 
         # Should return authorized message, not unauthorized one
         assert response == "Authorized message"
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    @patch("contreact_ollama.communication.telegram_service.time")
-    def test_wait_for_response_timeout_raises_timeouterror(
-        self, mock_time: Mock, mock_bot_class: Mock
-    ) -> None:
+    def test_wait_for_response_receives_reply_while_waiting(self, make_channel) -> None:
+        """Test wait_for_response returns a reply that arrives after waiting began."""
+        channel = make_channel([123456789], timeout_minutes=1)
+        channel.send_message("Continue?", run_id="exp-001", cycle_number=1)
+        timer = threading.Timer(0.05, _deliver, args=(channel, _make_update(123456789, "Late")))
+        timer.start()
+
+        try:
+            response = channel.wait_for_response(timeout_minutes=1)
+        finally:
+            timer.join()
+
+        assert response == "Late"
+
+    def test_wait_for_response_forever_waits_without_timeout(self, make_channel) -> None:
+        """Test timeout_minutes=-1 waits with no deadline until a reply arrives."""
+        channel = make_channel([123456789], timeout_minutes=-1)
+        channel.send_message("Continue?", run_id="exp-001", cycle_number=1)
+        timer = threading.Timer(0.05, _deliver, args=(channel, _make_update(123456789, "Later")))
+        timer.start()
+
+        try:
+            with patch(
+                "contreact_ollama.communication.telegram_service.asyncio.wait_for",
+                wraps=asyncio.wait_for,
+            ) as mock_wait_for:
+                response = channel.wait_for_response()
+        finally:
+            timer.join()
+
+        assert response == "Later"
+        assert mock_wait_for.call_args.kwargs["timeout"] is None
+
+    def test_wait_for_response_timeout_raises_timeouterror(self, make_channel) -> None:
         """Test wait_for_response raises TimeoutError after timeout expires."""
-        mock_bot = Mock()
-        mock_bot.get_updates.return_value = []  # No updates
-        mock_bot_class.return_value = mock_bot
-
-        # Mock time to simulate timeout
-        mock_time.time.side_effect = [0, 0, 0, 0, 400]  # Exceeds 5 minutes (300 seconds)
-        mock_time.sleep.return_value = None
-
-        channel = TelegramOperatorChannel([123456789], timeout_minutes=5)
+        channel = make_channel([123456789], timeout_minutes=5)
 
         with pytest.raises(TimeoutError) as exc_info:
-            channel.wait_for_response(timeout_minutes=5)
-
-        assert "No response received within 5 minutes" in str(exc_info.value)
+            channel.wait_for_response(timeout_minutes=0.001)
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_wait_for_response_network_error_raises_connectionerror(
-        self, mock_bot_class: Mock
-    ) -> None:
-        """Test wait_for_response raises ConnectionError on NetworkError."""
-        mock_bot = Mock()
-        mock_bot.get_updates.side_effect = NetworkError("Connection lost")
-        mock_bot_class.return_value = mock_bot
+        assert "No response received within 0.001 minutes" in str(exc_info.value)
 
-        channel = TelegramOperatorChannel([123456789], timeout_minutes=1)
+    def test_wait_for_response_network_error_raises_connectionerror(self, make_channel) -> None:
+        """Test wait_for_response raises ConnectionError once network errors reach the limit."""
+        channel = make_channel([123456789], timeout_minutes=1)
+        channel.send_message("Continue?", run_id="exp-001", cycle_number=1)
+        for _ in range(POLLING_ERROR_LIMIT):
+            channel._loop.call_soon_threadsafe(
+                channel._handle_polling_error, NetworkError("Connection lost")
+            )
 
         with pytest.raises(ConnectionError) as exc_info:
             channel.wait_for_response(timeout_minutes=1)
 
         assert "Telegram connection lost" in str(exc_info.value)
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_wait_for_response_telegram_error_raises_connectionerror(
-        self, mock_bot_class: Mock
-    ) -> None:
-        """Test wait_for_response raises ConnectionError on TelegramError."""
-        mock_bot = Mock()
-        mock_bot.get_updates.side_effect = TelegramError("API error")
-        mock_bot_class.return_value = mock_bot
+    def test_wait_for_response_survives_transient_network_error(self, make_channel) -> None:
+        """Test a single polling NetworkError leaves the wait pending for the reply."""
+        channel = make_channel([123456789], timeout_minutes=1)
+        channel.send_message("Continue?", run_id="exp-001", cycle_number=1)
 
-        channel = TelegramOperatorChannel([123456789], timeout_minutes=1)
+        async def _report_blip() -> None:
+            channel._handle_polling_error(NetworkError("Blip"))
+
+        channel._run_async(_report_blip)
+
+        assert not channel._response_future.done()
+
+        _deliver(channel, _make_update(123456789, "Still here"))
+        assert channel.wait_for_response(timeout_minutes=1) == "Still here"
+
+    def test_wait_for_response_telegram_error_raises_connectionerror(self, make_channel) -> None:
+        """Test wait_for_response raises ConnectionError on TelegramError."""
+        channel = make_channel([123456789], timeout_minutes=1)
+        channel.send_message("Continue?", run_id="exp-001", cycle_number=1)
+        channel._loop.call_soon_threadsafe(channel._handle_polling_error, TelegramError("API error"))
 
         with pytest.raises(ConnectionError) as exc_info:
             channel.wait_for_response(timeout_minutes=1)
 
         assert "Telegram API error" in str(exc_info.value)
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_wait_for_response_uses_instance_timeout_when_none(
-        self, mock_bot_class: Mock
-    ) -> None:
+    def test_wait_for_response_uses_instance_timeout_when_none(self, make_channel) -> None:
         """Test wait_for_response uses instance timeout when parameter is None."""
-        mock_bot = Mock()
-        mock_update = Mock()
-        mock_update.update_id = 1
-        mock_update.message.text = "Response"
-        mock_update.message.from_user.id = 123456789
+        channel = make_channel([123456789], timeout_minutes=0.001)
+
+        with pytest.raises(TimeoutError) as exc_info:
+            channel.wait_for_response(timeout_minutes=None)
+
+        assert "0.001 minutes" in str(exc_info.value)
+
 
-        mock_bot.get_updates.return_value = [mock_update]
-        mock_bot_class.return_value = mock_bot
+class TestClose:
+    """Tests for shutting down the channel."""
 
-        channel = TelegramOperatorChannel([123456789], timeout_minutes=10)
-        response = channel.wait_for_response(timeout_minutes=None)
+    def test_close_stops_application_and_is_idempotent(
+        self, make_channel, mock_application: MagicMock
+    ) -> None:
+        """Test close stops polling and the application, and may be called twice."""
+        channel = make_channel([123456789])
+        channel.check_connection()
+
+        channel.close()
+        channel.close()
 
-        assert response == "Response"
+        mock_application.updater.stop.assert_awaited_once()
+        mock_application.stop.assert_awaited_once()
+        mock_application.shutdown.assert_awaited_once()
 
 
 class TestValidateUser:
     """Tests for user authorization validation."""
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_validate_user_authorized_returns_true(self, mock_bot_class: Mock) -> None:
+    def test_validate_user_authorized_returns_true(self, make_channel) -> None:
         """Test _validate_user returns True for authorized user."""
-        mock_bot_class.return_value = Mock()
-
-        channel = TelegramOperatorChannel([123456789, 987654321])
+        channel = make_channel([123456789, 987654321])
         result = channel._validate_user(123456789)
 
         assert result is True
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_validate_user_unauthorized_returns_false(self, mock_bot_class: Mock) -> None:
+    def test_validate_user_unauthorized_returns_false(self, make_channel) -> None:
         """Test _validate_user returns False for unauthorized user."""
-        mock_bot_class.return_value = Mock()
-
-        channel = TelegramOperatorChannel([123456789])
+        channel = make_channel([123456789])
         result = channel._validate_user(999999999)
 
         assert result is False
@@ -347,13 +447,9 @@ class TestValidateUser:
 class TestFormatMessage:
     """Tests for message formatting."""
 
-    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test_token_123"})
-    @patch("contreact_ollama.communication.telegram_service.Bot")
-    def test_format_message_includes_context(self, mock_bot_class: Mock) -> None:
+    def test_format_message_includes_context(self, make_channel) -> None:
         """Test _format_message includes run_id and cycle_number."""
-        mock_bot_class.return_value = Mock()
-
-        channel = TelegramOperatorChannel([123456789])
+        channel = make_channel([123456789])
         formatted = channel._format_message("Test message", "exp-001", 5)
 
         assert "exp-001" in formatted